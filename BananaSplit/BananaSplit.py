@@ -1,52 +1,72 @@
 # Copyright (c) 2023 jarrrgh.
 # This tool is released under the terms of the AGPLv3 or higher.
 
+from BananaSplit.ZeesawConvexHullDecorator import ZeesawConvexHullDecorator, releaseConvexHullDecorator
 from BananaSplit.ZeesawLinkDecorator import ZeesawLinkDecorator
+from BananaSplit.ZeesawLinkMetadata import clearLinkMetadata, readLinkMetadata
+from BananaSplit.ZeesawLinkRegistry import ZeesawLinkRegistry
 from BananaSplit.ZeesawLinkNode import ZeesawLinkNode
+from BananaSplit.ZeesawProfiler import ZeesawProfiler
 from BananaSplit.SetTransformationOperation import SetTransformationOperation
+from BananaSplit.ZeesawTraceRecorder import ZeesawTraceRecorder
+from BananaSplit.ZeesawTransform import (
+    localTransformation,
+    transformationKey,
+    transformationKeys,
+    zeesawHullPoints,
+    zeesawTransformation,
+)
+from BananaSplit.ZeesawUpdateScheduler import ZeesawUpdateScheduler
 from cura.CuraApplication import CuraApplication
 from cura.Scene import ZOffsetDecorator
-from math import pi
-from typing import Optional, Tuple
+from cura.Scene.ConvexHullDecorator import ConvexHullDecorator
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from UM.Application import Application
 from UM.Event import Event
 from UM.Logger import Logger
+from UM.Math.AxisAlignedBox import AxisAlignedBox
 from UM.Math.Matrix import Matrix
-from UM.Math.Quaternion import Quaternion
-from UM.Math.Vector import Vector
 from UM.Message import Message
 from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
 from UM.Operations.GroupedOperation import GroupedOperation
-from UM.Operations.RotateOperation import RotateOperation
-from UM.Operations.TranslateOperation import TranslateOperation
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
 from UM.Scene.SceneNode import SceneNode
 from UM.Scene.SceneNodeSettings import SceneNodeSettings
 from UM.Scene.Selection import Selection
+from UM.Signal import CompressTechnique, postponeSignals
 from UM.Tool import Tool
 from UM.Version import Version
 
 import os
-import copy
 import numpy
+import uuid
+import weakref
+
+# Features that aren't needed to start Cura are imported on first use
+if TYPE_CHECKING:
+    from BananaSplit.OccupancyGrid import OccupancyGrid
+    from BananaSplit.ZeesawContour import ZeesawContour
+    from BananaSplit.ZeesawContourNode import ZeesawContourNode
+    from BananaSplit.ZeesawCutter import ZeesawCutter
+    from BananaSplit.ZeesawLevelOfDetail import ZeesawLevelOfDetail
 
 QT_VERSION = Version("6")
 try:
     from PyQt6.QtCore import Qt, QT_VERSION_STR
-    from PyQt6.QtCore import QTimer
 
     QT_VERSION = Version(QT_VERSION_STR)
 except ImportError:
     from PyQt5.QtCore import Qt, QT_VERSION_STR
-    from PyQt5.QtCore import QTimer
 
     QT_VERSION = Version(QT_VERSION_STR)
 
-APP_VERSION = Application.getInstance().getVersion()
-# Logger.debug("App version: {}".format(APP_VERSION))
 # Logger.debug("Qt version: {}".format(QT_VERSION))
 
 
 class BananaSplit(Tool):
+    # Free space in millimeters kept around a new twin when looking for a spot for it
+    TWIN_SPACING = 2.0
+
     def __init__(self):
         super().__init__()
 
@@ -56,45 +76,114 @@ class BananaSplit(Tool):
         else:
             self._shortcut_key = Qt.Key.Key_B
 
+        # Cura 5.2.0 added a setting for keeping nodes from dropping down to the build plate
+        self._auto_drop_down_setting = Application.getInstance().getVersion() >= Version("5.2.0")
+
         # Little indicator to point out linked nodes
         self._clippy = ZeesawLinkNode()
 
+        # Outline of the cut at the build plate before splitting, and its cross-section. Created when
+        # the tool is first activated.
+        self._contour_node = None  # type: Optional[ZeesawContourNode]
+        self._contour = None  # type: Optional[ZeesawContour]
+        self._cut_area = 0.0
+        self._cut_perimeter = 0.0
+
+        # Index of linked nodes by their stable ids to avoid walking the scene on every lookup
+        self._link_registry = ZeesawLinkRegistry()
+        # Links of loaded models and projects are restored once loading is done
+        self._relink_scheduled = False
+
+        # Trims linked nodes to the parts above build plate, created on first use
+        self._cutter = None  # type: Optional[ZeesawCutter]
+
+        # Drags big linked meshes as decimated proxies, created on first use
+        self._level_of_detail = None  # type: Optional[ZeesawLevelOfDetail]
+
         # Allow/disallow splitting
         self._splittable = False
+        # Allow/disallow moving the selection to an automatic split height
+        self._positionable = False
         # Enable/disable zeesaw action
         self._zeesaw = True
+        # Enable/disable trimming linked meshes at the build plate
+        self._cut = False
+        # Mirror linked nodes instead of rotating them, for parts that have a left and right hand
+        self._mirror = False
         # Enable/disable throttling zeesaw transformations
         self._throttle = False
+        # How to throttle: debounce with fixed interval or adapt to update cost
+        self._throttle_mode = ZeesawUpdateScheduler.DebounceMode
+        # Debounce interval in milliseconds
+        self._throttle_interval = 1000
         # Linked evaluates True, if selected nodes have link decorators and they point to each other
         self._linked = False
+        # Splittable, linked and the indicator are evaluated at most once per event loop tick
+        self._properties_dirty = False
 
         # Avoid unnecessary transformations by comparing to previous values
-        self._committed_selected_transformation = None
-        self._committed_linked_transformation = None
-        self._previous_selected_node = None
-        self._previous_selected_transformation = None
+        self._committed_selected_key = None
+        self._previous_selected_nodes = set()
+        self._previous_selected_keys = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
         self._previous_selection_center = None
 
-        # Timer for throttling updates
-        self._update_timer = None
-
-        self.setExposedProperties("Splittable", "Linked", "Zeesaw", "Throttle")
+        # Coalesces zeesaw updates while dragging
+        self._update_scheduler = ZeesawUpdateScheduler(self._scheduledUpdate)
+        self._update_scheduler.setInterval(self._throttle_interval)
+        # Selected nodes waiting for an update, in order, and total vertex count of their twins
+        self._scheduled_nodes = {}  # type: dict
+        self._scheduled_weight = 0
+        # True while a tool, e.g. the move tool, is dragging something. Cura doesn't slice meanwhile.
+        self._tool_operation = False
+
+        # Records events for the benchmark harness, if enabled by environment
+        self._trace_recorder = ZeesawTraceRecorder.fromEnvironment()
+
+        # Timing counters of the hot paths, off unless enabled from panel or environment
+        self._profiler = ZeesawProfiler.getInstance()
+        self._profiler.enableFromEnvironment()
+
+        self.setExposedProperties(
+            "Splittable",
+            "Positionable",
+            "Linked",
+            "Zeesaw",
+            "Cut",
+            "Mirror",
+            "Throttle",
+            "ThrottleMode",
+            "ThrottleInterval",
+            "Profile",
+            "CutArea",
+            "CutPerimeter",
+        )
 
         Selection.selectionChanged.connect(self._selectionChanged)
         Selection.selectionCenterChanged.connect(self._selectionCenterChanged)
+        self.getController().toolOperationStarted.connect(self._toolOperationStarted)
+        self.getController().toolOperationStopped.connect(self._toolOperationStopped)
         self.getController().getScene().sceneChanged.connect(self._sceneChanged)
+        CuraApplication.getInstance().fileCompleted.connect(self._scheduleRelink)
+        CuraApplication.getInstance().workspaceLoaded.connect(self._scheduleRelink)
 
     def event(self, event: Event) -> bool:
         super().event(event)
 
         if event.type == Event.ToolActivateEvent:
             if Selection.hasSelection() and self._clippy:
+                self._createContour()
+                self._clippy.loadMesh()
                 self._clippy.setParent(self.getController().getScene().getRoot())
                 self._clippy.setEnabled(True)
+                self._contour_node.setParent(self.getController().getScene().getRoot())
+                self._invalidateProperties()
 
         if event.type == Event.ToolDeactivateEvent and self._clippy:
             self._clippy.setParent(None)
             self._clippy.setEnabled(False)
+            if self._contour_node:
+                self._contour_node.setSegments(None)
+                self._contour_node.setParent(None)
 
         return False
 
@@ -102,11 +191,9 @@ class BananaSplit(Tool):
         """True if node has not been linked and part of it is below bed surface."""
         return self._splittable
 
-    def setSplittable(self, splittable: bool) -> None:
-        """Enabled/disable splitting."""
-        if splittable != self._splittable:
-            self._splittable = splittable
-            self.propertyChanged.emit()
+    def getPositionable(self) -> bool:
+        """True if a selected node has not been linked and can be moved to an automatic split height."""
+        return self._positionable
 
     def getZeesaw(self) -> bool:
         """True if zeesawing enabled."""
@@ -116,8 +203,43 @@ class BananaSplit(Tool):
         """Enable/disable zeesawing."""
         if enabled != self._zeesaw:
             self._zeesaw = enabled
+            self._invalidateProperties()
             self.propertyChanged.emit()
 
+    def getCut(self) -> bool:
+        """True if linked meshes get trimmed at the build plate."""
+        return self._cut
+
+    def setCut(self, enabled: bool) -> None:
+        """Enable/disable trimming. Applies to the selected linked nodes and future splits."""
+        if enabled == self._cut:
+            return
+        self._cut = enabled
+        self._restoreLevelOfDetail()
+
+        for selected_node, linked_node in self._getSelectedPairs():
+            if enabled:
+                self._getCutter().addCut(selected_node, linked_node)
+            else:
+                self._removeCut(selected_node)
+                self._removeCut(linked_node)
+        self.propertyChanged.emit()
+
+    def getMirror(self) -> bool:
+        """True if linked nodes are mirror images instead of rotated copies."""
+        return self._mirror
+
+    def setMirror(self, enabled: bool) -> None:
+        """Enable/disable mirroring. Applies to the selected linked pairs and future splits."""
+        if enabled == self._mirror:
+            return
+        self._mirror = enabled
+        self._restoreLevelOfDetail()
+
+        for selected_node, linked_node in self._getSelectedPairs():
+            self._setMirrored(selected_node, linked_node, enabled)
+        self.propertyChanged.emit()
+
     def getThrottle(self) -> bool:
         """True if thorttling enabled."""
         return self._throttle
@@ -126,52 +248,93 @@ class BananaSplit(Tool):
         """Enable/disable throttling."""
         if enabled != self._throttle:
             self._throttle = enabled
+            self._updateSchedulerMode()
+            self.propertyChanged.emit()
+
+    def getThrottleMode(self) -> str:
+        """Throttling mode, either debounce or adaptive."""
+        return self._throttle_mode
+
+    def setThrottleMode(self, mode: str) -> None:
+        """Set throttling mode."""
+        if mode != self._throttle_mode and mode in (
+            ZeesawUpdateScheduler.DebounceMode,
+            ZeesawUpdateScheduler.AdaptiveMode,
+        ):
+            self._throttle_mode = mode
+            self._updateSchedulerMode()
             self.propertyChanged.emit()
 
+    def getThrottleInterval(self) -> int:
+        """Debounce interval in milliseconds."""
+        return self._throttle_interval
+
+    def setThrottleInterval(self, interval: int) -> None:
+        """Set debounce interval in milliseconds."""
+        interval = max(int(interval), ZeesawUpdateScheduler.FRAME_INTERVAL)
+        if interval != self._throttle_interval:
+            self._throttle_interval = interval
+            self._update_scheduler.setInterval(interval)
+            self.propertyChanged.emit()
+
+    def getProfile(self) -> bool:
+        """True if hot paths are profiled."""
+        return self._profiler.isEnabled()
+
+    def setProfile(self, enabled: bool) -> None:
+        """Enable/disable profiling. Statistics are dumped to the log when profiling is turned off."""
+        if enabled != self._profiler.isEnabled():
+            if enabled:
+                self._profiler.reset()
+            self._profiler.setEnabled(enabled)
+            if not enabled:
+                self._profiler.dump()
+            self.propertyChanged.emit()
+
+    def getCutArea(self) -> float:
+        """Cross-section in square millimeters where the build plate cuts the splittable selection."""
+        return self._cut_area
+
+    def getCutPerimeter(self) -> float:
+        """Length of the outline of that cross-section in millimeters."""
+        return self._cut_perimeter
+
     def getLinked(self) -> bool:
         """True if selection is linked."""
         return self._linked
 
-    def setLinked(self, linked: bool) -> None:
-        """Enabled/disable link"""
-        if linked != self._linked:
-            self._linked = linked
-            self.propertyChanged.emit()
-
     def enableZeesaw(self) -> None:
-        """Enable zeesaw."""
-        selected_node = Selection.getSelectedObject(0)
-        if selected_node:
-            linked_node = self._findLinkedNode(selected_node)
-            if linked_node:
-                self.setZeesaw(True)
-                self._updateProperties()
+        """Enable zeesaw for every selected linked pair."""
+        pairs = self._getSelectedPairs()
+        if pairs:
+            self.setZeesaw(True)
 
-                # If transformation did change, commit zeesaw operation to make it undoable (able to undo)
-                self._committed_linked_transformation = linked_node.getWorldTransformation()
-                self.operateZeesaw(
-                    selected_node, linked_node, old_transformation=self._committed_linked_transformation
-                )
+            # If transformations did change, commit zeesaw operation to make it undoable (able to undo)
+            self.operateZeesaw(pairs)
 
     def disableZeesaw(self) -> None:
         """Disable zeesaw."""
         self.setZeesaw(False)
-        self._updateProperties()
 
+    @ZeesawProfiler.profile("split")
     def split(self) -> None:
-        if APP_VERSION < Version("5.2.0"):
-            # Ask user to disable auto drop down altogether, since ZOffsetDecorator is hard to handle
-            app_preferences = Application.getInstance().getPreferences()
-            if app_preferences.getValue("physics/automatic_drop_down"):
-                Message(
-                    text='To avoid issues while positioning models below build plate, please disable "Automatically drop models to the build plate" under Preferences > General, or update to Cura 5.2.0 or newer.',
-                    title="Warning: Auto Drop Enabled",
-                ).show()
-                return
-
-        selected_node = Selection.getSelectedObject(0)
-        if selected_node:
-            new_node = copy.deepcopy(selected_node)
+        if self._warnAutoDropDown():
+            return
+
+        # Every selected node that can be split, in one undoable operation
+        selected_nodes = [node for node in Selection.getAllSelectedObjects() if self._isSplittable(node)]
+        if not selected_nodes:
+            return
+
+        from BananaSplit.SharedMeshCopy import deepcopySharingMeshes
+        from BananaSplit.ZeesawCutOperation import ZeesawCutOperation
+
+        # Twins go where they don't overlap anything, including each other
+        occupancies = self._createOccupancyGrids(selected_nodes)
+
+        operation = GroupedOperation()
+        for selected_node in selected_nodes:
+            new_node = deepcopySharingMeshes(selected_node)
             new_node.setParent(selected_node.getParent())
 
             build_plate_number = selected_node.callDecoration("getBuildPlateNumber")
@@ -179,46 +342,139 @@ class BananaSplit(Tool):
             for child in new_node.getChildren():
                 child.callDecoration("setBuildPlateNumber", build_plate_number)
 
-            # Store reference transformation
-            self._previous_selected_transformation = selected_node.getLocalTransformation()
+            # Cross-link nodes. A mirrored node gets its mesh mirrored once, drag updates only transform it
+            mirrored = self._mirror and self._isMirrorable(selected_node)
+            self._addLinkDecorators(selected_node, new_node, mirrored)
+            if mirrored:
+                new_node.setMeshData(new_node.callDecoration("getZeesawMirroredMesh", selected_node.getMeshData()))
+
+            # Add node to the scene and perform the zeesaw transformation
+            operation.addOperation(AddSceneNodeOperation(new_node, new_node.getParent()))
+            transform_operation = self._zeesawOperation(
+                selected_node, new_node, add_to_scene=True, occupancy=occupancies[build_plate_number]
+            )
+            if transform_operation:
+                operation.addOperation(transform_operation)
+            # Trimmed along with the split, so that undo gives the original its whole mesh back
+            if self._cut:
+                operation.addOperation(ZeesawCutOperation(self._getCutter(), selected_node, new_node))
 
-            # Cross-link nodes
-            self._addLinkDecorators(selected_node, new_node)
+        operation.push()
+
+        self._selectionChanged()
+
+    @ZeesawProfiler.profile("autoHeight")
+    def autoHeight(self) -> None:
+        """Move every selected node that has not been linked up or down, so that the build plate cuts it
+        at the best split height found. All nodes move in one undoable operation.
+        """
+        if self._warnAutoDropDown():
+            return
+
+        operations = []
+        for node in Selection.getAllSelectedObjects():
+            if not self._isPositionable(node):
+                continue
+            height = self._findSplitHeight(node)
+            if height is None or abs(height) < 0.01:
+                continue
+
+            world_data = node.getWorldTransformation().getData().copy()
+            world_data[1, 3] -= height
+            parent = node.getParent()
+            if parent and parent.getParent():
+                world_data = localTransformation(world_data, parent.getWorldTransformation().getData())
+            if self._auto_drop_down_setting:
+                # Keep the node from dropping back on the build plate
+                node.setSetting(SceneNodeSettings.AutoDropDown, False)
+            operations.append(SetTransformationOperation(node, Matrix(world_data)))
+
+        if not operations:
+            return
+        if len(operations) == 1:
+            operation = operations[0]
+        else:
+            operation = GroupedOperation()
+            for transform_operation in operations:
+                operation.addOperation(transform_operation)
+        operation.push()
+
+    @ZeesawProfiler.profile("operateZeesaw")
+    def operateZeesaw(self, pairs: List[Tuple[SceneNode, SceneNode]]) -> bool:
+        """Update linked node transformations of (selected, linked) pairs using transformation
+        operations. User can undo this. Returns True, if an operation was pushed to stack, and False,
+        if the operation would have not made any difference to the linked nodes.
+        """
+        operations = []
+        for selected_node, linked_node in pairs:
+            operation = self._zeesawOperation(
+                selected_node, linked_node, old_transformation=linked_node.getLocalTransformation()
+            )
+            if operation:
+                operations.append(operation)
+
+        if not operations:
+            return False
 
-            # Add node to the scene and perform the zeesaw transformations
-            self.operateZeesaw(selected_node, new_node, add_to_scene=True)
+        # Single zeesaws stay bare, so that consecutive ones can merge
+        if len(operations) == 1:
+            operation = operations[0]
+        else:
+            operation = GroupedOperation()
+            for transform_operation in operations:
+                operation.addOperation(transform_operation)
+        operation.push()
 
-            self._selectionChanged()
+        if self._cutter:
+            for selected_node, linked_node in pairs:
+                self._cutter.requestCut(selected_node, linked_node)
+        return True
 
-    def operateZeesaw(
+    def _zeesawOperation(
         self,
         selected_node: SceneNode,
         linked_node: SceneNode,
         add_to_scene: bool = False,
         old_transformation: Optional[Matrix] = None,
-    ) -> bool:
-        """Update linked node transformation using transformation operations. User can undo this.
-        Returns True, if operation was pushed to stack, and False, if the operation would have not
-        made any difference to the linked node.
+        occupancy: Optional["OccupancyGrid"] = None,
+    ) -> Optional[SetTransformationOperation]:
+        """Operation that puts linked node in zeesaw transformation of selected node, or None if that
+        would not make any difference. A node added to the scene is placed next to the selected node,
+        or at the closest free spot of occupancy if given.
         """
 
         # Store reference transformation
-        transformation = selected_node.getLocalTransformation()
-        world_transformation = selected_node.getWorldTransformation()
-        self._previous_selected_transformation = world_transformation.copy()
+        selected_key = transformationKey(selected_node.getWorldTransformation().getData())
+        self._previous_selected_keys[selected_node] = selected_key
 
         # Avoid unnecessary transformations, if reference has not changed
-        if self._transformationsSamey(world_transformation, self._committed_selected_transformation):
-            return False
+        if selected_key == self._committed_selected_key:
+            return None
 
-        # Preview, if zeesaw update would make a difference on the linked node
-        self.updateZeesaw(selected_node, linked_node, forced=True)
+        # By default keep the linked node where it is apart from mirroring y world coordinate.
+        # Note that y is what user sees as z
+        position = linked_node.getWorldPosition()
+        x = position.x
+        z = position.z
 
-        # The result does differ slightly possibly due to rounding errors
-        if self._transformationsSamey(linked_node.getWorldTransformation(), self._committed_linked_transformation):
-            return False
+        if add_to_scene:
+            world_position = selected_node.getWorldPosition()
+            bbox = self._getBoundingBox(selected_node)
 
-        if APP_VERSION >= Version("5.2.0"):
+            # Align bounding boxes along x axis and move new node next to the original node
+            x = world_position.x + 2 * (bbox.center.x - world_position.x)
+            x = x + bbox.width + 4
+            if occupancy is not None:
+                x, z = self._findTwinPosition(selected_node, occupancy, x, z)
+
+        # Preview, if zeesaw update would make a difference on the linked node
+        transformation = self._zeesawTransformation(selected_node, linked_node, x, z)
+        if old_transformation and transformationKey(transformation.getData()) == transformationKey(
+            old_transformation.getData()
+        ):
+            return None
+
+        if self._auto_drop_down_setting:
             # Disable auto drop down. Makes things easier and fixes undo functionality
             selected_node.setSetting(SceneNodeSettings.AutoDropDown, False)
             linked_node.setSetting(SceneNodeSettings.AutoDropDown, False)
@@ -228,178 +484,498 @@ class BananaSplit(Tool):
             # self._updateInverseZOffsetDecorator(selected_node, linked_node)
             pass
 
-        operation = GroupedOperation()
-
-        if add_to_scene:
-            operation.addOperation(AddSceneNodeOperation(linked_node, linked_node.getParent()))
-
-        # Reset transformation
-        operation.addOperation(SetTransformationOperation(linked_node, transformation, old_transformation))
-
-        # Rotate 180 degrees. This turned out to be way faster than mirroring
-        rotation = Quaternion.fromAngleAxis(pi, Vector.Unit_Z)
-        operation.addOperation(RotateOperation(linked_node, rotation))
-
-        # By default translate node back to previous position and
-        # mirror y world coordinate. Note that y is what user sees as z
-        x = linked_node.getWorldPosition().x
-        y = -selected_node.getWorldPosition().y
-        z = linked_node.getWorldPosition().z
-
-        if add_to_scene:
-            world_position = selected_node.getWorldPosition()
-            bbox = selected_node.getBoundingBox()
-
-            # Align bounding boxes along x axis and move new node next to the original node
-            x = world_position.x + 2 * (bbox.center.x - world_position.x)
-            x = x + bbox.width + 4
-
-        operation.addOperation(TranslateOperation(linked_node, Vector(x, y, z), set_position=True))
-
-        operation.push()
-        return True
+        # Rotated, mirrored and translated in one go. Zeesaws of the same node in quick succession merge
+        # into one undo step, separate user actions stay separate
+        return SetTransformationOperation(linked_node, transformation, old_transformation)
 
-    def updateZeesaw(self, selected_node: SceneNode, linked_node: SceneNode, forced: bool = False) -> bool:
-        """Update linked node transformation skipping the operation stack. Returns True, if transformation
-        got updated, and False, if the operation would have not made any difference to the linked node.
+    @ZeesawProfiler.profile("updateZeesaw")
+    def updateZeesaw(self, pairs: List[Tuple[SceneNode, SceneNode]], forced: bool = False) -> bool:
+        """Update linked node transformations of (selected, linked) pairs skipping the operation stack.
+        All pairs are transformed in one pass and the scene is notified once. Unless forced, big linked
+        meshes are shown as proxies until the tool operation dragging them ends. Returns True, if any
+        transformation got updated, and False, if the update would have not made any difference.
         """
         # Logger.debug("updateZeesaw")
-        transformation = selected_node.getLocalTransformation()
-        world_transformation = selected_node.getWorldTransformation()
-
-        if not forced:
-            if self._transformationsSamey(world_transformation, self._previous_selected_transformation):
-                return False
-        self._previous_selected_transformation = world_transformation.copy()
-
-        # Target position
-        selected_position = selected_node.getWorldPosition()
-        linked_position = linked_node.getWorldPosition()
-
-        # Rotate 180 degrees
-        rotation = Quaternion.fromAngleAxis(pi, Vector.Unit_Z)
-        orientation_matrix = rotation.toMatrix()
-        transformation.multiply(world_transformation.getInverse())
-        transformation.multiply(orientation_matrix)
-        transformation.multiply(world_transformation)
-        linked_node.setTransformation(transformation)
-
-        # Linked node position after rotation
-        current_world_position = linked_node.getWorldPosition()
-
-        transformation = linked_node.getLocalTransformation()
-        world_transformation = linked_node.getWorldTransformation()
-
-        # Translate back to orignal just possibly updating Z (actually Y)
-        target_position = Vector(linked_position.x, -selected_position.y, linked_position.z)
-        translation = target_position - current_world_position
-        translation_matrix = Matrix()
-        translation_matrix.setByTranslation(translation)
-        transformation.multiply(world_transformation.getInverse())
-        transformation.multiply(translation_matrix)
-        transformation.multiply(world_transformation)
-        linked_node.setTransformation(transformation)
+        if not pairs:
+            return False
+        selected_data = numpy.stack([node.getWorldTransformation().getData() for node, _ in pairs])
+        selected_keys = transformationKeys(selected_data)
+
+        changed = []
+        for index, (selected_node, _) in enumerate(pairs):
+            if forced or selected_keys[index] != self._previous_selected_keys.get(selected_node):
+                self._previous_selected_keys[selected_node] = selected_keys[index]
+                changed.append(index)
+        if not changed:
+            return False
+
+        # Keep linked nodes in place, just possibly updating Z (actually Y)
+        linked_positions = numpy.array(
+            [self._positionData(pairs[index][1].getWorldPosition()) for index in changed]
+        )
+        mirrored = [bool(pairs[index][0].callDecoration("isZeesawMirrored")) for index in changed]
+        transformations = zeesawTransformation(selected_data[changed], linked_positions, numpy.array(mirrored))
+
+        scene = self.getController().getScene()
+        with postponeSignals(scene.sceneChanged, compress=CompressTechnique.CompressSingle):
+            for transformation, index in zip(transformations, changed):
+                linked_node = pairs[index][1]
+                parent = linked_node.getParent()
+                if parent and parent.getParent():
+                    transformation = localTransformation(transformation, parent.getWorldTransformation().getData())
+                self._profiler.count("setTransformation")
+                linked_node.setTransformation(Matrix(transformation))
+                # Swapped within the same scene change, once the node is where its hull can be derived
+                if not forced and self._tool_operation:
+                    self._getLevelOfDetail().requestProxy(linked_node)
+
+        if self._cutter:
+            for index in changed:
+                self._cutter.requestCut(*pairs[index])
 
         return True
 
-    def scheduleUpdate(self) -> None:
+    def scheduleUpdate(self, selected_node: SceneNode, linked_node: SceneNode) -> None:
+        """Schedule zeesaw update for the selected node. Updates are coalesced by the scheduler."""
         # Logger.debug("scheduleUpdate")
-        if self._throttle:
-            self._update_timer = QTimer()
-            self._update_timer.setInterval(1000)
-            self._update_timer.setSingleShot(True)
-            self._update_timer.timeout.connect(self._scheduledUpdate)
-            self._update_timer.start()
-        else:
-            self._scheduledUpdate()
+        if selected_node not in self._scheduled_nodes:
+            self._scheduled_nodes[selected_node] = None
+            mesh_data = linked_node.getMeshData()
+            if mesh_data:
+                self._scheduled_weight += mesh_data.getVertexCount()
+        self._update_scheduler.request(self._scheduled_weight)
 
     def _scheduledUpdate(self) -> None:
         # Logger.debug("_scheduledUpdate")
-        self._update_timer = None
-        selected_node, linked_node = self._getSelectedAndLinkedNode(0)
-        if selected_node and linked_node and self._zeesaw:
-            self.updateZeesaw(selected_node, linked_node)
+        selected_nodes = list(self._scheduled_nodes)
+        self._scheduled_nodes.clear()
+        self._scheduled_weight = 0
+        if not self._zeesaw:
+            return
+
+        pairs = []
+        for selected_node in selected_nodes:
+            linked_node = self._findLinkedNode(selected_node)
+            if linked_node:
+                pairs.append((selected_node, linked_node))
+        self.updateZeesaw(pairs)
+
+    def _updateSchedulerMode(self) -> None:
+        if self._throttle:
+            self._update_scheduler.setMode(self._throttle_mode)
+        else:
+            self._update_scheduler.setMode(ZeesawUpdateScheduler.FrameMode)
 
+    @ZeesawProfiler.profile("_sceneChanged")
     def _sceneChanged(self, node: SceneNode) -> None:
         # Logger.debug("_sceneChanged")
-        if self._update_timer:
-            return
-        if self._zeesaw and node.hasDecoration("zeesawLinkedNodeId"):
-            selected_node, linked_node = self._getSelectedAndLinkedNode(0)
-            if node is selected_node and linked_node and self._update_timer is None:
-                CuraApplication.getInstance().callLater(self.scheduleUpdate)
-
+        if self._trace_recorder:
+            self._recordSceneChanged(node)
+        if self._zeesaw and node.hasDecoration("zeesawLinkedNodeId") and Selection.isSelected(node):
+            linked_node = self._findLinkedNode(node)
+            if linked_node and self._drivesZeesaw(node, linked_node):
+                self.scheduleUpdate(node, linked_node)
+
+    def _toolOperationStarted(self, tool) -> None:
+        self._tool_operation = True
+        if self._trace_recorder:
+            self._trace_recorder.recordToolOperation(True)
+
+    def _toolOperationStopped(self, tool) -> None:
+        self._tool_operation = False
+        if self._trace_recorder:
+            self._trace_recorder.recordToolOperation(False)
+        # Land the last update of the drag, then bring back the full meshes before Cura slices
+        self._update_scheduler.flush()
+        self._restoreLevelOfDetail()
+        # Publishes the cross-section of where the drag ended
+        self._invalidateProperties()
+
+    @ZeesawProfiler.profile("_selectionChanged")
     def _selectionChanged(self) -> None:
         # Logger.debug("_selectionChanged")
-        self._updateProperties()
+        # Apply pending update of the previous selection before moving on
+        self._update_scheduler.flush()
+        self._restoreLevelOfDetail()
+        self._invalidateProperties()
         selected_node, linked_node = self._getSelectedAndLinkedNode(0)
+        if self._trace_recorder:
+            self._trace_recorder.recordSelectionChanged(Selection.getCount(), linked_node is not None)
+
+        selected_nodes = Selection.getAllSelectedObjects()
+        for node in selected_nodes:
+            # Trimmed node lost its other half, e.g. split got undone
+            if node.hasDecoration("getZeesawSourceMesh") and not self._findLinkedNode(node):
+                self._removeCut(node)
+
+        # Newly selected pairs get their linked transformations updated in undoable manner
+        if self._zeesaw:
+            pairs = [pair for pair in self._getSelectedPairs() if pair[0] not in self._previous_selected_nodes]
+            self.operateZeesaw(pairs)
+        self._previous_selected_nodes = set(selected_nodes)
+
+    def _recordSceneChanged(self, node: SceneNode) -> None:
+        selected_node, linked_node = self._getSelectedAndLinkedNode(0)
+        if node is selected_node:
+            self._trace_recorder.recordSceneChanged(
+                ZeesawTraceRecorder.SelectedRole, selected_node.getWorldTransformation()
+            )
+        elif linked_node and node is linked_node:
+            self._trace_recorder.recordSceneChanged(ZeesawTraceRecorder.LinkedRole)
+        else:
+            self._trace_recorder.recordSceneChanged(ZeesawTraceRecorder.OtherRole)
 
-        if not selected_node:
-            self._previous_selected_node = None
-            return
-
-        # Selected node changed so update linked transformation in undoable manner
-        if self._zeesaw and linked_node and selected_node is not self._previous_selected_node:
-            self._committed_linked_transformation = linked_node.getWorldTransformation()
-            self.operateZeesaw(selected_node, linked_node, old_transformation=self._committed_linked_transformation)
-        self._previous_selected_node = selected_node
-
+    @ZeesawProfiler.profile("_selectionCenterChanged")
     def _selectionCenterChanged(self) -> None:
         # Logger.debug("_selectionCenterChanged")
-        selected_node, linked_node = self._getSelectedAndLinkedNode(0)
-        if selected_node and linked_node and self._zeesaw:
-            self._clippy.updatePosition(selected_node, linked_node)
-        self._updateProperties()
+        # Fires for every transformation of a selected node, so only mark the state dirty
+        self._invalidateProperties()
 
+    def _invalidateProperties(self) -> None:
+        """Evaluate properties on the next tick of the event loop. Changes until then are coalesced."""
+        if not self._properties_dirty:
+            self._properties_dirty = True
+            CuraApplication.getInstance().callLater(self._evaluateProperties)
+
+    def _evaluateProperties(self) -> None:
+        # Already evaluated, if called directly meanwhile
+        if self._properties_dirty:
+            self._updateProperties()
+
+    @ZeesawProfiler.profile("_updateProperties")
     def _updateProperties(self) -> None:
+        """Derive splittable, linked, the indicator and the cut preview from the selection in one pass,
+        and notify bindings once if any of them changed.
+        """
         # Logger.debug("_updateProperties")
+        self._properties_dirty = False
         self._clippy.setEnabled(self._zeesaw)
         splittable = False
         linked = False
 
         selection_count = Selection.getCount()
         primary_node, primary_linked_node = self._getSelectedAndLinkedNode(0)
-        secondary_node, secondary_linked_node = self._getSelectedAndLinkedNode(1)
 
-        if primary_node and primary_linked_node:
+        if primary_node and primary_linked_node and self._zeesaw:
             self._clippy.updatePosition(primary_node, primary_linked_node)
 
-        if selection_count == 1 and primary_node:
-            if primary_linked_node:
-                linked = True
-            else:
-                # Check if node is partly submerged in the build plate
-                bbox = primary_node.getBoundingBox()
-                if bbox.bottom < -0.1 and bbox.top > 0.1:
-                    splittable = True
-        elif selection_count == 2 and secondary_node and secondary_linked_node:
-            if primary_node is secondary_linked_node and secondary_node is primary_linked_node:
-                linked = True
+        # Linked, if every selected node belongs to a linked pair. Splittable, if any of them can be split
+        paired_nodes = set()
+        for selected_node, linked_node in self._getSelectedPairs():
+            paired_nodes.add(selected_node)
+            paired_nodes.add(linked_node)
+        selected_nodes = Selection.getAllSelectedObjects()
+        splittable_nodes = []
+        positionable = False
+        if selection_count > 0:
+            linked = all(node in paired_nodes for node in selected_nodes)
+            splittable_nodes = [
+                node for node in selected_nodes if node not in paired_nodes and self._isSplittable(node)
+            ]
+            splittable = bool(splittable_nodes)
+            positionable = any(node not in paired_nodes and node.getMeshData() is not None for node in selected_nodes)
 
         self._clippy.setVisible(linked and self._zeesaw)
-        self.setLinked(linked)
-        self.setSplittable(splittable)
+        cut_area, cut_perimeter = self._updateContour(splittable_nodes)
+        # The cross-section changes on almost every tick of a drag, so its numbers wait for the drag to end
+        if self._tool_operation:
+            cut_area, cut_perimeter = self._cut_area, self._cut_perimeter
+        if (
+            linked != self._linked
+            or splittable != self._splittable
+            or positionable != self._positionable
+            or cut_area != self._cut_area
+            or cut_perimeter != self._cut_perimeter
+        ):
+            self._linked = linked
+            self._splittable = splittable
+            self._positionable = positionable
+            self._cut_area = cut_area
+            self._cut_perimeter = cut_perimeter
+            self.propertyChanged.emit()
+
+    def _createOccupancyGrids(self, selected_nodes: List[SceneNode]) -> Dict[int, "OccupancyGrid"]:
+        """Occupancy grid of every build plate selected nodes are on, by build plate number."""
+        plates = {}  # type: Dict[int, List[SceneNode]]
+        for node in selected_nodes:
+            plates.setdefault(node.callDecoration("getBuildPlateNumber"), []).append(node)
+        return {number: self._createOccupancyGrid(number, nodes) for number, nodes in plates.items()}
+
+    def _createOccupancyGrid(self, build_plate_number: int, selected_nodes: List[SceneNode]) -> "OccupancyGrid":
+        """Build plate with the convex hulls of the nodes on it and its disallowed areas taken. Without
+        a build volume, the plate is what the nodes cover with room for the twins of selected nodes.
+        """
+        from BananaSplit.OccupancyGrid import OccupancyGrid
+
+        hulls = []
+        for node in self.getController().getScene().getRoot().getChildren():
+            if node.callDecoration("getBuildPlateNumber") != build_plate_number:
+                continue
+            hull = node.callDecoration("getConvexHull")
+            if hull is not None and len(hull.getPoints()):
+                hulls.append(hull.getPoints())
+
+        build_volume = CuraApplication.getInstance().getBuildVolume()
+        if build_volume is not None:
+            bbox = build_volume.getBoundingBox()
+            edge = build_volume.getEdgeDisallowedSize()
+            occupancy = OccupancyGrid(
+                numpy.array([bbox.left + edge, bbox.back + edge]), numpy.array([bbox.right - edge, bbox.front - edge])
+            )
+            hulls.extend(area.getPoints() for area in build_volume.getDisallowedAreas())
+        else:
+            boxes = [self._getBoundingBox(node) for node in selected_nodes]
+            margin = sum(box.width + box.depth for box in boxes) + 2 * (self.TWIN_SPACING + 4)
+            corners = [numpy.array([[box.left, box.back], [box.right, box.front]]) for box in boxes]
+            points = numpy.concatenate(hulls + corners)
+            occupancy = OccupancyGrid(points.min(axis=0) - margin, points.max(axis=0) + margin)
+        occupancy.addPolygons(hulls)
+        return occupancy
+
+    def _findTwinPosition(
+        self, selected_node: SceneNode, occupancy: "OccupancyGrid", x: float, z: float
+    ) -> Tuple[float, float]:
+        """Free spot closest to x, z for the twin of selected node, which gets taken in occupancy. Keeps
+        x, z if the twin fits nowhere.
+        """
+        hull = selected_node.callDecoration("getConvexHull")
+        if hull is not None and len(hull.getPoints()):
+            points = hull.getPoints()
+        else:
+            bbox = self._getBoundingBox(selected_node)
+            points = numpy.array([[bbox.left, bbox.back], [bbox.right, bbox.front]])
+        footprint = zeesawHullPoints(
+            points,
+            self._positionData(selected_node.getWorldPosition()),
+            numpy.zeros(3),
+            bool(selected_node.callDecoration("isZeesawMirrored")),
+        )
+        minimum, maximum = footprint.min(axis=0), footprint.max(axis=0)
+        position = occupancy.findFree(minimum - self.TWIN_SPACING, maximum + self.TWIN_SPACING, numpy.array([x, z]))
+        if position is None:
+            return (x, z)
+        occupancy.addRectangle(position + minimum, position + maximum)
+        return (float(position[0]), float(position[1]))
+
+    def _createContour(self) -> None:
+        if self._contour is None:
+            from BananaSplit.ZeesawContour import ZeesawContour
+            from BananaSplit.ZeesawContourNode import ZeesawContourNode
+
+            self._contour_node = ZeesawContourNode()
+            self._contour = ZeesawContour(self._invalidateProperties)
+
+    def _getCutter(self) -> "ZeesawCutter":
+        if self._cutter is None:
+            from BananaSplit.ZeesawCutter import ZeesawCutter
+
+            self._cutter = ZeesawCutter()
+        return self._cutter
+
+    def _removeCut(self, node: SceneNode) -> None:
+        # Nothing was trimmed before the cutter existed
+        if self._cutter:
+            self._cutter.removeCut(node)
+
+    def _getLevelOfDetail(self) -> "ZeesawLevelOfDetail":
+        if self._level_of_detail is None:
+            from BananaSplit.ZeesawLevelOfDetail import ZeesawLevelOfDetail
+
+            self._level_of_detail = ZeesawLevelOfDetail()
+        return self._level_of_detail
+
+    def _restoreLevelOfDetail(self) -> None:
+        if self._level_of_detail:
+            self._level_of_detail.restore()
+
+    def _updateContour(self, nodes: List[SceneNode]) -> Tuple[float, float]:
+        """Outline where the build plate cuts nodes. Returns the area and perimeter of the cross-section,
+        rounded for display.
+        """
+        if self._contour_node is None or self._contour_node.getParent() is None:
+            return (0.0, 0.0)
+        outlines = []
+        for node in nodes:
+            self._contour.requestIndex(node)
+            segments = self._contour.getSegments(node)
+            if segments is not None:
+                outlines.append(segments)
+        segments = numpy.concatenate(outlines) if outlines else None
+        self._contour_node.setSegments(segments)
+        if segments is None:
+            return (0.0, 0.0)
+        from BananaSplit.PlanarCut import crossSection
+
+        area, perimeter = crossSection(segments)
+        return (round(area, 1), round(perimeter, 1))
+
+    def _isSplittable(self, node: SceneNode) -> bool:
+        """True if node has no twin and is partly submerged in the build plate."""
+        if node.hasDecoration("zeesawLinkedNodeId") and self._findLinkedNode(node):
+            return False
+        bbox = self._getBoundingBox(node)
+        return bbox is not None and bbox.bottom < -0.1 and bbox.top > 0.1
+
+    def _isPositionable(self, node: SceneNode) -> bool:
+        """True if node has no twin and a mesh of its own to find a split height for."""
+        if node.hasDecoration("zeesawLinkedNodeId") and self._findLinkedNode(node):
+            return False
+        return node.getMeshData() is not None
+
+    def _findSplitHeight(self, node: SceneNode) -> Optional[float]:
+        """World height that would be the best place to split node at, or None if there is none."""
+        from BananaSplit.PlanarCut import meshTriangles
+        from BananaSplit.SplitHeight import findSplitHeight
+
+        mesh_data = node.getMeshData()
+        triangles = meshTriangles(mesh_data.getVertices(), mesh_data.getIndices())
+        return findSplitHeight(triangles, node.getWorldTransformation().getData())
+
+    def _warnAutoDropDown(self) -> bool:
+        """Before Cura 5.2.0, ask user to disable auto drop down altogether, since ZOffsetDecorator is
+        hard to handle. Returns True, if nodes can't be positioned below build plate.
+        """
+        if self._auto_drop_down_setting:
+            return False
+        app_preferences = Application.getInstance().getPreferences()
+        if app_preferences.getValue("physics/automatic_drop_down"):
+            Message(
+                text=(
+                    "To avoid issues while positioning models below build plate, please disable "
+                    '"Automatically drop models to the build plate" under Preferences > General, '
+                    "or update to Cura 5.2.0 or newer."
+                ),
+                title="Warning: Auto Drop Enabled",
+            ).show()
+            return True
+        return False
+
+    def _isMirrorable(self, node: SceneNode) -> bool:
+        """True if node has a mesh of its own. Groups are rotated instead."""
+        return node.getMeshData() is not None and not node.getChildren()
+
+    def _drivesZeesaw(self, node: SceneNode, linked_node: SceneNode) -> bool:
+        """True if node moves its twin. When both ends are selected, the one selected first leads."""
+        if not Selection.isSelected(linked_node):
+            return True
+        selected_nodes = Selection.getAllSelectedObjects()
+        return selected_nodes.index(node) < selected_nodes.index(linked_node)
 
     def _findLinkedNode(self, node: SceneNode) -> Optional[SceneNode]:
         # Logger.debug("_findLinkedNode")
-        linked_node_id = node.callDecoration("zeesawLinkedNodeId")
-        if linked_node_id:
-            scene = Application.getInstance().getController().getScene()
-            return scene.findObject(linked_node_id)
+        return self._link_registry.findLinkedNode(node)
 
-    def _addLinkDecorators(self, node1: SceneNode, node2: SceneNode) -> None:
+    def _addLinkDecorators(
+        self, node1: SceneNode, node2: SceneNode, mirrored: bool = False, node_ids: Optional[Tuple[str, str]] = None
+    ) -> None:
         # Logger.debug("_addLinkDecorators")
         self._removeLinkDecorators(node1)
         self._removeLinkDecorators(node2)
-        node1.addDecorator(ZeesawLinkDecorator(id(node2)))
-        node2.addDecorator(ZeesawLinkDecorator(id(node1)))
+        node1_id, node2_id = node_ids or (uuid.uuid4().hex, uuid.uuid4().hex)
+        node1.addDecorator(ZeesawLinkDecorator(node1_id, node2_id, mirrored))
+        node2.addDecorator(ZeesawLinkDecorator(node2_id, node1_id, mirrored))
+        self._link_registry.link(node1, node2)
+
+        # Let the second node derive its convex hull and bounding box from the first one
+        hull_decorator = node2.getDecorator(ConvexHullDecorator)
+        if hull_decorator:
+            node2.removeDecorator(ConvexHullDecorator)
+            releaseConvexHullDecorator(hull_decorator)
+            node2.addDecorator(ZeesawConvexHullDecorator(node1))
 
     def _removeLinkDecorators(self, node: SceneNode) -> None:
         # Logger.debug("_removeLinkDecorators")
         linked_node = self._findLinkedNode(node)
-        node.removeDecorator(ZeesawLinkDecorator)
-        if linked_node:
-            linked_node.removeDecorator(ZeesawLinkDecorator)
+        for unlinked_node in (node, linked_node):
+            if unlinked_node:
+                self._link_registry.unlink(unlinked_node)
+                unlinked_node.removeDecorator(ZeesawLinkDecorator)
+                clearLinkMetadata(unlinked_node)
+                if unlinked_node.getDecorator(ZeesawConvexHullDecorator):
+                    unlinked_node.removeDecorator(ZeesawConvexHullDecorator)
+                    unlinked_node.addDecorator(ConvexHullDecorator())
+
+    def _scheduleRelink(self, file_name: str = "") -> None:
+        """Restore links on the next tick of the event loop, once every node of the file is in the scene."""
+        if not self._relink_scheduled:
+            self._relink_scheduled = True
+            CuraApplication.getInstance().callLater(self._relinkScene)
+
+    @ZeesawProfiler.profile("_relinkScene")
+    def _relinkScene(self) -> None:
+        """Link loaded nodes again from the ids saved in their metadata, in one pass over the scene."""
+        # Logger.debug("_relinkScene")
+        self._relink_scheduled = False
+        loaded_nodes = {}  # type: dict
+        ambiguous_ids = set()
+        for node in DepthFirstIterator(self.getController().getScene().getRoot()):
+            if node.hasDecoration("zeesawLinkedNodeId"):
+                continue
+            link = readLinkMetadata(node)
+            if link is None:
+                continue
+            # The same model loaded twice can't tell which twin is whose
+            if link[0] in loaded_nodes:
+                ambiguous_ids.add(link[0])
+            loaded_nodes[link[0]] = (node, link)
+
+        relinked = False
+        for node_id, (node, (_, linked_node_id, mirrored)) in loaded_nodes.items():
+            linked = loaded_nodes.get(linked_node_id)
+            if linked is None or node_id in ambiguous_ids or linked_node_id in ambiguous_ids:
+                clearLinkMetadata(node)
+                continue
+            linked_node, (_, back_node_id, _) = linked
+            if back_node_id != node_id or node.hasDecoration("zeesawLinkedNodeId"):
+                continue
+
+            # Ids still taken by live nodes, e.g. after opening the same project twice, are replaced
+            node_ids = (node_id, linked_node_id)
+            if self._link_registry.findNode(node_id) or self._link_registry.findNode(linked_node_id):
+                node_ids = None
+            self._addLinkDecorators(node, linked_node, mirrored, node_ids)
+            relinked = True
+
+            # Twins come back from a project with a copy of the mesh each, share one again
+            if not mirrored:
+                from BananaSplit.SharedMeshCopy import shareEqualMesh
+
+                shareEqualMesh(node, linked_node)
+
+        if relinked:
+            self._invalidateProperties()
+
+    def _setMirrored(self, selected_node: SceneNode, linked_node: SceneNode, mirrored: bool) -> None:
+        """Turn a linked pair into mirror images or back into rotated copies."""
+        if bool(selected_node.callDecoration("isZeesawMirrored")) == mirrored:
+            return
+        if mirrored and not (self._isMirrorable(selected_node) and self._isMirrorable(linked_node)):
+            return
+
+        # Trimmed meshes get cut again from the new source
+        cut = selected_node.hasDecoration("getZeesawSourceMesh")
+        if cut:
+            self._removeCut(selected_node)
+            self._removeCut(linked_node)
+
+        selected_node.callDecoration("setZeesawMirrored", mirrored)
+        linked_node.callDecoration("setZeesawMirrored", mirrored)
+        if mirrored:
+            linked_node.setMeshData(linked_node.callDecoration("getZeesawMirroredMesh", selected_node.getMeshData()))
+        else:
+            # Give the mirror image its original mesh back, whichever end carries it
+            restored = False
+            for node in (linked_node, selected_node):
+                source_mesh = node.callDecoration("getZeesawMirrorSource")
+                if source_mesh is not None:
+                    node.setMeshData(source_mesh)
+                    restored = True
+            if not restored:
+                linked_node.setMeshData(selected_node.getMeshData())
+
+        self.updateZeesaw([(selected_node, linked_node)], forced=True)
+        if cut:
+            self._getCutter().addCut(selected_node, linked_node)
 
     def _updateInverseZOffsetDecorator(self, selected_node: SceneNode, linked_node: SceneNode) -> None:
         # Logger.debug("_updateInverseZOffsetDecorator")
@@ -412,11 +988,24 @@ class BananaSplit(Tool):
             z_offset = -(bbox.height + bbox.bottom)
             linked_node.callDecoration("setZOffset", z_offset)
 
-    def _transformationsSamey(self, a: Matrix, b: Matrix) -> bool:
-        if a and b:
-            return numpy.allclose(a.getData(), b.getData(), rtol=1.0e-5, atol=1.0e-5)
-        else:
-            return False
+    def _zeesawTransformation(self, selected_node: SceneNode, linked_node: SceneNode, x: float, z: float) -> Matrix:
+        """Local transformation that puts linked node at x, z as the zeesaw counterpart of selected node."""
+        world_data = zeesawTransformation(
+            selected_node.getWorldTransformation().getData(),
+            numpy.array([x, 0.0, z]),
+            bool(selected_node.callDecoration("isZeesawMirrored")),
+        )
+        parent = linked_node.getParent()
+        if parent and parent.getParent():
+            world_data = localTransformation(world_data, parent.getWorldTransformation().getData())
+        return Matrix(world_data)
+
+    def _positionData(self, position) -> numpy.ndarray:
+        return numpy.array([position.x, position.y, position.z])
+
+    def _getBoundingBox(self, node: SceneNode) -> Optional[AxisAlignedBox]:
+        """Bounding box of a node, derived from its twin when possible."""
+        return node.callDecoration("getZeesawBoundingBox") or node.getBoundingBox()
 
     def _getSelectedAndLinkedNode(self, index: int) -> Tuple[Optional[SceneNode], Optional[SceneNode]]:
         if index >= Selection.getCount():
@@ -426,8 +1015,17 @@ class BananaSplit(Tool):
             return (None, None)
         if not selected_node.hasDecoration("zeesawLinkedNodeId"):
             return (selected_node, None)
-        linked_node = self._findLinkedNode(selected_node)
-        if linked_node and not linked_node.hasDecoration("zeesawLinkedNodeId"):
-            # Fix broken link. Decorator may have been lost during undo/redo...
-            self._addLinkDecorators(selected_node, linked_node)
-        return (selected_node, linked_node)
+        return (selected_node, self._findLinkedNode(selected_node))
+
+    def _getSelectedPairs(self) -> List[Tuple[SceneNode, SceneNode]]:
+        """Linked (selected, linked) pairs in the selection. A pair with both ends selected appears once,
+        led by the end selected first.
+        """
+        pairs = []
+        followers = set()
+        for index in range(Selection.getCount()):
+            selected_node, linked_node = self._getSelectedAndLinkedNode(index)
+            if selected_node and linked_node and selected_node not in followers:
+                pairs.append((selected_node, linked_node))
+                followers.add(linked_node)
+        return pairs
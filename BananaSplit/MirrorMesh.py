@@ -0,0 +1,46 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Mirror images of meshes along their local X axis, as carried by the linked end of a mirrored zeesaw.
+Mirroring turns faces inside out, so the winding of every face is reversed to keep them pointing
+outwards.
+"""
+
+from UM.Mesh.MeshData import MeshData
+
+import numpy
+
+_MIRROR_X = numpy.array([-1.0, 1.0, 1.0], dtype=numpy.float32)
+
+
+def mirrorTriangles(triangles: numpy.ndarray) -> numpy.ndarray:
+    """Mirror triangles of shape (n, 3, 3) along X and reverse their winding."""
+    return triangles[:, ::-1] * _MIRROR_X.astype(triangles.dtype)
+
+
+def mirrorMeshData(mesh_data: MeshData) -> MeshData:
+    """Mirror image of mesh data along its local X axis. Normals are mirrored along and the winding of
+    faces reversed, indexed or not. Everything else is reused.
+    """
+    vertices = mesh_data.getVertices()
+    normals = mesh_data.getNormals()
+    indices = mesh_data.getIndices()
+    changes = {"vertices": vertices * _MIRROR_X.astype(vertices.dtype)}
+    if normals is not None:
+        changes["normals"] = normals * _MIRROR_X.astype(normals.dtype)
+
+    if indices is not None:
+        changes["indices"] = numpy.ascontiguousarray(indices[:, ::-1])
+    else:
+        # Every three vertices make a face, reorder the per-vertex data
+        order = numpy.arange(len(vertices)).reshape(-1, 3)[:, ::-1].ravel()
+        changes["vertices"] = changes["vertices"][order]
+        if normals is not None:
+            changes["normals"] = changes["normals"][order]
+        colors = mesh_data.getColors()
+        if colors is not None:
+            changes["colors"] = colors[order]
+        uvs = mesh_data.getUVCoordinates()
+        if uvs is not None:
+            changes["uvs"] = uvs[order]
+    return mesh_data.set(**changes)
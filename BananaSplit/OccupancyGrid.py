@@ -0,0 +1,182 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import List, Optional
+
+import numpy
+
+
+class OccupancyGrid:
+    """Cells of the build plate covered by something, for finding room for a new node. Points are X
+    and Z world coordinates, columns go along X and rows along Z. Polygons are rasterized
+    conservatively: every cell they touch is taken.
+
+    Free spots for a rectangle are looked up from a summed-area table, so checking a spot costs the
+    same no matter how big the rectangle is. The search starts from the target and grows outwards
+    until the closest free spot is known.
+    """
+
+    # Cells are at least this big in millimeters, and there are at most this many of them per side
+    MIN_CELL_SIZE = 1.0
+    MAX_SIDE_CELLS = 512
+
+    # First search radius around the target in cells, doubled until a free spot turns up
+    SEARCH_RADIUS = 8
+
+    def __init__(self, minimum: numpy.ndarray, maximum: numpy.ndarray) -> None:
+        self._origin = numpy.asarray(minimum, dtype=numpy.float64)
+        extent = numpy.maximum(numpy.asarray(maximum, dtype=numpy.float64) - self._origin, 0.0)
+        self._cell_size = max(self.MIN_CELL_SIZE, float(extent.max()) / self.MAX_SIDE_CELLS)
+        columns, rows = numpy.maximum(numpy.floor(extent / self._cell_size).astype(numpy.int64), 1)
+        self._cells = numpy.zeros((rows, columns), dtype=bool)
+        self._table = None  # type: Optional[numpy.ndarray]
+
+    def getCellSize(self) -> float:
+        return self._cell_size
+
+    def addPolygons(self, polygons: List[numpy.ndarray]) -> None:
+        """Take the cells covered by convex polygons, given as (N, 2) arrays of points in order."""
+        polygons = [polygon for polygon in polygons if len(polygon)]
+        if not polygons:
+            return
+        rows, columns = self._cells.shape
+        counts = numpy.array([len(polygon) for polygon in polygons])
+        points = (numpy.concatenate(polygons) - self._origin) / self._cell_size
+
+        # Edges from every point to the next one of the same polygon
+        starts = numpy.cumsum(counts) - counts
+        following = numpy.arange(len(points)) + 1
+        following[starts + counts - 1] = starts
+        polygon_index = numpy.repeat(numpy.arange(len(polygons)), counts)
+        a, b = points, points[following]
+        low = numpy.minimum(a[:, 1], b[:, 1])
+        high = numpy.maximum(a[:, 1], b[:, 1])
+
+        # Every row an edge passes through, clipped to the grid
+        first_row = numpy.maximum(numpy.floor(low), 0).astype(numpy.int64)
+        last_row = numpy.minimum(numpy.floor(high), rows - 1).astype(numpy.int64)
+        row_counts = numpy.maximum(last_row - first_row + 1, 0)
+        edge = numpy.repeat(numpy.arange(len(points)), row_counts)
+        if not len(edge):
+            return
+        offsets = numpy.repeat(numpy.cumsum(row_counts) - row_counts, row_counts)
+        row = first_row[edge] + numpy.arange(len(edge)) - offsets
+
+        # Extent of the edge along X where it crosses the row
+        a, b = a[edge], b[edge]
+        rise = b[:, 1] - a[:, 1]
+        flat = rise == 0.0
+        slope = numpy.divide(b[:, 0] - a[:, 0], rise, out=numpy.zeros(len(edge)), where=~flat)
+        x_low = a[:, 0] + slope * (numpy.maximum(row, low[edge]) - a[:, 1])
+        x_high = a[:, 0] + slope * (numpy.minimum(row + 1, high[edge]) - a[:, 1])
+        x_low, x_high = numpy.minimum(x_low, x_high), numpy.maximum(x_low, x_high)
+        x_low = numpy.where(flat, numpy.minimum(a[:, 0], b[:, 0]), x_low)
+        x_high = numpy.where(flat, numpy.maximum(a[:, 0], b[:, 0]), x_high)
+
+        # A convex polygon covers one span of every row it passes through, numbered from its first row
+        polygon_first_row = numpy.maximum(numpy.floor(numpy.minimum.reduceat(points[:, 1], starts)), 0)
+        polygon_last_row = numpy.minimum(numpy.floor(numpy.maximum.reduceat(points[:, 1], starts)), rows - 1)
+        span_counts = numpy.maximum(polygon_last_row - polygon_first_row + 1, 0).astype(numpy.int64)
+        span_offsets = numpy.cumsum(span_counts) - span_counts
+        polygon = polygon_index[edge]
+        key = span_offsets[polygon] + row - polygon_first_row[polygon].astype(numpy.int64)
+        span_low = numpy.full(int(span_counts.sum()), numpy.inf)
+        span_high = numpy.full(len(span_low), -numpy.inf)
+        numpy.minimum.at(span_low, key, x_low)
+        numpy.maximum.at(span_high, key, x_high)
+        span_row = numpy.repeat(polygon_first_row.astype(numpy.int64) - span_offsets, span_counts)
+        span_row += numpy.arange(len(span_low))
+        first_column = numpy.maximum(numpy.floor(span_low), 0)
+        last_column = numpy.minimum(numpy.floor(span_high), columns - 1)
+        inside = first_column <= last_column
+        span_row = span_row[inside]
+        first_column, last_column = first_column[inside].astype(numpy.int64), last_column[inside].astype(numpy.int64)
+
+        # Spans are added up as steps along each row
+        steps = numpy.zeros((rows, columns + 1), dtype=numpy.int32)
+        numpy.add.at(steps, (span_row, first_column), 1)
+        numpy.add.at(steps, (span_row, last_column + 1), -1)
+        self._cells |= numpy.cumsum(steps, axis=1)[:, :columns] > 0
+        self._table = None
+
+    def addRectangle(self, minimum: numpy.ndarray, maximum: numpy.ndarray) -> None:
+        """Take the cells covered by an axis aligned rectangle."""
+        first, last = self._cellRange(minimum, maximum)
+        self._cells[first[1] : last[1], first[0] : last[0]] = True
+        self._table = None
+
+    def isFree(self, minimum: numpy.ndarray, maximum: numpy.ndarray) -> bool:
+        """True if the rectangle is on the grid and covers only free cells."""
+        minimum, maximum = numpy.asarray(minimum, dtype=numpy.float64), numpy.asarray(maximum, dtype=numpy.float64)
+        end = self._origin + numpy.array(self._cells.shape[::-1]) * self._cell_size
+        if (minimum < self._origin).any() or (maximum > end).any():
+            return False
+        first, last = self._cellRange(minimum, maximum)
+        return not self._cells[first[1] : last[1], first[0] : last[0]].any()
+
+    def findFree(
+        self, minimum: numpy.ndarray, maximum: numpy.ndarray, target: numpy.ndarray
+    ) -> Optional[numpy.ndarray]:
+        """Position closest to target where the rectangle from minimum to maximum, relative to the
+        position, is on the grid and covers only free cells, or None if it fits nowhere.
+        """
+        minimum, maximum = numpy.asarray(minimum, dtype=numpy.float64), numpy.asarray(maximum, dtype=numpy.float64)
+        target = numpy.asarray(target, dtype=numpy.float64)
+        if self.isFree(target + minimum, target + maximum):
+            return target
+
+        rows, columns = self._cells.shape
+        width, height = numpy.ceil((maximum - minimum) / self._cell_size - 1.0e-9).astype(numpy.int64)
+        width, height = max(int(width), 1), max(int(height), 1)
+        if width > columns or height > rows:
+            return None
+        table = self._summedAreaTable()
+
+        # Lower corner of the rectangle at the target, in cells
+        column, row = (target + minimum - self._origin) / self._cell_size
+        radius = self.SEARCH_RADIUS
+        while True:
+            distance = numpy.inf
+            row_first, row_last = max(int(row - radius), 0), min(int(numpy.ceil(row + radius)), rows - height)
+            column_first = max(int(column - radius), 0)
+            column_last = min(int(numpy.ceil(column + radius)), columns - width)
+            complete = (
+                row_first == 0 and column_first == 0 and row_last == rows - height and column_last == columns - width
+            )
+            if row_first <= row_last and column_first <= column_last:
+                i = slice(row_first, row_last + 1)
+                j = slice(column_first, column_last + 1)
+                i_end = slice(row_first + height, row_last + height + 1)
+                j_end = slice(column_first + width, column_last + width + 1)
+                covered = table[i_end, j_end] - table[i, j_end] - table[i_end, j] + table[i, j]
+                distances = (
+                    (numpy.arange(row_first, row_last + 1)[:, None] - row) ** 2
+                    + (numpy.arange(column_first, column_last + 1)[None, :] - column) ** 2
+                )
+                distances[covered > 0] = numpy.inf
+                best = int(numpy.argmin(distances))
+                distance = numpy.sqrt(distances.flat[best])
+                # Spots outside the window are further than the radius
+                if distance <= radius or (complete and numpy.isfinite(distance)):
+                    best_row, best_column = divmod(best, column_last - column_first + 1)
+                    corner = numpy.array([column_first + best_column, row_first + best_row], dtype=numpy.float64)
+                    return self._origin + corner * self._cell_size - minimum
+            if complete:
+                return None
+            radius = max(2 * radius, int(numpy.ceil(distance)) if numpy.isfinite(distance) else 0)
+
+    def _cellRange(self, minimum: numpy.ndarray, maximum: numpy.ndarray):
+        # Cells touched by the rectangle, as first and one past the last (column, row)
+        rows, columns = self._cells.shape
+        first = numpy.floor((numpy.asarray(minimum) - self._origin) / self._cell_size).astype(numpy.int64)
+        last = numpy.ceil((numpy.asarray(maximum) - self._origin) / self._cell_size).astype(numpy.int64)
+        limit = numpy.array([columns, rows])
+        return numpy.clip(first, 0, limit), numpy.clip(last, 0, limit)
+
+    def _summedAreaTable(self) -> numpy.ndarray:
+        # Taken cells below and left of every grid corner
+        if self._table is None:
+            rows, columns = self._cells.shape
+            self._table = numpy.zeros((rows + 1, columns + 1), dtype=numpy.int32)
+            numpy.cumsum(numpy.cumsum(self._cells, axis=0, dtype=numpy.int32), axis=1, out=self._table[1:, 1:])
+        return self._table
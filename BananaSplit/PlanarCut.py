@@ -0,0 +1,363 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Cutting triangle meshes in two along a plane. Clipping is vectorized over all triangles, and the
+cut is closed with a triangulated cap on both halves, so watertight input stays watertight.
+
+Triangles are (N, 3, 3) arrays and keep their winding. A plane is given by normal and offset, and
+points with normal . p + offset >= 0 are above it.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy
+
+
+def meshTriangles(vertices: numpy.ndarray, indices: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """Triangle soup of indexed or non-indexed mesh data."""
+    vertices = numpy.asarray(vertices, dtype=numpy.float64)
+    if indices is not None:
+        return vertices[numpy.asarray(indices).reshape(-1, 3)]
+    return vertices.reshape(-1, 3, 3)
+
+
+def planeFromTransformation(world: numpy.ndarray) -> Tuple[numpy.ndarray, float]:
+    """Build plate plane (world y = 0) in the local space of a node with the given world transformation."""
+    world = numpy.asarray(world, dtype=numpy.float64)
+    return world[1, :3].copy(), float(world[1, 3])
+
+
+def cutTriangles(
+    triangles: numpy.ndarray, normal: numpy.ndarray, offset: float
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Cut triangles in two along the plane. Returns capped upper and lower halves."""
+    upper, lower, segments = clipTriangles(triangles, normal, offset)
+    cap = capTriangles(segments, normal)
+    return numpy.concatenate((upper, cap[:, ::-1])), numpy.concatenate((lower, cap))
+
+
+def clipTriangles(
+    triangles: numpy.ndarray, normal: numpy.ndarray, offset: float
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Split triangles into the parts above and below the plane. Also returns the cut segments,
+    directed so that they run along the boundary of the lower half's cap.
+    """
+    triangles = numpy.asarray(triangles, dtype=numpy.float64)
+    distances = triangles @ numpy.asarray(normal, dtype=numpy.float64) + offset
+    above = distances >= 0.0
+    above_count = above.sum(axis=1)
+
+    upper = [triangles[above_count == 3]]
+    lower = [triangles[above_count == 0]]
+    segments = [numpy.empty((0, 2, 3))]
+
+    for count in (1, 2):
+        mask = above_count == count
+        if not mask.any():
+            continue
+
+        # Roll every triangle so that the vertex alone on its side comes first. Rolling keeps winding.
+        lone = above[mask] if count == 1 else ~above[mask]
+        order = (numpy.argmax(lone, axis=1)[:, None] + numpy.arange(3)) % 3
+        rows = numpy.arange(len(order))[:, None]
+        rolled = triangles[mask][rows, order]
+        rolled_distances = distances[mask][rows, order]
+        a, b, c = rolled[:, 0], rolled[:, 1], rolled[:, 2]
+        da, db, dc = rolled_distances[:, 0], rolled_distances[:, 1], rolled_distances[:, 2]
+
+        if count == 1:
+            p_ab = _intersect(a, b, da, db)
+            p_ac = _intersect(a, c, da, dc)
+            upper.append(numpy.stack((a, p_ab, p_ac), axis=1))
+            lower.append(numpy.stack((p_ab, b, c), axis=1))
+            lower.append(numpy.stack((p_ab, c, p_ac), axis=1))
+            segments.append(numpy.stack((p_ab, p_ac), axis=1))
+        else:
+            p_ab = _intersect(b, a, db, da)
+            p_ac = _intersect(c, a, dc, da)
+            lower.append(numpy.stack((a, p_ab, p_ac), axis=1))
+            upper.append(numpy.stack((p_ab, b, c), axis=1))
+            upper.append(numpy.stack((p_ab, c, p_ac), axis=1))
+            segments.append(numpy.stack((p_ac, p_ab), axis=1))
+
+    segments = numpy.concatenate(segments)
+    segments = segments[numpy.any(segments[:, 0] != segments[:, 1], axis=1)]
+    return _dropDegenerate(numpy.concatenate(upper)), _dropDegenerate(numpy.concatenate(lower)), segments
+
+
+def cutSegments(triangles: numpy.ndarray, normal: numpy.ndarray, offset: float) -> numpy.ndarray:
+    """The cut segments of clipTriangles without building the halves, for outlining a cut. Same
+    points and direction, though not in the same order.
+    """
+    triangles = numpy.asarray(triangles, dtype=numpy.float64)
+    distances = (triangles.reshape(-1, 3) @ numpy.asarray(normal, dtype=numpy.float64)).reshape(-1, 3) + offset
+    above = distances >= 0.0
+    above_count = above[:, 0] * 1 + above[:, 1] + above[:, 2]
+    crossing = numpy.nonzero((above_count == 1) | (above_count == 2))[0]
+    if not len(crossing):
+        return numpy.empty((0, 2, 3))
+    single = above_count[crossing] == 1
+
+    # Corners in the same roll as in clipTriangles, the vertex alone on its side first
+    lone = numpy.argmax(above[crossing] == single[:, None], axis=1)
+    base = crossing * 3
+    a, b, c = base + lone, base + (lone + 1) % 3, base + (lone + 2) % 3
+    corners = triangles.reshape(-1, 3)
+    corner_distances = distances.reshape(-1)
+
+    def intersect(first: numpy.ndarray, second: numpy.ndarray) -> numpy.ndarray:
+        # From the vertex above to the one below, like clipTriangles
+        u = numpy.where(single, first, second)
+        v = numpy.where(single, second, first)
+        return _intersect(corners[u], corners[v], corner_distances[u], corner_distances[v])
+
+    p_ab = intersect(a, b)
+    p_ac = intersect(a, c)
+    start = numpy.where(single[:, None], p_ab, p_ac)
+    end = numpy.where(single[:, None], p_ac, p_ab)
+    segments = numpy.stack((start, end), axis=1)
+    return segments[numpy.any(segments[:, 0] != segments[:, 1], axis=1)]
+
+
+def capTriangles(segments: numpy.ndarray, normal: numpy.ndarray) -> numpy.ndarray:
+    """Triangulate the closed loops formed by cut segments. The cap faces along the plane normal,
+    i.e. it closes the lower half. Open chains (from non-manifold input) are left uncapped.
+    """
+    if len(segments) == 0:
+        return numpy.empty((0, 3, 3))
+
+    # Shared cut points are bit-identical (see _intersect), so exact matching is enough
+    points, inverse = numpy.unique(segments.reshape(-1, 3), axis=0, return_inverse=True)
+    edges = inverse.reshape(-1, 2)
+    loops = _chainLoops(edges)
+    if not loops:
+        return numpy.empty((0, 3, 3))
+
+    # Plane coordinates with u x v = normal, so that the cap boundary runs counterclockwise
+    normal = numpy.asarray(normal, dtype=numpy.float64)
+    normal = normal / numpy.linalg.norm(normal)
+    helper = numpy.array([1.0, 0.0, 0.0]) if abs(normal[0]) < 0.9 else numpy.array([0.0, 1.0, 0.0])
+    u = numpy.cross(helper, normal)
+    u = u / numpy.linalg.norm(u)
+    v = numpy.cross(normal, u)
+    points_2d = numpy.stack((points @ u, points @ v), axis=1)
+
+    triangles = _triangulateLoops(points_2d, loops)
+    if not triangles:
+        return numpy.empty((0, 3, 3))
+    return points[numpy.array(triangles)]
+
+
+def vertexNormals(triangles: numpy.ndarray) -> numpy.ndarray:
+    """Flat per-vertex normals for a triangle soup, shaped like its vertex array."""
+    normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+    normals = normals / numpy.where(lengths > 0.0, lengths, 1.0)
+    return numpy.repeat(normals, 3, axis=0)
+
+
+def crossSection(segments: numpy.ndarray) -> Tuple[float, float]:
+    """Area and perimeter of the regions bounded by cut segments lying on the build plate. The
+    segments run along the boundaries consistently, so the area is a shoelace sum over them in any
+    order, holes included.
+    """
+    if len(segments) == 0:
+        return 0.0, 0.0
+    start = segments[:, 0]
+    end = segments[:, 1]
+    area = 0.5 * abs(float(numpy.sum(start[:, 0] * end[:, 2] - end[:, 0] * start[:, 2])))
+    perimeter = float(numpy.linalg.norm(end - start, axis=1).sum())
+    return area, perimeter
+
+
+def _intersect(u: numpy.ndarray, v: numpy.ndarray, du: numpy.ndarray, dv: numpy.ndarray) -> numpy.ndarray:
+    # Always interpolated from the vertex above (u) to the one below (v), so both triangles sharing an
+    # edge get bit-identical cut points
+    t = du / (du - dv)
+    return u + (v - u) * t[:, None]
+
+
+def _dropDegenerate(triangles: numpy.ndarray) -> numpy.ndarray:
+    # Cutting exactly through vertices leaves zero area slivers
+    cross = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    return triangles[numpy.any(cross != 0.0, axis=1)]
+
+
+def _chainLoops(edges: numpy.ndarray) -> List[List[int]]:
+    edge_list = edges.tolist()
+    outgoing = {}
+    for index, (start, _) in enumerate(edge_list):
+        outgoing.setdefault(start, []).append(index)
+
+    used = [False] * len(edge_list)
+    loops = []
+    for first in range(len(edge_list)):
+        if used[first]:
+            continue
+        loop = []
+        edge = first
+        closed = False
+        while edge is not None and not used[edge]:
+            used[edge] = True
+            start, end = edge_list[edge]
+            loop.append(start)
+            if end == loop[0]:
+                closed = True
+                break
+            edge = next((e for e in outgoing.get(end, ()) if not used[e]), None)
+        if closed and len(loop) >= 3:
+            loops.append(loop)
+    return loops
+
+
+def _signedArea(points_2d: numpy.ndarray, loop: List[int]) -> float:
+    x, y = points_2d[loop, 0], points_2d[loop, 1]
+    return 0.5 * float(numpy.dot(x, numpy.roll(y, -1)) - numpy.dot(numpy.roll(x, -1), y))
+
+
+def _pointInLoop(points_2d: numpy.ndarray, loop: List[int], point: numpy.ndarray) -> bool:
+    p = points_2d[loop]
+    q = numpy.roll(p, -1, axis=0)
+    crossing = (p[:, 1] > point[1]) != (q[:, 1] > point[1])
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        x = p[:, 0] + (point[1] - p[:, 1]) * (q[:, 0] - p[:, 0]) / (q[:, 1] - p[:, 1])
+    return bool(numpy.count_nonzero(crossing & (x > point[0])) % 2)
+
+
+def _triangulateLoops(points_2d: numpy.ndarray, loops: List[List[int]]) -> List[Tuple[int, int, int]]:
+    areas = [_signedArea(points_2d, loop) for loop in loops]
+    outers = [i for i, area in enumerate(areas) if area > 0.0]
+    holes = {i: [] for i in outers}
+
+    # Every hole goes to the smallest outer loop around it
+    for i, area in enumerate(areas):
+        if area >= 0.0:
+            continue
+        point = points_2d[loops[i][0]]
+        containing = [j for j in outers if _pointInLoop(points_2d, loops[j], point)]
+        if containing:
+            holes[min(containing, key=lambda j: areas[j])].append(loops[i])
+
+    triangles = []
+    for i in outers:
+        polygon = loops[i]
+        # Rightmost holes first, so that bridges never cross each other
+        for hole in sorted(holes[i], key=lambda hole: -points_2d[hole, 0].max()):
+            polygon = _bridgeHole(points_2d, polygon, hole)
+        triangles.extend(_earClip(points_2d, polygon))
+    return triangles
+
+
+def _bridgeHole(points_2d: numpy.ndarray, polygon: List[int], hole: List[int]) -> List[int]:
+    """Merge hole into polygon through a pair of coincident edges (as in earcut)."""
+    hole_start = int(numpy.argmax(points_2d[hole, 0]))
+    hx, hy = points_2d[hole[hole_start]]
+
+    p = points_2d[polygon]
+    q = numpy.roll(p, -1, axis=0)
+    crossing = ((p[:, 1] - hy) * (q[:, 1] - hy) <= 0.0) & (p[:, 1] != q[:, 1])
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        x = p[:, 0] + (hy - p[:, 1]) * (q[:, 0] - p[:, 0]) / (q[:, 1] - p[:, 1])
+    candidates = numpy.flatnonzero(crossing & (x >= hx))
+
+    if len(candidates) == 0:
+        # Shouldn't happen for a hole inside the polygon, connect to the nearest vertex instead
+        bridge = int(numpy.argmin(numpy.sum((p - (hx, hy)) ** 2, axis=1)))
+    else:
+        edge = int(candidates[numpy.argmin(x[candidates])])
+        ix = x[edge]
+        next_index = (edge + 1) % len(polygon)
+        bridge = edge if p[edge, 0] >= p[next_index, 0] else next_index
+
+        # Vertices inside the triangle between hole, ray hit and bridge would block the bridge.
+        # Pick the one closest in angle to the ray instead.
+        a, b, c = numpy.array([hx, hy]), numpy.array([ix, hy]), p[bridge]
+        inside = _pointsInTriangle(p, a, b, c) & (p[:, 0] > hx)
+        inside[bridge] = False
+        if inside.any():
+            blocking = numpy.flatnonzero(inside)
+            tangents = numpy.abs(p[blocking, 1] - hy) / (p[blocking, 0] - hx)
+            bridge = int(blocking[numpy.argmin(tangents)])
+
+    hole = hole[hole_start:] + hole[:hole_start]
+    return polygon[: bridge + 1] + hole + [hole[0]] + polygon[bridge:]
+
+
+def _pointsInTriangle(points: numpy.ndarray, a: numpy.ndarray, b: numpy.ndarray, c: numpy.ndarray) -> numpy.ndarray:
+    def side(p0, p1):
+        return (p1[0] - p0[0]) * (points[:, 1] - p0[1]) - (p1[1] - p0[1]) * (points[:, 0] - p0[0])
+
+    s1, s2, s3 = side(a, b), side(b, c), side(c, a)
+    return ((s1 >= 0) & (s2 >= 0) & (s3 >= 0)) | ((s1 <= 0) & (s2 <= 0) & (s3 <= 0))
+
+
+def _earClip(points_2d: numpy.ndarray, polygon: List[int]) -> List[Tuple[int, int, int]]:
+    """Ear clipping of a counterclockwise polygon. Only reflex vertices can lie inside an ear, so
+    ear tests only look at those, which keeps typical cut outlines close to linear time.
+    """
+    count = len(polygon)
+    if count < 3:
+        return []
+    coords = [tuple(point) for point in points_2d[polygon].tolist()]
+    previous = [(i - 1) % count for i in range(count)]
+    following = [(i + 1) % count for i in range(count)]
+
+    def cross(p: int, i: int, n: int) -> float:
+        (ax, ay), (bx, by), (cx, cy) = coords[p], coords[i], coords[n]
+        return (bx - ax) * (cy - by) - (by - ay) * (cx - bx)
+
+    reflex = {i for i in range(count) if cross(previous[i], i, following[i]) <= 0.0}
+
+    def isEar(p: int, i: int, n: int) -> bool:
+        if i in reflex:
+            return False
+        a, b, c = coords[p], coords[i], coords[n]
+        min_x, max_x = min(a[0], b[0], c[0]), max(a[0], b[0], c[0])
+        min_y, max_y = min(a[1], b[1], c[1]), max(a[1], b[1], c[1])
+        for r in reflex:
+            point = coords[r]
+            if point[0] < min_x or point[0] > max_x or point[1] < min_y or point[1] > max_y:
+                continue
+            # Bridges duplicate vertices, which touch the triangle without being inside of it
+            if r == p or r == n or point == a or point == b or point == c:
+                continue
+            if _pointInTriangle(point, a, b, c):
+                return False
+        return True
+
+    triangles = []
+    remaining = count
+    i = 0
+    stalled = 0
+    while remaining > 3:
+        p, n = previous[i], following[i]
+
+        # Give up on finding a proper ear once every vertex has been tried
+        if isEar(p, i, n) or stalled > remaining:
+            triangles.append((polygon[p], polygon[i], polygon[n]))
+            following[p] = n
+            previous[n] = p
+            reflex.discard(i)
+            remaining -= 1
+            stalled = 0
+            # Neighbours may turn convex
+            for j in (p, n):
+                if j in reflex and cross(previous[j], j, following[j]) > 0.0:
+                    reflex.discard(j)
+            i = n
+        else:
+            stalled += 1
+            i = n
+
+    triangles.append((polygon[previous[i]], polygon[i], polygon[following[i]]))
+    return triangles
+
+
+def _pointInTriangle(
+    point: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float], c: Tuple[float, float]
+) -> bool:
+    px, py = point
+    s1 = (b[0] - a[0]) * (py - a[1]) - (b[1] - a[1]) * (px - a[0])
+    s2 = (c[0] - b[0]) * (py - b[1]) - (c[1] - b[1]) * (px - b[0])
+    s3 = (a[0] - c[0]) * (py - c[1]) - (a[1] - c[1]) * (px - c[0])
+    return s1 >= 0.0 and s2 >= 0.0 and s3 >= 0.0
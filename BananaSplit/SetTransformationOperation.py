@@ -1,16 +1,18 @@
 # Copyright (c) 2023 jarrrgh.
 # This tool is released under the terms of the AGPLv3 or higher.
 
-from typing import Optional
+from BananaSplit.ZeesawProfiler import ZeesawProfiler
+from typing import Optional, Union
 from UM.Logger import Logger
 from UM.Math.Matrix import Matrix
-from UM.Operations.GroupedOperation import GroupedOperation
 from UM.Operations.Operation import Operation
 from UM.Scene.SceneNode import SceneNode
 
 
 class SetTransformationOperation(Operation):
-    """Operation that simply sets a transformation to a node."""
+    """Operation that simply sets a transformation to a node. Within the operation stack's merge
+    window it merges with a preceding transformation of the same node.
+    """
 
     def __init__(self, node: SceneNode, new_transformation: Matrix, old_transformation: Optional[Matrix] = None):
         super().__init__()
@@ -18,22 +20,38 @@ class SetTransformationOperation(Operation):
         if old_transformation:
             self._old_transformation = old_transformation
         else:
-            self._old_transformation = node.getWorldTransformation()
+            self._old_transformation = node.getLocalTransformation()
         self._new_transformation = new_transformation
 
     def undo(self) -> None:
         #Logger.debug("undo {}".format(self))
+        ZeesawProfiler.getInstance().count("setTransformation")
         self._node.setTransformation(self._old_transformation)
 
     def redo(self) -> None:
         #Logger.debug("redo {}".format(self))
+        ZeesawProfiler.getInstance().count("setTransformation")
         self._node.setTransformation(self._new_transformation)
 
-    def mergeWith(self, other: Operation) -> GroupedOperation:
-        group = GroupedOperation()
-        group.addOperation(other)
-        group.addOperation(self)
-        return group
+    def mergeWith(self, other: Operation) -> Union["SetTransformationOperation", bool]:
+        """Collapse two transformations of the same node into one that goes from the first old
+        transformation straight to the last new one. Anything else doesn't merge.
+        """
+        if type(other) is not SetTransformationOperation or other._node is not self._node:
+            return False
+
+        # The operation stack asks the newer operation to merge with the older one, while grouped
+        # operations ask the other way around
+        if self._new_transformation == other._old_transformation:
+            first, last = self, other
+        elif other._new_transformation == self._old_transformation:
+            first, last = other, self
+        elif other._timestamp <= self._timestamp:
+            first, last = other, self
+        else:
+            first, last = self, other
+
+        return SetTransformationOperation(self._node, last._new_transformation, first._old_transformation)
 
     def __repr__(self):
         return "SetTransformationOp.(node={0})".format(self._node)
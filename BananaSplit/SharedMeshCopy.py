@@ -0,0 +1,60 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Copying scene nodes without duplicating their mesh buffers, and sharing the buffers of equal meshes."""
+
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
+from UM.Scene.SceneNode import SceneNode
+
+import copy
+import numpy
+
+
+def deepcopySharingMeshes(node: SceneNode) -> SceneNode:
+    """Deep copy a node (and its children) so that the copy references the same mesh data. Only
+    per-node state such as transformation, decorators and settings gets copied.
+
+    Sharing is safe, because MeshData is immutable: its arrays are read-only and every change
+    creates a new MeshData through setMeshData. That makes it copy-on-write for free, the other
+    node keeps the original buffers.
+    """
+    memo = {}
+    for child in DepthFirstIterator(node):
+        for mesh_data in (child.getMeshData(), getattr(child, "source_mesh_data", None)):
+            if mesh_data is not None:
+                # Deepcopy returns whatever memo already has for an object
+                memo[id(mesh_data)] = mesh_data
+    return copy.deepcopy(node, memo)
+
+
+def meshDataEqual(mesh_data: MeshData, other: MeshData) -> bool:
+    """True if both meshes hold the same buffers, value for value."""
+    if mesh_data is other:
+        return True
+    if mesh_data.getVertexCount() != other.getVertexCount() or mesh_data.getFaceCount() != other.getFaceCount():
+        return False
+    getters = ("getVertices", "getNormals", "getIndices", "getColors", "getUVCoordinates")
+    for getter in getters:
+        data, other_data = getattr(mesh_data, getter)(), getattr(other, getter)()
+        if (data is None) != (other_data is None):
+            return False
+        if data is not None and (data.dtype != other_data.dtype or not numpy.array_equal(data, other_data)):
+            return False
+    return True
+
+
+def shareEqualMesh(node: SceneNode, other: SceneNode) -> bool:
+    """Give other the mesh data of node if they are equal, so that both draw from the same buffers.
+    Nodes loaded from a file get meshes of their own even if those are copies. Returns True if the
+    mesh data is shared now.
+    """
+    mesh_data, other_mesh_data = node.getMeshData(), other.getMeshData()
+    if mesh_data is None or other_mesh_data is None:
+        return False
+    if mesh_data is other_mesh_data:
+        return True
+    if not meshDataEqual(mesh_data, other_mesh_data):
+        return False
+    other.setMeshData(mesh_data)
+    return True
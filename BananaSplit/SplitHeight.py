@@ -0,0 +1,159 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Finding a good height to split a mesh at. Candidate planes are swept across the height of the mesh
+and scored all at once from cumulative histograms over the triangles, so the cost is a few passes
+over the mesh no matter how many candidates there are.
+
+Triangles are (N, 3, 3) arrays with outward winding, in the local space of a node with the given
+world transformation. Heights are world y, which is what the user sees as Z. Every score is an area
+in square millimeters.
+"""
+
+from typing import Optional, Tuple
+
+import numpy
+
+# Faces leaning more than this from vertical need support, like Cura's default support angle
+OVERHANG_ANGLE = 45.0
+# Faces closer than this to level make ragged caps when the plane passes through them
+LEVEL_ANGLE = 20.0
+
+
+def scoreSplitHeights(
+    triangles: numpy.ndarray, world: Optional[numpy.ndarray] = None, candidate_count: int = 256, margin: float = 0.05
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Score candidate_count planes evenly spaced between the bottom and top of the triangles, leaving
+    margin of the height out at both ends. Returns the heights and, per height, the cross-section
+    area, the area of nearly level surface the plane passes through, and the overhang area of both
+    halves put cut side down on the build plate.
+    """
+    triangles = numpy.asarray(triangles)
+    world = numpy.identity(4) if world is None else numpy.asarray(world, dtype=numpy.float64)
+    corners = [triangles[:, index] @ world[1, :3] + world[1, 3] for index in range(3)]
+    low = numpy.minimum(numpy.minimum(corners[0], corners[1]), corners[2])
+    high = numpy.maximum(numpy.maximum(corners[0], corners[1]), corners[2])
+    middle = corners[0] + corners[1] + corners[2] - low - high
+
+    bottom, top = float(low.min()), float(high.max())
+    first, last = bottom + margin * (top - bottom), top - margin * (top - bottom)
+    candidates = numpy.linspace(first, last, candidate_count)
+    step = max((last - first) / (candidate_count - 1), 1.0e-9)
+
+    # Normals turn to world space with the inverse transpose, and back outwards if the node is mirrored
+    u, v = triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    cross = numpy.stack(
+        [
+            u[:, 1] * v[:, 2] - u[:, 2] * v[:, 1],
+            u[:, 2] * v[:, 0] - u[:, 0] * v[:, 2],
+            u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0],
+        ],
+        axis=1,
+    )
+    cofactors = numpy.linalg.inv(world[:3, :3]) * abs(numpy.linalg.det(world[:3, :3]))
+    cross = (cross @ cofactors.astype(cross.dtype)).astype(numpy.float64)
+    areas = 0.5 * numpy.sqrt(numpy.einsum("ij,ij->i", cross, cross))
+    slopes = numpy.divide(0.5 * cross[:, 1], areas, out=numpy.zeros(len(areas)), where=areas > 0.0)
+    below = _AreaBelow(low, middle, high, candidates, step)
+
+    # The part of a closed surface below a plane and the cross-section close a solid, so the cross-
+    # section is minus the area of that surface projected on the plane
+    area = below.sum(-0.5 * cross[:, 1])
+
+    # Level surface the plane passes through, within half a step
+    level = numpy.abs(slopes) > numpy.cos(numpy.radians(LEVEL_ANGLE))
+    flatness = _cumulative(low[level] - 0.5 * step, areas[level], candidates, step)
+    flatness -= _cumulative(high[level] + 0.5 * step, areas[level], candidates, step, inclusive=False)
+
+    # The upper half keeps its orientation, so faces pointing down overhang. The lower half is turned
+    # over, so the ones pointing up do.
+    steep = numpy.cos(numpy.radians(OVERHANG_ANGLE))
+    down = numpy.where(slopes < -steep, areas, 0.0)
+    up = numpy.where(slopes > steep, areas, 0.0)
+    overhang = down.sum() + below.sum(up - down)
+
+    return candidates, numpy.maximum(area, 0.0), numpy.maximum(flatness, 0.0), numpy.maximum(overhang, 0.0)
+
+
+def findSplitHeight(
+    triangles: numpy.ndarray, world: Optional[numpy.ndarray] = None, candidate_count: int = 256
+) -> Optional[float]:
+    """Height with the most gluing surface left after what the cap and overhangs cost, or None if
+    there is nothing to split.
+    """
+    if len(triangles) == 0:
+        return None
+    candidates, area, flatness, overhang = scoreSplitHeights(triangles, world, candidate_count)
+    if candidates[-1] <= candidates[0]:
+        return None
+    return float(candidates[numpy.argmax(area - flatness - overhang)])
+
+
+class _AreaBelow:
+    """Sums of per-triangle quantities over the part of each triangle below every candidate height.
+
+    The area of a triangle spreads over its height like a tent, rising linearly from the lowest corner
+    to the middle one and falling to the highest. So the part below a height is quadratic in it
+    between corners, and the sum over all triangles is a sum of kinks at the corners that are zero
+    below them and quadratic above. Those add up in a histogram like point masses do. Ramps too short
+    to matter count as point masses, which keeps the kinks from growing without bounds.
+    """
+
+    # In steps between candidate heights
+    SHORT_RAMP = 1.0e-3
+
+    def __init__(
+        self, low: numpy.ndarray, middle: numpy.ndarray, high: numpy.ndarray, edges: numpy.ndarray, step: float
+    ) -> None:
+        self._edge_count = len(edges)
+        low, middle, high = ((heights - edges[0]) / step for heights in (low, middle, high))
+
+        rise, fall = middle - low, high - middle
+        span = rise + fall
+        rising, falling = rise >= self.SHORT_RAMP, fall >= self.SHORT_RAMP
+        rise_share = numpy.divide(rise, span, out=numpy.full(len(span), 0.5), where=span >= self.SHORT_RAMP)
+        fall_share = 1.0 - rise_share
+        rise_quadratic = numpy.divide(rise_share, rise * rise, out=numpy.zeros(len(rise)), where=rising)
+        fall_quadratic = numpy.divide(fall_share, fall * fall, out=numpy.zeros(len(fall)), where=falling)
+
+        # The middle corner ends the rising ramp and starts the falling one, or has short ones as points
+        constant = numpy.where(rising, 0.0, rise_share) + numpy.where(falling, 0.0, fall_share)
+        linear = 2.0 * (fall_quadratic * fall - rise_quadratic * rise)
+        quadratic = -rise_quadratic - fall_quadratic
+
+        # A kink at position x adds constant + linear * (k - x) + quadratic * (k - x) ** 2 to every edge k
+        # at or above it, which is p + a * k + q * k ** 2. Kinks are kept apart per corner.
+        self._kinks = [
+            (self._bins(low), rise_quadratic * low * low, -2.0 * rise_quadratic * low, rise_quadratic),
+            (
+                self._bins(middle),
+                constant + (quadratic * middle - linear) * middle,
+                linear - 2.0 * quadratic * middle,
+                quadratic,
+            ),
+            (self._bins(high), fall_quadratic * high * high, -2.0 * fall_quadratic * high, fall_quadratic),
+        ]
+
+    def sum(self, weights: numpy.ndarray) -> numpy.ndarray:
+        """Sum of weights, one per triangle, times the share of the triangle below each edge."""
+        edge = numpy.arange(self._edge_count, dtype=numpy.float64)
+        total = numpy.zeros(self._edge_count)
+        for bins, p, a, q in self._kinks:
+            for coefficients, power in ((p, 1.0), (a, edge), (q, edge * edge)):
+                counts = numpy.bincount(bins, weights=coefficients * weights, minlength=self._edge_count + 1)
+                total += power * numpy.cumsum(counts)[: self._edge_count]
+        return total
+
+    def _bins(self, positions: numpy.ndarray) -> numpy.ndarray:
+        # First edge at or above every position
+        return numpy.clip(numpy.ceil(positions), 0, self._edge_count).astype(numpy.int64)
+
+
+def _cumulative(
+    values: numpy.ndarray, weights: numpy.ndarray, edges: numpy.ndarray, step: float, inclusive: bool = True
+) -> numpy.ndarray:
+    # Sum of weights of values at or below each of the evenly spaced edges, or strictly below them
+    positions = (values - edges[0]) / step
+    bins = numpy.ceil(positions) if inclusive else numpy.floor(positions) + 1.0
+    bins = numpy.clip(bins, 0, len(edges)).astype(numpy.int64)
+    return numpy.cumsum(numpy.bincount(bins, weights=weights, minlength=len(edges) + 1))[: len(edges)]
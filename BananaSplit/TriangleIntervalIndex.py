@@ -0,0 +1,93 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import List
+
+import numpy
+
+
+class TriangleIntervalIndex:
+    """Index of the height intervals that triangles span along a direction, for finding the triangles
+    a plane at a given height cuts through without scanning the whole mesh.
+
+    It's an interval tree flattened into sorted arrays. Heights are split into 2 ** depth slabs, and
+    every triangle belongs to the lowest tree node whose range holds it. All triangles of a node
+    straddle the node's middle, so below the middle the ones starting low enough are a prefix of the
+    node sorted by minimum, and above it the ones reaching high enough a prefix of the node sorted by
+    maximum. A query walks one root to leaf path, which costs O(depth * log n + k) for k hits.
+    """
+
+    # Triangles per slab, roughly
+    SLAB_SIZE = 8
+
+    def __init__(self, triangles: numpy.ndarray, direction: numpy.ndarray) -> None:
+        heights = numpy.asarray(triangles, dtype=numpy.float64) @ numpy.asarray(direction, dtype=numpy.float64)
+        minimum = heights.min(axis=1)
+        maximum = heights.max(axis=1)
+
+        self._depth = max(int(numpy.ceil(numpy.log2(max(len(heights) / self.SLAB_SIZE, 1.0)))), 1)
+        self._bottom = float(minimum.min()) if len(heights) else 0.0
+        self._top = float(maximum.max()) if len(heights) else 0.0
+        self._slab_height = max(self._top - self._bottom, 1.0e-9) / (1 << self._depth)
+
+        # Lowest common ancestor of the slabs of both ends: its level is the highest differing bit
+        low_slab = self._slab(minimum)
+        high_slab = self._slab(maximum)
+        levels = numpy.zeros(len(heights), dtype=numpy.int64)
+        differing = low_slab ^ high_slab
+        while differing.any():
+            levels += differing > 0
+            differing >>= 1
+        nodes = self._nodeKeys(levels, low_slab >> levels)
+
+        by_minimum = numpy.lexsort((minimum, nodes))
+        by_maximum = numpy.lexsort((-maximum, nodes))
+        self._nodes = nodes[by_minimum]
+        self._by_minimum = by_minimum
+        self._minimum = minimum[by_minimum]
+        self._maximum_of_minimum = maximum[by_minimum]
+        self._by_maximum = by_maximum
+        self._negative_maximum = -maximum[by_maximum]
+
+    def getDepth(self) -> int:
+        return self._depth
+
+    def query(self, height: float) -> numpy.ndarray:
+        """Indices of the triangles that reach from below or at height to above or at it."""
+        if not len(self._nodes) or height < self._bottom or height > self._top:
+            return numpy.empty(0, dtype=numpy.int64)
+
+        slab = int(self._slab(numpy.array([height]))[0])
+        levels = numpy.arange(self._depth + 1)
+        keys = self._nodeKeys(levels, slab >> levels)
+        starts = numpy.searchsorted(self._nodes, keys, side="left").tolist()
+        ends = numpy.searchsorted(self._nodes, keys, side="right").tolist()
+
+        found = []  # type: List[numpy.ndarray]
+        for level, start, end in zip(range(self._depth + 1), starts, ends):
+            if start == end:
+                continue
+
+            if level == 0:
+                # A leaf holds triangles inside one slab, check both ends
+                inside = (self._minimum[start:end] <= height) & (self._maximum_of_minimum[start:end] >= height)
+                found.append(self._by_minimum[start:end][inside])
+                continue
+
+            middle = self._bottom + (((slab >> level) << level) + (1 << (level - 1))) * self._slab_height
+            if height < middle:
+                count = int(numpy.searchsorted(self._minimum[start:end], height, side="right"))
+                found.append(self._by_minimum[start : start + count])
+            else:
+                # Both sort orders group triangles by node the same way
+                count = int(numpy.searchsorted(self._negative_maximum[start:end], -height, side="right"))
+                found.append(self._by_maximum[start : start + count])
+        return numpy.concatenate(found) if found else numpy.empty(0, dtype=numpy.int64)
+
+    def _slab(self, heights: numpy.ndarray) -> numpy.ndarray:
+        slabs = numpy.floor((heights - self._bottom) / self._slab_height).astype(numpy.int64)
+        return numpy.clip(slabs, 0, (1 << self._depth) - 1)
+
+    def _nodeKeys(self, levels: numpy.ndarray, prefixes: numpy.ndarray) -> numpy.ndarray:
+        # Unique per node, ordered by level first
+        return levels * (1 << (self._depth + 1)) + prefixes
@@ -0,0 +1,68 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Mesh decimation by vertex clustering: vertices are snapped to a uniform grid, every occupied cell
+becomes one vertex at the mean of its members, and faces that collapse are dropped. Crude, but a
+single vectorized pass over the mesh, which is what a stand-in for dragging needs.
+"""
+
+from typing import Optional, Tuple
+
+import numpy
+
+
+def clusterCellSize(triangles: numpy.ndarray, face_count: int) -> float:
+    """Grid cell size that leaves about face_count faces. A closed surface has about twice as many
+    faces as vertices, and each cell covers about cell_size ** 2 of its area.
+    """
+    areas = numpy.linalg.norm(
+        numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]), axis=1
+    )
+    area = 0.5 * float(areas.sum())
+    return max(numpy.sqrt(area / max(face_count / 2.0, 1.0)), 1.0e-6)
+
+
+def clusterVertices(
+    vertices: numpy.ndarray, indices: Optional[numpy.ndarray], face_count: int
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Decimate indexed or non-indexed mesh data down to about face_count faces. Returns vertices and
+    indices of the clustered mesh. Winding is kept.
+    """
+    vertices = numpy.asarray(vertices, dtype=numpy.float64)
+    faces = numpy.asarray(indices).reshape(-1, 3) if indices is not None else numpy.arange(len(vertices)).reshape(-1, 3)
+    cell_size = clusterCellSize(vertices[faces], face_count)
+
+    # One integer key per occupied cell
+    cells = numpy.floor((vertices - vertices.min(axis=0)) / cell_size).astype(numpy.int64)
+    dimensions = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dimensions[1] + cells[:, 1]) * dimensions[2] + cells[:, 2]
+    _, clusters = numpy.unique(keys, return_inverse=True)
+    clusters = clusters.reshape(-1)
+
+    counts = numpy.bincount(clusters).astype(numpy.float64)
+    centers = numpy.stack([numpy.bincount(clusters, weights=vertices[:, axis]) for axis in range(3)], axis=1)
+    centers /= counts[:, None]
+
+    # Drop faces that collapsed into a line or point, and duplicates of the same three clusters
+    faces = clusters[faces]
+    faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])]
+    ordered = numpy.sort(faces, axis=1)
+    _, first = numpy.unique(ordered, axis=0, return_index=True)
+    faces = faces[numpy.sort(first)]
+    return centers, faces
+
+
+def indexedVertexNormals(vertices: numpy.ndarray, faces: numpy.ndarray) -> numpy.ndarray:
+    """Smooth normals of an indexed mesh: face normals summed per vertex, weighted by face area."""
+    triangles = vertices[faces]
+    face_normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    corners = faces.reshape(-1)
+    normals = numpy.stack(
+        [
+            numpy.bincount(corners, weights=numpy.repeat(face_normals[:, axis], 3), minlength=len(vertices))
+            for axis in range(3)
+        ],
+        axis=1,
+    )
+    lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+    return normals / numpy.where(lengths > 0.0, lengths, 1.0)
@@ -0,0 +1,101 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.PlanarCut import cutSegments, planeFromTransformation
+from BananaSplit.ZeesawContourJob import ZeesawContourJob
+from BananaSplit.ZeesawTransform import transformationKey
+from cura.CuraApplication import CuraApplication
+from typing import Callable, Optional
+from UM.Job import Job
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+
+import numpy
+import weakref
+
+
+class ZeesawContour:
+    """Cross-sections of nodes at the build plate, for previewing where a split would cut.
+
+    Finding the triangles that cross the plate goes through an interval index of the mesh, so a
+    node moving up and down only costs a lookup and clipping the triangles it hits. The index is
+    built once per mesh and direction of the plate in the mesh's space, which stays the same while
+    a node is only moved. Big meshes are indexed in the background, and on_ready is called once an
+    index is there.
+    """
+
+    # Meshes with more triangles than this are indexed in the background
+    BACKGROUND_FACE_COUNT = 50000
+
+    def __init__(self, on_ready: Callable[[], None]) -> None:
+        self._on_ready = on_ready
+        # (direction key, index) per mesh, and job in flight per mesh
+        self._indices = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+        self._jobs = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+    def requestIndex(self, node: SceneNode) -> None:
+        """Make sure the mesh of node is indexed for its current orientation."""
+        mesh_data = node.getMeshData()
+        if mesh_data is None:
+            return
+        normal, _ = planeFromTransformation(node.getWorldTransformation().getData())
+        key = transformationKey(normal)
+        indexed = self._indices.get(mesh_data)
+        if indexed is not None and indexed[0] == key:
+            return
+        job = self._jobs.get(mesh_data)
+        if job is not None and job.getKey() == key:
+            return
+
+        job = ZeesawContourJob(mesh_data, normal, key)
+        self._jobs[mesh_data] = job
+        if mesh_data.getFaceCount() > self.BACKGROUND_FACE_COUNT:
+            job.finished.connect(self._onJobFinished)
+            job.start()
+        else:
+            job.run()
+            self._apply(job, notify=False)
+
+    def getSegments(self, node: SceneNode) -> Optional[numpy.ndarray]:
+        """Cut segments of node at the build plate in world space, shape (n, 2, 3), or None if its mesh
+        is not indexed yet.
+        """
+        mesh_data = node.getMeshData()
+        if mesh_data is None:
+            return None
+        world = node.getWorldTransformation().getData()
+        normal, offset = planeFromTransformation(world)
+        indexed = self._indices.get(mesh_data)
+        if indexed is None or indexed[0] != transformationKey(normal):
+            return None
+
+        hits = indexed[1].query(-offset)
+        if len(hits) == 0:
+            return numpy.empty((0, 2, 3))
+        segments = cutSegments(self._triangles(mesh_data, hits), normal, offset)
+        return segments @ world[:3, :3].T + world[:3, 3]
+
+    def _triangles(self, mesh_data: MeshData, hits: numpy.ndarray) -> numpy.ndarray:
+        vertices = mesh_data.getVertices()
+        indices = mesh_data.getIndices()
+        if indices is not None:
+            return vertices[numpy.asarray(indices).reshape(-1, 3)[hits]]
+        # Gather the corners of the hits only
+        corners = (hits[:, None] * 3 + numpy.arange(3)).reshape(-1)
+        return vertices[corners].reshape(-1, 3, 3)
+
+    def _onJobFinished(self, job: Job) -> None:
+        # Finished is emitted from the worker thread
+        CuraApplication.getInstance().callLater(self._apply, job)
+
+    def _apply(self, job: ZeesawContourJob, notify: bool = True) -> None:
+        mesh_data = job.getMeshData()
+        if self._jobs.get(mesh_data) is not job:
+            return
+        del self._jobs[mesh_data]
+        if job.getResult() is None:
+            return
+        self._indices[mesh_data] = (job.getKey(), job.getResult())
+        if notify:
+            self._on_ready()
+
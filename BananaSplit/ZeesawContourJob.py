@@ -0,0 +1,31 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.PlanarCut import meshTriangles
+from BananaSplit.TriangleIntervalIndex import TriangleIntervalIndex
+from UM.Job import Job
+from UM.Mesh.MeshData import MeshData
+
+import numpy
+
+
+class ZeesawContourJob(Job):
+    """Builds the interval index of a mesh's triangles along the build plate normal in the mesh's
+    local space. The result is the TriangleIntervalIndex.
+    """
+
+    def __init__(self, mesh_data: MeshData, normal: numpy.ndarray, key: bytes) -> None:
+        super().__init__()
+        self._mesh_data = mesh_data
+        self._normal = normal
+        self._key = key
+
+    def getMeshData(self) -> MeshData:
+        return self._mesh_data
+
+    def getKey(self) -> bytes:
+        return self._key
+
+    def run(self) -> None:
+        triangles = meshTriangles(self._mesh_data.getVertices(), self._mesh_data.getIndices())
+        self.setResult(TriangleIntervalIndex(triangles, self._normal))
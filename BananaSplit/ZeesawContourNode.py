@@ -0,0 +1,63 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.ZeesawProfiler import ZeesawProfiler
+from typing import Optional
+from UM.Application import Application
+from UM.Math.Color import Color
+from UM.Mesh.MeshData import MeshData
+from UM.Resources import Resources
+from UM.Scene.SceneNode import SceneNode
+from UM.View.GL.OpenGL import OpenGL
+from UM.View.RenderBatch import RenderBatch
+
+import numpy
+
+
+class ZeesawContourNode(SceneNode):
+    """Outline of where the build plate cuts the selection, shown before splitting. Segments are
+    given in world space and drawn as lines on top of everything.
+    """
+
+    def __init__(self, parent: Optional[SceneNode] = None) -> None:
+        self._name = "ZeesawContourNode"
+        super().__init__(parent)
+
+        self._scene = Application.getInstance().getController().getScene()
+        self._visible = False
+
+        # Kept apart from the node's mesh data, so that new outlines don't count as scene changes
+        self._line_mesh = None  # type: Optional[MeshData]
+        self._shader = None
+        self.setCalculateBoundingBox(False)
+
+    def setSegments(self, segments: Optional[numpy.ndarray]) -> None:
+        if segments is None or len(segments) == 0:
+            self._line_mesh = None
+            self.setVisible(False)
+            return
+        self._line_mesh = MeshData(vertices=segments.reshape(-1, 3).astype(numpy.float32))
+        self.setVisible(True)
+
+    def setVisible(self, visible: bool) -> None:
+        # New segments show up on the next render, a scene change is only due when the outline appears or goes
+        if visible == self._visible:
+            return
+        super().setVisible(visible)
+        self._scene.sceneChanged.emit(self)
+
+    @ZeesawProfiler.profile("ZeesawContourNode.render")
+    def render(self, renderer) -> bool:
+        if not self.isVisible() or self._line_mesh is None:
+            return True
+
+        if not self._shader:
+            self._shader = OpenGL.getInstance().createShaderProgram(
+                Resources.getPath(Resources.Shaders, "color.shader")
+            )
+            self._shader.setUniformValue("u_color", Color(255, 140, 0, 255))
+
+        renderer.queueNode(
+            self, mesh=self._line_mesh, mode=RenderBatch.RenderMode.Lines, overlay=True, shader=self._shader
+        )
+        return True
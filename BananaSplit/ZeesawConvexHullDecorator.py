@@ -0,0 +1,204 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.ZeesawTransform import transformationKey, zeesawBounds, zeesawHullPoints, zeesawTransformation
+from cura.CuraApplication import CuraApplication
+from cura.Scene.ConvexHullDecorator import ConvexHullDecorator
+from typing import Optional
+from UM.Math.AxisAlignedBox import AxisAlignedBox
+from UM.Math.Polygon import Polygon
+from UM.Math.Vector import Vector
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+from UM.Scene.SceneNodeDecorator import SceneNodeDecorator
+
+import numpy
+import weakref
+
+
+class ZeesawConvexHullDecorator(ConvexHullDecorator):
+    """Convex hull decorator for the linked end of a zeesaw. As long as the node shares its mesh
+    with the other end, or carries its cached mirror image, and sits in the zeesaw transformation of
+    it, its convex hull and bounding box are derived from the other end's instead of being computed
+    from the mesh again.
+
+    Results are cached against a version that is bumped whenever either node is transformed or gets
+    new mesh data, so repeated lookups within one event cost nothing. Only the public getConvexHull
+    is overridden, anything else Cura asks the decorator for comes from the mesh as usual.
+
+    It takes the place of Cura's decorator on the node, which would otherwise answer getConvexHull
+    first. Either decorator is released when it is removed, see releaseConvexHullDecorator.
+    """
+
+    def __init__(self, linked_node: SceneNode) -> None:
+        super().__init__()
+        self._linked_node = weakref.ref(linked_node)
+        linked_node.transformationChanged.connect(self._onZeesawChanged)
+        linked_node.meshDataChanged.connect(self._onZeesawMeshDataChanged)
+
+        self._version = 0
+        self._derivable_version = None  # type: Optional[int]
+        self._derivable = False
+        self._bbox_version = None  # type: Optional[int]
+        self._bbox = None  # type: Optional[AxisAlignedBox]
+        # Full mesh of either node as last seen, to tell proxy swaps from real changes
+        self._full_meshes = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+        self._full_meshes[linked_node] = self._fullMesh(linked_node)
+
+    def setNode(self, node: SceneNode) -> None:
+        super().setNode(node)
+        node.transformationChanged.connect(self._onZeesawChanged)
+        node.meshDataChanged.connect(self._onZeesawMeshDataChanged)
+        self._full_meshes[node] = self._fullMesh(node)
+
+    def clear(self) -> None:
+        """Called by Uranium when the decorator is removed from its node."""
+        for node in (self._linked_node(), self._node):
+            if node is not None:
+                node.transformationChanged.disconnect(self._onZeesawChanged)
+                node.meshDataChanged.disconnect(self._onZeesawMeshDataChanged)
+        releaseConvexHullDecorator(self)
+
+    def getZeesawBoundingBox(self) -> Optional[AxisAlignedBox]:
+        if self._bbox_version != self._version:
+            self._bbox = self._deriveBoundingBox() if self._isDerivable() else None
+            self._bbox_version = self._version
+        if self._bbox is not None:
+            return self._bbox
+        return self._node.getBoundingBox() if self._node else None
+
+    def isZeesawHullDerived(self) -> bool:
+        """True if the hull comes from the other end instead of this node's mesh."""
+        return self._isDerivable()
+
+    def getConvexHull(self) -> Optional[Polygon]:
+        if self._isDerivable():
+            # Like Cura, modifier and blocker meshes have no hull
+            if self._node.callDecoration("isNonPrintingMesh"):
+                return None
+            hull = self._deriveConvexHull()
+            if hull is not None:
+                return hull
+        return super().getConvexHull()
+
+    def _deriveConvexHull(self) -> Optional[Polygon]:
+        linked_node = self._linked_node()
+        hull = linked_node.callDecoration("getConvexHull")
+        if hull is None or len(hull.getPoints()) < 3:
+            return None
+        points = zeesawHullPoints(
+            hull.getPoints(), self._worldPosition(linked_node), self._worldPosition(self._node), self._isMirrored()
+        )
+        return Polygon(points)
+
+    def _deriveBoundingBox(self) -> Optional[AxisAlignedBox]:
+        linked_bbox = self._linked_node().getBoundingBox()
+        if linked_bbox is None:
+            return None
+        minimum, maximum = zeesawBounds(
+            numpy.array([linked_bbox.minimum.x, linked_bbox.minimum.y, linked_bbox.minimum.z]),
+            numpy.array([linked_bbox.maximum.x, linked_bbox.maximum.y, linked_bbox.maximum.z]),
+            self._worldPosition(self._linked_node()),
+            self._worldPosition(self._node),
+            self._isMirrored(),
+        )
+        return AxisAlignedBox(minimum=Vector(*minimum), maximum=Vector(*maximum))
+
+    def _isDerivable(self) -> bool:
+        if self._derivable_version != self._version:
+            self._derivable = self._checkDerivable()
+            self._derivable_version = self._version
+        return self._derivable
+
+    def _checkDerivable(self) -> bool:
+        node = self._node
+        linked_node = self._linked_node()
+        if node is None or linked_node is None or linked_node.getParent() is None:
+            return False
+        # Trimmed halves or groups don't share the geometry. A proxy shown for dragging stands in for
+        # the full mesh
+        mesh_data = node.callDecoration("getZeesawFullMesh") or node.getMeshData()
+        linked_mesh_data = linked_node.callDecoration("getZeesawFullMesh") or linked_node.getMeshData()
+        if mesh_data is None or linked_mesh_data is None or node.getChildren():
+            return False
+        mirrored = self._isMirrored()
+        if mirrored:
+            # Either end may carry the mirror image
+            if (
+                node.callDecoration("getZeesawMirrorSource") is not linked_mesh_data
+                and linked_node.callDecoration("getZeesawMirrorSource") is not mesh_data
+            ):
+                return False
+        elif mesh_data is not linked_mesh_data:
+            return False
+        # Avoid deriving back and forth
+        if linked_node.getDecorator(ZeesawConvexHullDecorator) is not None:
+            return False
+        if not self._isSymmetricHull():
+            return False
+        expected = zeesawTransformation(
+            linked_node.getWorldTransformation().getData(), self._worldPosition(node), mirrored
+        )
+        return transformationKey(expected) == transformationKey(node.getWorldTransformation().getData())
+
+    def _isSymmetricHull(self) -> bool:
+        # One at a time hulls include the print head, and shrinkage scales hulls around the scene
+        # center. Neither turns along with the zeesaw.
+        global_stack = CuraApplication.getInstance().getGlobalContainerStack()
+        if global_stack is None:
+            return True
+        if global_stack.getProperty("print_sequence", "value") == "one_at_a_time":
+            return False
+        for key in ("material_shrinkage_percentage_xy", "material_shrinkage_percentage"):
+            value = global_stack.getProperty(key, "value")
+            if value is not None:
+                return value == 100.0
+        return True
+
+    def _isMirrored(self) -> bool:
+        return bool(self._node and self._node.callDecoration("isZeesawMirrored"))
+
+    def _worldPosition(self, node: SceneNode) -> numpy.ndarray:
+        position = node.getWorldPosition()
+        return numpy.array([position.x, position.y, position.z])
+
+    def _onZeesawMeshDataChanged(self, node: SceneNode) -> None:
+        # Proxies shown while dragging stand in for the full mesh, which doesn't change
+        full_mesh = self._fullMesh(node)
+        if node in self._full_meshes and self._full_meshes[node] is full_mesh:
+            return
+        self._full_meshes[node] = full_mesh
+        self._onZeesawChanged()
+
+    def _fullMesh(self, node: SceneNode) -> Optional[MeshData]:
+        return node.callDecoration("getZeesawFullMesh") or node.getMeshData()
+
+    def _onZeesawChanged(self, *args) -> None:
+        self._version += 1
+        # The hull follows the other end too, not only this node
+        if self._node:
+            self.recomputeConvexHullDelayed()
+
+    # Copies are not linked anymore
+    def __deepcopy__(self, memo) -> ConvexHullDecorator:
+        return ConvexHullDecorator()
+
+
+def releaseConvexHullDecorator(decorator: ConvexHullDecorator) -> None:
+    """Disconnect a convex hull decorator removed from its node. Cura's decorator has no teardown of
+    its own, so it would keep recomputing the hull of its former node and keep its hull shadow in the
+    scene. Without a node, whatever still reaches it only drops the shadow.
+    """
+    node = decorator.getNode()
+    if node is not None:
+        node.boundingBoxChanged.disconnect(decorator._onChanged)
+    application = CuraApplication.getInstance()
+    application.getController().toolOperationStarted.disconnect(decorator._onChanged)
+    application.getController().toolOperationStopped.disconnect(decorator._onChanged)
+    build_volume = application.getBuildVolume()
+    if build_volume is not None:
+        build_volume.raftThicknessChanged.disconnect(decorator._onChanged)
+    if decorator._recompute_convex_hull_timer is not None:
+        decorator._recompute_convex_hull_timer.stop()
+    SceneNodeDecorator.setNode(decorator, None)
+    decorator.recomputeConvexHull()
@@ -0,0 +1,31 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import Optional
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNodeDecorator import SceneNodeDecorator
+
+
+class ZeesawCutDecorator(SceneNodeDecorator):
+    """A decorator that keeps the untrimmed mesh of a cut node, so that it can be cut again at
+    another height or restored.
+    """
+
+    def __init__(self, source_mesh: MeshData) -> None:
+        super().__init__()
+        self._source_mesh = source_mesh
+        self._cut_key = None  # type: Optional[bytes]
+
+    def getZeesawSourceMesh(self) -> MeshData:
+        return self._source_mesh
+
+    def getZeesawCutKey(self) -> Optional[bytes]:
+        """Key of the plane the current mesh was cut at."""
+        return self._cut_key
+
+    def setZeesawCutKey(self, key: Optional[bytes]) -> None:
+        self._cut_key = key
+
+    # Copies share the source mesh, but have to be cut again
+    def __deepcopy__(self, memo) -> "ZeesawCutDecorator":
+        return ZeesawCutDecorator(self._source_mesh)
@@ -0,0 +1,79 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.MirrorMesh import mirrorTriangles
+from BananaSplit.PlanarCut import capTriangles, clipTriangles, meshTriangles, vertexNormals
+from UM.Job import Job
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+
+import numpy
+
+
+class ZeesawCutJob(Job):
+    """Cuts the source mesh of a linked pair along the build plate plane. The result is a tuple of
+    (upper, lower) mesh data for the selected and linked node respectively, or None if cancelled.
+    With mirror, the lower half is mirrored for a linked node that is the mirror image of the selected.
+    """
+
+    def __init__(
+        self,
+        selected_node: SceneNode,
+        linked_node: SceneNode,
+        source_mesh: MeshData,
+        normal: numpy.ndarray,
+        offset: float,
+        key: bytes,
+        mirror: bool = False,
+    ) -> None:
+        super().__init__()
+        self._selected_node = selected_node
+        self._linked_node = linked_node
+        self._source_mesh = source_mesh
+        self._normal = normal
+        self._offset = offset
+        self._key = key
+        self._mirror = mirror
+        self._cancelled = False
+
+    def getSelectedNode(self) -> SceneNode:
+        return self._selected_node
+
+    def getLinkedNode(self) -> SceneNode:
+        return self._linked_node
+
+    def getKey(self) -> bytes:
+        return self._key
+
+    def isMirrored(self) -> bool:
+        return self._mirror
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def isCancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self) -> None:
+        triangles = meshTriangles(self._source_mesh.getVertices(), self._source_mesh.getIndices())
+        upper, lower, segments = clipTriangles(triangles, self._normal, self._offset)
+        if self._cancelled:
+            return
+
+        # Capping is the slow part
+        cap = capTriangles(segments, self._normal)
+        if self._cancelled:
+            return
+
+        upper = numpy.concatenate((upper, cap[:, ::-1]))
+        lower = numpy.concatenate((lower, cap))
+        if self._mirror:
+            lower = mirrorTriangles(lower)
+        self.setResult((self._buildMesh(upper), self._buildMesh(lower)))
+
+    def _buildMesh(self, triangles: numpy.ndarray) -> MeshData:
+        return MeshData(
+            vertices=triangles.reshape(-1, 3).astype(numpy.float32),
+            normals=vertexNormals(triangles).astype(numpy.float32),
+            file_name=self._source_mesh.getFileName(),
+        )
@@ -0,0 +1,31 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import TYPE_CHECKING
+from UM.Operations.Operation import Operation
+from UM.Scene.SceneNode import SceneNode
+
+if TYPE_CHECKING:
+    from BananaSplit.ZeesawCutter import ZeesawCutter
+
+
+class ZeesawCutOperation(Operation):
+    """Operation that trims a linked pair at the build plate. Undo puts the untrimmed meshes back, so
+    undoing a split in trim mode leaves the original whole.
+    """
+
+    def __init__(self, cutter: "ZeesawCutter", selected_node: SceneNode, linked_node: SceneNode) -> None:
+        super().__init__()
+        self._cutter = cutter
+        self._selected_node = selected_node
+        self._linked_node = linked_node
+
+    def undo(self) -> None:
+        self._cutter.removeCut(self._selected_node)
+        self._cutter.removeCut(self._linked_node)
+
+    def redo(self) -> None:
+        self._cutter.addCut(self._selected_node, self._linked_node)
+
+    def __repr__(self):
+        return "ZeesawCutOp.(node={0})".format(self._selected_node)
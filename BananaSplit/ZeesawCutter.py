@@ -0,0 +1,110 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.PlanarCut import planeFromTransformation
+from BananaSplit.ZeesawCutDecorator import ZeesawCutDecorator
+from BananaSplit.ZeesawCutJob import ZeesawCutJob
+from BananaSplit.ZeesawTransform import transformationKey
+from cura.CuraApplication import CuraApplication
+from typing import Dict, Optional
+from UM.Job import Job
+from UM.JobQueue import JobQueue
+from UM.Scene.SceneNode import SceneNode
+
+import numpy
+
+# Plane (normal and offset) of a mirrored linked node relative to the selected node's
+_MIRROR_PLANE_SIGNS = numpy.array([1.0, -1.0, -1.0, -1.0])
+
+
+class ZeesawCutter:
+    """Trims a linked pair to the halves above and below the build plate: the selected node keeps
+    the upper half and the linked node gets the lower one. Big meshes are cut in a background job.
+    Requesting a new cut of a pair cancels the one in flight for it, so only the latest cut is ever
+    applied. Pairs are cut independently of each other.
+    """
+
+    # Meshes with more triangles than this are cut in the background
+    BACKGROUND_FACE_COUNT = 50000
+
+    def __init__(self) -> None:
+        # Job in flight per selected node
+        self._jobs = {}  # type: Dict[SceneNode, ZeesawCutJob]
+
+    def addCut(self, selected_node: SceneNode, linked_node: SceneNode) -> None:
+        """Start trimming a linked pair. Each node keeps its current mesh as source, which is the same
+        mesh for both unless they are mirror images. Nodes trimmed already keep their untrimmed source.
+        """
+        source_mesh = selected_node.callDecoration("getZeesawSourceMesh") or selected_node.getMeshData()
+        if source_mesh is None:
+            return
+        linked_source_mesh = linked_node.callDecoration("getZeesawSourceMesh") or linked_node.getMeshData()
+        for node, node_source_mesh in ((selected_node, source_mesh), (linked_node, linked_source_mesh or source_mesh)):
+            if not node.hasDecoration("getZeesawSourceMesh"):
+                node.addDecorator(ZeesawCutDecorator(node_source_mesh))
+        self.requestCut(selected_node, linked_node)
+
+    def removeCut(self, node: SceneNode) -> None:
+        """Restore the untrimmed mesh."""
+        source_mesh = node.callDecoration("getZeesawSourceMesh")
+        if source_mesh is None:
+            return
+        for job in list(self._jobs.values()):
+            if node in (job.getSelectedNode(), job.getLinkedNode()):
+                self.cancel(job.getSelectedNode())
+        node.removeDecorator(ZeesawCutDecorator)
+        node.setMeshData(source_mesh)
+
+    def requestCut(self, selected_node: SceneNode, linked_node: SceneNode) -> None:
+        """Cut again, if the plane has moved relative to the selected node."""
+        source_mesh = selected_node.callDecoration("getZeesawSourceMesh")
+        if source_mesh is None or not linked_node.hasDecoration("getZeesawSourceMesh"):
+            return
+
+        normal, offset = planeFromTransformation(selected_node.getWorldTransformation().getData())
+        key = transformationKey(numpy.append(normal, offset))
+        if key == selected_node.callDecoration("getZeesawCutKey"):
+            return
+
+        self.cancel(selected_node)
+        mirror = bool(selected_node.callDecoration("isZeesawMirrored"))
+        job = ZeesawCutJob(selected_node, linked_node, source_mesh, normal, offset, key, mirror)
+        self._jobs[selected_node] = job
+        if source_mesh.getFaceCount() > self.BACKGROUND_FACE_COUNT:
+            job.finished.connect(self._onJobFinished)
+            job.start()
+        else:
+            job.run()
+            self._apply(job)
+
+    def cancel(self, selected_node: Optional[SceneNode] = None) -> None:
+        """Cancel the cut in flight for a pair, or all of them."""
+        nodes = [selected_node] if selected_node else list(self._jobs)
+        for node in nodes:
+            job = self._jobs.pop(node, None)
+            if job:
+                job.cancel()
+                JobQueue.getInstance().remove(job)
+
+    def _onJobFinished(self, job: Job) -> None:
+        # Finished is emitted from the worker thread
+        CuraApplication.getInstance().callLater(self._apply, job)
+
+    def _apply(self, job: ZeesawCutJob) -> None:
+        if self._jobs.get(job.getSelectedNode()) is not job or job.isCancelled():
+            return
+        del self._jobs[job.getSelectedNode()]
+
+        result = job.getResult()
+        if result is None:
+            return
+        upper_mesh, lower_mesh = result
+        selected_node = job.getSelectedNode()
+        linked_node = job.getLinkedNode()
+
+        # The linked node sees the same plane from the other side, and a mirror image with X flipped
+        signs = _MIRROR_PLANE_SIGNS if job.isMirrored() else -1.0
+        selected_node.callDecoration("setZeesawCutKey", job.getKey())
+        linked_node.callDecoration("setZeesawCutKey", transformationKey(numpy.frombuffer(job.getKey()) * signs))
+        selected_node.setMeshData(upper_mesh)
+        linked_node.setMeshData(lower_mesh)
@@ -0,0 +1,91 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.ZeesawProxyJob import ZeesawProxyJob
+from cura.CuraApplication import CuraApplication
+from typing import Dict, Optional
+from UM.Job import Job
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+
+import weakref
+
+
+class ZeesawLevelOfDetail:
+    """Swaps big linked meshes for decimated proxies while they are being dragged around, and puts the
+    full meshes back when the drag ends. Cura holds back slicing until then, so swapping meshes mid-drag
+    doesn't slice a proxy or start an extra slice.
+
+    Proxies are built once per mesh in a background job and cached against the full mesh data, which is
+    immutable, so a mesh that doesn't change is never decimated twice. Until its proxy is ready, a node
+    is dragged at full detail. Only nodes whose hull is derived from the other end get a proxy, so no
+    hull is ever computed from one. The full mesh of a swapped node is kept on its link decorator.
+    """
+
+    # Meshes with more triangles than this are dragged as proxies
+    PROXY_FACE_COUNT = 200000
+    # Triangles in a proxy, roughly
+    TARGET_FACE_COUNT = 50000
+
+    def __init__(self) -> None:
+        self._proxies = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+        self._jobs = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+        # Full mesh per node that currently shows a proxy
+        self._swapped = {}  # type: Dict[SceneNode, MeshData]
+
+    def requestProxy(self, node: SceneNode) -> None:
+        """Show a proxy of node for the drag in progress, until restore is called."""
+        if node in self._swapped:
+            return
+
+        mesh_data = node.getMeshData()
+        if mesh_data is None or mesh_data.getFaceCount() <= self.PROXY_FACE_COUNT or node.getChildren():
+            return
+        # Trimmed nodes get new meshes from the cutter as they move
+        if node.hasDecoration("getZeesawSourceMesh"):
+            return
+        # Cura would compute the hull from the proxy, and again from the full mesh after the drag
+        if not node.callDecoration("isZeesawHullDerived"):
+            return
+
+        proxy = self._proxies.get(mesh_data)
+        if proxy is None:
+            self._startJob(mesh_data)
+            return
+        self._swapped[node] = mesh_data
+        node.callDecoration("setZeesawFullMesh", mesh_data)
+        node.setMeshData(proxy)
+
+    def restore(self) -> None:
+        """Put the full meshes back. Nodes that got new mesh data meanwhile keep it."""
+        swapped, self._swapped = self._swapped, {}
+        for node, mesh_data in swapped.items():
+            node.callDecoration("setZeesawFullMesh", None)
+            if node.getMeshData() is self._proxies.get(mesh_data):
+                node.setMeshData(mesh_data)
+
+    def isSwapped(self, node: SceneNode) -> bool:
+        return node in self._swapped
+
+    def getProxy(self, mesh_data: MeshData) -> Optional[MeshData]:
+        return self._proxies.get(mesh_data)
+
+    def _startJob(self, mesh_data: MeshData) -> None:
+        if mesh_data in self._jobs:
+            return
+        job = ZeesawProxyJob(mesh_data, self.TARGET_FACE_COUNT)
+        self._jobs[mesh_data] = job
+        job.finished.connect(self._onJobFinished)
+        job.start()
+
+    def _onJobFinished(self, job: Job) -> None:
+        # Finished is emitted from the worker thread
+        CuraApplication.getInstance().callLater(self._apply, job)
+
+    def _apply(self, job: ZeesawProxyJob) -> None:
+        mesh_data = job.getMeshData()
+        if self._jobs.get(mesh_data) is not job:
+            return
+        del self._jobs[mesh_data]
+        if job.getResult() is not None:
+            self._proxies[mesh_data] = job.getResult()
@@ -1,21 +1,83 @@
 # Copyright (c) 2023 jarrrgh.
 # This tool is released under the terms of the AGPLv3 or higher.
 
+from BananaSplit.MirrorMesh import mirrorMeshData
+from BananaSplit.ZeesawLinkMetadata import clearLinkMetadata, writeLinkMetadata
 from typing import Optional
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
 from UM.Scene.SceneNodeDecorator import SceneNodeDecorator
 
 
 class ZeesawLinkDecorator(SceneNodeDecorator):
-    """A decorator that stores a link to the other end of the zeesaw."""
+    """A decorator that stores a link to the other end of the zeesaw, and whether the ends are mirror
+    images of each other. Both ends have stable ids, which are mirrored into the node's metadata to
+    get saved in projects. The mirrored mesh of the node is cached here against the mesh it was made
+    from, so it's computed again only when that mesh changes. While the node shows a proxy for
+    dragging, its full mesh is kept here too.
+    """
 
-    def __init__(self, node_id: Optional[int]) -> None:
+    def __init__(self, node_id: Optional[str], linked_node_id: Optional[str] = None, mirrored: bool = False) -> None:
         super().__init__()
-        self._linked_node_id = node_id
+        self._node_id = node_id
+        self._linked_node_id = linked_node_id
+        self._mirrored = mirrored
+        self._mirror_source = None  # type: Optional[MeshData]
+        self._mirror_mesh = None  # type: Optional[MeshData]
+        self._full_mesh = None  # type: Optional[MeshData]
 
-    def zeesawLinkedNodeId(self) -> Optional[int]:
+    def setNode(self, node: SceneNode) -> None:
+        super().setNode(node)
+        self._writeMetadata()
+
+    def zeesawNodeId(self) -> Optional[str]:
+        return self._node_id
+
+    def zeesawLinkedNodeId(self) -> Optional[str]:
         return self._linked_node_id
 
-    # Skip copying the node id as a way of breaking the link
+    def isZeesawMirrored(self) -> bool:
+        return self._mirrored
+
+    def setZeesawMirrored(self, mirrored: bool) -> None:
+        self._mirrored = mirrored
+        self._writeMetadata()
+
+    def getZeesawMirroredMesh(self, source_mesh: MeshData) -> MeshData:
+        """Mirror image of source_mesh. Mirroring the cached image back gives the source."""
+        if source_mesh is self._mirror_mesh and self._mirror_source is not None:
+            return self._mirror_source
+        if source_mesh is not self._mirror_source:
+            self._mirror_source = source_mesh
+            self._mirror_mesh = mirrorMeshData(source_mesh)
+        return self._mirror_mesh
+
+    def getZeesawMirrorSource(self) -> Optional[MeshData]:
+        """Mesh that the node's full mesh is the cached mirror image of, if any."""
+        if self._mirror_mesh is not None and self.getZeesawFullMesh() is self._mirror_mesh:
+            return self._mirror_source
+        return None
+
+    def getZeesawFullMesh(self) -> Optional[MeshData]:
+        """Mesh of the node at full detail, even while a proxy is shown."""
+        if self._full_mesh is not None:
+            return self._full_mesh
+        node = self.getNode()
+        return node.getMeshData() if node is not None else None
+
+    def setZeesawFullMesh(self, mesh_data: Optional[MeshData]) -> None:
+        self._full_mesh = mesh_data
+
+    def _writeMetadata(self) -> None:
+        node = self.getNode()
+        if node is None:
+            return
+        if self._node_id and self._linked_node_id:
+            writeLinkMetadata(node, self._node_id, self._linked_node_id, self._mirrored)
+        else:
+            clearLinkMetadata(node)
+
+    # Skip copying the ids as a way of breaking the link. The copy clears them from its node's metadata.
     def __deepcopy__(self, memo) -> "ZeesawLinkDecorator":
         copied_decorator = ZeesawLinkDecorator(None)
         return copied_decorator
@@ -0,0 +1,42 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Zeesaw links kept in the per-object metadata of scene nodes. Cura writes that metadata into project
+(3MF) files and reads it back on load, so links survive saving. 3MF metadata is strings, and Cura
+versions without node metadata simply don't persist links.
+"""
+
+from typing import Optional, Tuple
+from UM.Scene.SceneNode import SceneNode
+
+NODE_ID_KEY = "banana_split_node_id"
+LINKED_NODE_ID_KEY = "banana_split_linked_node_id"
+MIRRORED_KEY = "banana_split_mirrored"
+
+
+def writeLinkMetadata(node: SceneNode, node_id: str, linked_node_id: str, mirrored: bool) -> None:
+    metadata = getattr(node, "metadata", None)
+    if metadata is not None:
+        metadata[NODE_ID_KEY] = node_id
+        metadata[LINKED_NODE_ID_KEY] = linked_node_id
+        metadata[MIRRORED_KEY] = "true" if mirrored else "false"
+
+
+def clearLinkMetadata(node: SceneNode) -> None:
+    metadata = getattr(node, "metadata", None)
+    if metadata is not None:
+        for key in (NODE_ID_KEY, LINKED_NODE_ID_KEY, MIRRORED_KEY):
+            metadata.pop(key, None)
+
+
+def readLinkMetadata(node: SceneNode) -> Optional[Tuple[str, str, bool]]:
+    """Id of node, id of the node it's linked to and whether they mirror each other, or None."""
+    metadata = getattr(node, "metadata", None)
+    if not metadata or NODE_ID_KEY not in metadata or LINKED_NODE_ID_KEY not in metadata:
+        return None
+    # Projects read back wrap values in metadata entries
+    node_id, linked_node_id, mirrored = (
+        str(getattr(metadata.get(key), "value", metadata.get(key)))
+        for key in (NODE_ID_KEY, LINKED_NODE_ID_KEY, MIRRORED_KEY)
+    )
+    return node_id, linked_node_id, mirrored == "true"
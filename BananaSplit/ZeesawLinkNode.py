@@ -1,9 +1,11 @@
 # Copyright (c) 2023 jarrrgh.
 # This tool is released under the terms of the AGPLv3 or higher.
 
+from BananaSplit.ZeesawProfiler import ZeesawProfiler
 from typing import Optional
 from UM.Application import Application
 from UM.Math.Color import Color
+from UM.Math.Matrix import Matrix
 from UM.Math.Vector import Vector
 from UM.Mesh.MeshData import MeshData
 from UM.PluginRegistry import PluginRegistry
@@ -11,6 +13,7 @@ from UM.Resources import Resources
 from UM.Scene.SceneNode import SceneNode
 from UM.View.GL.OpenGL import OpenGL
 
+import numpy
 import os
 
 
@@ -28,12 +31,16 @@ class ZeesawLinkNode(SceneNode):
 
         self._link_mesh = None
         self._shader = None
+
+        # Link mesh turned towards the camera, cached per camera orientation
+        self._billboard_mesh = None
+        self._billboard_key = None
         self.setCalculateBoundingBox(False)
-        Application.getInstance().engineCreatedSignal.connect(self._onEngineCreated)
 
     def updatePosition(self, selected_node: SceneNode, linked_node: SceneNode) -> None:
-        s_bbox = selected_node.getBoundingBox()
-        l_bbox = linked_node.getBoundingBox()
+        # Linked node may derive its box from the selected node instead of the mesh
+        s_bbox = selected_node.callDecoration("getZeesawBoundingBox") or selected_node.getBoundingBox()
+        l_bbox = linked_node.callDecoration("getZeesawBoundingBox") or linked_node.getBoundingBox()
         y = max(s_bbox.top, l_bbox.top) + 3.0
         s_top_center = Vector(s_bbox.center.x, y, s_bbox.center.z)
         l_top_center = Vector(l_bbox.center.x, y, l_bbox.center.z)
@@ -43,10 +50,24 @@ class ZeesawLinkNode(SceneNode):
             return
         self.setPosition(position, transform_space=SceneNode.TransformSpace.World)
 
+    def loadMesh(self) -> None:
+        """Load the link mesh, unless already loaded. It ships as an array of vertices ready to draw, made
+        from link.stl by build_resources.py.
+        """
+        if self._link_mesh is not None:
+            return
+        path = os.path.join(PluginRegistry.getInstance().getPluginPath("BananaSplit"), "resources", "link.npy")
+        self._link_mesh = MeshData(vertices=numpy.load(path))
+        self._billboard_key = None
+
     def setVisible(self, visible: bool) -> None:
+        # Scene changes invalidate slicing and hulls, so only emit for real changes
+        if visible == self._visible:
+            return
         super().setVisible(visible)
         self._scene.sceneChanged.emit(self)
 
+    @ZeesawProfiler.profile("ZeesawLinkNode.render")
     def render(self, renderer) -> bool:
         if not self.isVisible():
             return True
@@ -58,21 +79,25 @@ class ZeesawLinkNode(SceneNode):
             self._shader.setUniformValue("u_color", Color(50, 130, 255, 255))
             self._shader.setUniformValue("u_opacity", 0)
 
-        active_camera = self._scene.getActiveCamera()
-        if active_camera:
-            self.setOrientation(-active_camera.getOrientation())
-
-        if self._link_mesh:
-            renderer.queueNode(self, mesh=self._link_mesh, overlay=True, shader=self._shader)
+        mesh = self._getBillboardMesh()
+        if mesh:
+            renderer.queueNode(self, mesh=mesh, overlay=True, shader=self._shader)
 
         return True
 
-    def _loadMesh(self, filename: str, scale: float = 1.0) -> Optional[MeshData]:
-        path = os.path.join(PluginRegistry.getInstance().getPluginPath("BananaSplit"), "resources", filename)
-        reader = Application.getInstance().getMeshFileHandler().getReaderForFile(path)
-        node = reader.read(path)
-        node.scale(Vector(scale, scale, scale))
-        return node.getMeshDataTransformed()
-
-    def _onEngineCreated(self) -> None:
-        self._link_mesh = self._loadMesh("link.stl", 0.3)
+    def _getBillboardMesh(self) -> Optional[MeshData]:
+        """Link mesh rotated to face the camera. Rotating the mesh instead of the node keeps the
+        scene untouched while rendering, and it's redone only when the camera turns.
+        """
+        active_camera = self._scene.getActiveCamera()
+        if not self._link_mesh or not active_camera:
+            return self._link_mesh
+
+        orientation = active_camera.getOrientation()
+        key = (orientation.x, orientation.y, orientation.z, orientation.w)
+        if key != self._billboard_key:
+            rotation = Matrix()
+            rotation.setByQuaternion(-orientation)
+            self._billboard_mesh = self._link_mesh.getTransformed(rotation)
+            self._billboard_key = key
+        return self._billboard_mesh
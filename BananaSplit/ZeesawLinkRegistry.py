@@ -0,0 +1,37 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import Optional
+from UM.Scene.SceneNode import SceneNode
+
+import weakref
+
+
+class ZeesawLinkRegistry:
+    """Index from the stable id of each end of a zeesaw link to its node. Entries are weak references,
+    so the registry never keeps removed nodes alive. Nodes taken out of the scene, e.g. by deleting or
+    undoing, keep their entries and resolve again once they are put back.
+    """
+
+    def __init__(self) -> None:
+        self._nodes = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+
+    def link(self, node1: SceneNode, node2: SceneNode) -> None:
+        for node in (node1, node2):
+            node_id = node.callDecoration("zeesawNodeId")
+            if node_id:
+                self._nodes[node_id] = node
+
+    def unlink(self, node: SceneNode) -> None:
+        node_id = node.callDecoration("zeesawNodeId")
+        if node_id and self._nodes.get(node_id) is node:
+            del self._nodes[node_id]
+
+    def findNode(self, node_id: Optional[str]) -> Optional[SceneNode]:
+        return self._nodes.get(node_id) if node_id else None
+
+    def findLinkedNode(self, node: SceneNode) -> Optional[SceneNode]:
+        linked_node = self.findNode(node.callDecoration("zeesawLinkedNodeId"))
+        if linked_node is None or linked_node.getParent() is None:
+            return None
+        return linked_node
@@ -0,0 +1,161 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from collections import deque
+from typing import Callable, Dict, Optional
+from UM.Application import Application
+from UM.Logger import Logger
+from UM.Scene.SceneNode import SceneNode
+
+import atexit
+import functools
+import json
+import os
+import time
+
+
+class ZeesawProfiler:
+    """Timing counters for the hot paths of the tool. Off by default; while off, a profiled call
+    costs one flag check. Enable from the tool panel or by setting the environment variable
+    BANANA_SPLIT_PROFILE. Any value enables profiling, and a value other than 1 is taken as a path
+    that statistics are written to as JSON on every dump and at exit.
+
+    Timings are inclusive, so a profiled call made from another one counts towards both. Besides
+    timings, it counts setTransformation calls made by the plugin and sceneChanged emissions that
+    happen inside profiled calls.
+    """
+
+    ENVIRONMENT_VARIABLE = "BANANA_SPLIT_PROFILE"
+
+    # Number of most recent call durations kept per counter for percentiles
+    SAMPLE_COUNT = 10000
+
+    _instance = None  # type: Optional[ZeesawProfiler]
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._depth = 0
+        self._calls = {}  # type: Dict[str, int]
+        self._totals = {}  # type: Dict[str, float]
+        self._samples = {}  # type: Dict[str, deque]
+        self._counts = {}  # type: Dict[str, int]
+        self._json_path = None  # type: Optional[str]
+
+    @classmethod
+    def getInstance(cls) -> "ZeesawProfiler":
+        if cls._instance is None:
+            cls._instance = ZeesawProfiler()
+        return cls._instance
+
+    @staticmethod
+    def profile(name: str) -> Callable:
+        """Decorator that times calls to a function under name."""
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                profiler = ZeesawProfiler.getInstance()
+                if not profiler._enabled:
+                    return function(*args, **kwargs)
+                profiler._depth += 1
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    profiler._depth -= 1
+                    profiler._record(name, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def enableFromEnvironment(self) -> None:
+        value = os.environ.get(self.ENVIRONMENT_VARIABLE)
+        if not value:
+            return
+        if value != "1":
+            self._json_path = value
+            atexit.register(self.dump)
+        self.setEnabled(True)
+
+    def isEnabled(self) -> bool:
+        return self._enabled
+
+    def setEnabled(self, enabled: bool) -> None:
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        scene = Application.getInstance().getController().getScene()
+        if enabled:
+            scene.sceneChanged.connect(self._onSceneChanged)
+        else:
+            scene.sceneChanged.disconnect(self._onSceneChanged)
+
+    def count(self, name: str) -> None:
+        """Count an event, e.g. a transformation set by the plugin."""
+        if self._enabled:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def reset(self) -> None:
+        self._calls.clear()
+        self._totals.clear()
+        self._samples.clear()
+        self._counts.clear()
+
+    def getStatistics(self) -> dict:
+        """Calls, total time and p50/p99 in milliseconds per profiled function, plus counts."""
+        timers = {}
+        for name, calls in sorted(self._calls.items()):
+            samples = sorted(self._samples[name])
+            timers[name] = {
+                "calls": calls,
+                "total_ms": self._totals[name] * 1000.0,
+                "p50_ms": self._percentile(samples, 50) * 1000.0,
+                "p99_ms": self._percentile(samples, 99) * 1000.0,
+            }
+        return {"timers": timers, "counts": dict(sorted(self._counts.items()))}
+
+    def dump(self) -> None:
+        """Write statistics to the log, and to JSON if a path was given by environment."""
+        self.dumpToLog()
+        if self._json_path:
+            self.dumpToJson(self._json_path)
+
+    def dumpToLog(self) -> None:
+        statistics = self.getStatistics()
+        for name, timer in statistics["timers"].items():
+            Logger.log(
+                "i",
+                "BananaSplit profile {}: {} calls, {:.2f} ms total, p50 {:.3f} ms, p99 {:.3f} ms".format(
+                    name, timer["calls"], timer["total_ms"], timer["p50_ms"], timer["p99_ms"]
+                ),
+            )
+        for name, count in statistics["counts"].items():
+            Logger.log("i", "BananaSplit profile {}: {}".format(name, count))
+
+    def dumpToJson(self, path: str) -> None:
+        try:
+            with open(path, "w", encoding="utf-8") as json_file:
+                json.dump(self.getStatistics(), json_file, indent=2)
+        except OSError as error:
+            Logger.log("w", "Cannot write Banana Split profile: {}".format(error))
+
+    def _record(self, name: str, duration: float) -> None:
+        if name not in self._calls:
+            self._calls[name] = 0
+            self._totals[name] = 0.0
+            self._samples[name] = deque(maxlen=self.SAMPLE_COUNT)
+        self._calls[name] += 1
+        self._totals[name] += duration
+        self._samples[name].append(duration)
+
+    def _onSceneChanged(self, node: SceneNode) -> None:
+        # Emissions outside profiled calls come from Cura or the user, not from the plugin
+        if self._depth > 0:
+            self.count("sceneChanged")
+
+    @staticmethod
+    def _percentile(ordered: list, p: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
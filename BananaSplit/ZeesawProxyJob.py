@@ -0,0 +1,31 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from BananaSplit.VertexClustering import clusterVertices, indexedVertexNormals
+from UM.Job import Job
+from UM.Mesh.MeshData import MeshData
+
+import numpy
+
+
+class ZeesawProxyJob(Job):
+    """Builds a decimated proxy of a mesh by vertex clustering. The result is the proxy mesh data."""
+
+    def __init__(self, mesh_data: MeshData, face_count: int) -> None:
+        super().__init__()
+        self._mesh_data = mesh_data
+        self._face_count = face_count
+
+    def getMeshData(self) -> MeshData:
+        return self._mesh_data
+
+    def run(self) -> None:
+        vertices, faces = clusterVertices(self._mesh_data.getVertices(), self._mesh_data.getIndices(), self._face_count)
+        self.setResult(
+            MeshData(
+                vertices=vertices.astype(numpy.float32),
+                normals=indexedVertexNormals(vertices, faces).astype(numpy.float32),
+                indices=faces.astype(numpy.int32),
+                file_name=self._mesh_data.getFileName(),
+            )
+        )
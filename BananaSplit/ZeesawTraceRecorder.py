@@ -0,0 +1,61 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import Optional
+from UM.Logger import Logger
+from UM.Math.Matrix import Matrix
+
+import json
+import os
+import time
+
+
+class ZeesawTraceRecorder:
+    """Appends the scene and selection events the tool reacts to as JSON lines, so that a real
+    session can be replayed by the benchmark harness. Recording is off unless the environment
+    variable BANANA_SPLIT_TRACE points to a file.
+    """
+
+    ENVIRONMENT_VARIABLE = "BANANA_SPLIT_TRACE"
+
+    # Roles of the node behind a sceneChanged event
+    SelectedRole = "selected"
+    LinkedRole = "linked"
+    OtherRole = "other"
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        # Line buffered, so that a trace survives a crash
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+        self._start = time.monotonic()
+        Logger.log("i", "Recording Banana Split trace to {}".format(path))
+
+    @classmethod
+    def fromEnvironment(cls) -> Optional["ZeesawTraceRecorder"]:
+        path = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+        if not path:
+            return None
+        try:
+            return cls(path)
+        except OSError as error:
+            Logger.log("w", "Cannot record Banana Split trace: {}".format(error))
+            return None
+
+    def recordSceneChanged(self, role: str, transformation: Optional[Matrix] = None) -> None:
+        entry = {"event": "sceneChanged", "role": role}
+        if transformation is not None:
+            entry["transformation"] = transformation.getData().flatten().tolist()
+        self._write(entry)
+
+    def recordSelectionChanged(self, count: int, linked: bool) -> None:
+        self._write({"event": "selectionChanged", "count": count, "linked": linked})
+
+    def recordToolOperation(self, started: bool) -> None:
+        self._write({"event": "toolOperation", "started": started})
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _write(self, entry: dict) -> None:
+        entry["time"] = round(time.monotonic() - self._start, 6)
+        self._file.write(json.dumps(entry) + "\n")
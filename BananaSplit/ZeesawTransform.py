@@ -0,0 +1,112 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Closed-form zeesaw math on raw 4x4 transformation data. Everything here works on NumPy arrays and
+accepts stacks of transformations (shape (..., 4, 4)) as well as single ones.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy
+
+# Rotating 180 degrees about Z negates the X and Y rows of a world transformation
+_ROTATION_SIGNS = numpy.array([[-1.0], [-1.0], [1.0], [1.0]])
+_BOUNDS_SIGNS = numpy.array([-1.0, -1.0, 1.0])
+
+# Mirroring along Y negates the Y row. The linked node carries a mesh mirrored along its local X, so
+# the X column is negated too, which keeps the determinant positive
+_MIRROR_SIGNS = numpy.array(
+    [[-1.0, 1.0, 1.0, 1.0], [1.0, -1.0, -1.0, -1.0], [-1.0, 1.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0]]
+)
+_MIRROR_BOUNDS_SIGNS = numpy.array([1.0, -1.0, 1.0])
+
+# Transformations that agree to this many decimals are considered the same
+TRANSFORMATION_DECIMALS = 5
+
+
+def zeesawTransformation(
+    selected_world: numpy.ndarray, linked_position: numpy.ndarray, mirror=False
+) -> numpy.ndarray:
+    """World transformation of the linked node: the selected node rotated 180 degrees about Z, moved to
+    the X and Z of linked_position and mirrored along Y (what the user sees as Z).
+
+    With mirror, the selected node is mirrored along Y instead of rotated. That is only a true mirror
+    image if the linked node's mesh is mirrored along its local X (see mirrorMeshData). Mirror may be
+    an array of flags for stacked transformations.
+    """
+    selected_world = numpy.asarray(selected_world, dtype=numpy.float64)
+    linked_position = numpy.asarray(linked_position, dtype=numpy.float64)
+
+    if numpy.ndim(mirror) == 0:
+        result = selected_world * (_MIRROR_SIGNS if mirror else _ROTATION_SIGNS)
+    else:
+        signs = numpy.where(numpy.asarray(mirror, dtype=bool)[..., None, None], _MIRROR_SIGNS, _ROTATION_SIGNS)
+        result = selected_world * signs
+    result[..., 0, 3] = linked_position[..., 0]
+    result[..., 1, 3] = -selected_world[..., 1, 3]
+    result[..., 2, 3] = linked_position[..., 2]
+    return result
+
+
+def localTransformation(world: numpy.ndarray, parent_world: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """Convert world transformation(s) to the local space of a parent. No-op for the scene root."""
+    if parent_world is None:
+        return world
+    return numpy.linalg.solve(parent_world, world)
+
+
+def transformationKey(data: numpy.ndarray) -> bytes:
+    """Cheap, hashable key of a transformation. Equal keys mean equal transformations within
+    TRANSFORMATION_DECIMALS. Adding zero folds -0.0 into 0.0.
+    """
+    return (numpy.round(data, TRANSFORMATION_DECIMALS) + 0.0).tobytes()
+
+
+def transformationKeys(data: numpy.ndarray) -> List[bytes]:
+    """Keys of a stack of transformations, rounded in one pass."""
+    rounded = numpy.round(data, TRANSFORMATION_DECIMALS) + 0.0
+    return [transformation.tobytes() for transformation in rounded]
+
+
+def zeesawBounds(
+    minimum: numpy.ndarray,
+    maximum: numpy.ndarray,
+    selected_position: numpy.ndarray,
+    linked_position: numpy.ndarray,
+    mirror: bool = False,
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Axis aligned bounds of the linked node derived from the selected node's. Exact, because the
+    rotation only flips the signs of X and Y, and the mirror only the sign of Y.
+    """
+    if mirror:
+        signs = _MIRROR_BOUNDS_SIGNS
+        offset_x = linked_position[0] - selected_position[0]
+    else:
+        signs = _BOUNDS_SIGNS
+        offset_x = selected_position[0] + linked_position[0]
+    offset = numpy.array([offset_x, 0.0, linked_position[2] - selected_position[2]])
+    a = minimum * signs + offset
+    b = maximum * signs + offset
+    return numpy.minimum(a, b), numpy.maximum(a, b)
+
+
+def zeesawHullPoints(
+    points: numpy.ndarray, selected_position: numpy.ndarray, linked_position: numpy.ndarray, mirror: bool = False
+) -> numpy.ndarray:
+    """Convex hull of the linked node on the build plate (X and Z world coordinates) derived from the
+    selected node's hull. Order is reversed to keep the winding after flipping X. A mirror image has the
+    same footprint, so its hull is just moved.
+    """
+    points = numpy.asarray(points, dtype=numpy.float64)
+    if mirror:
+        return points + numpy.array(
+            [linked_position[0] - selected_position[0], linked_position[2] - selected_position[2]]
+        )
+    mapped = numpy.stack(
+        (
+            -points[:, 0] + selected_position[0] + linked_position[0],
+            points[:, 1] - selected_position[2] + linked_position[2],
+        ),
+        axis=1,
+    )
+    return mapped[::-1]
@@ -0,0 +1,121 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+from typing import Callable
+from cura.CuraApplication import CuraApplication
+
+import time
+
+try:
+    from PyQt6.QtCore import QTimer
+except ImportError:
+    from PyQt5.QtCore import QTimer
+
+
+class ZeesawUpdateScheduler:
+    """Coalesces update requests into as few callback runs as possible using a single timer.
+
+    FrameMode runs at most one update per frame, DebounceMode runs once after requests have stopped
+    for the configured interval, and AdaptiveMode debounces with an interval scaled by the weight of
+    the update (vertex count) and its measured cost. In every mode the last request is always
+    followed by a run, so the final state is never lost.
+    """
+
+    FrameMode = "frame"
+    DebounceMode = "debounce"
+    AdaptiveMode = "adaptive"
+
+    # Milliseconds
+    FRAME_INTERVAL = 16
+    MAX_INTERVAL = 1000
+
+    # Adaptive interval is a multiple of the measured update cost plus a share per vertex
+    ADAPTIVE_COST_FACTOR = 4.0
+    ADAPTIVE_MS_PER_VERTEX = 1.0 / 20000.0
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self._callback = callback
+        self._mode = self.FrameMode
+        self._interval = self.MAX_INTERVAL
+
+        self._pending = False
+        self._queued = False
+        self._weight = 0
+        # Moving average of callback duration in milliseconds
+        self._cost = 0.0
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._onTimeout)
+
+    def getMode(self) -> str:
+        return self._mode
+
+    def setMode(self, mode: str) -> None:
+        if mode not in (self.FrameMode, self.DebounceMode, self.AdaptiveMode):
+            raise ValueError("Unknown update mode: {}".format(mode))
+        self._mode = mode
+
+    def getInterval(self) -> int:
+        """Milliseconds between request and update in the current mode."""
+        if self._mode == self.DebounceMode:
+            return self._interval
+        if self._mode == self.AdaptiveMode:
+            interval = self._cost * self.ADAPTIVE_COST_FACTOR + self._weight * self.ADAPTIVE_MS_PER_VERTEX
+            return int(min(max(interval, self.FRAME_INTERVAL), self.MAX_INTERVAL))
+        return self.FRAME_INTERVAL
+
+    def setInterval(self, interval: int) -> None:
+        """Set debounce interval in milliseconds."""
+        self._interval = max(int(interval), self.FRAME_INTERVAL)
+
+    def isPending(self) -> bool:
+        return self._pending or self._queued
+
+    def request(self, weight: int = 0) -> None:
+        """Ask for an update. Weight hints how heavy the update is, e.g. vertex count."""
+        self._weight = weight
+        if self._mode == self.FrameMode:
+            if self._timer.isActive():
+                # Already updated during this frame, catch up on timeout
+                self._pending = True
+            elif not self._queued:
+                self._queued = True
+                CuraApplication.getInstance().callLater(self._onQueued)
+        else:
+            # Trailing edge, every request pushes the update further
+            self._pending = True
+            self._timer.start(self.getInterval())
+
+    def flush(self) -> None:
+        """Run a pending update right away."""
+        if self.isPending():
+            self._timer.stop()
+            self._queued = False
+            self._run()
+
+    def cancel(self) -> None:
+        self._timer.stop()
+        self._pending = False
+        self._queued = False
+
+    def _onQueued(self) -> None:
+        if not self._queued:
+            return
+        self._queued = False
+        self._run()
+        self._timer.start(self.FRAME_INTERVAL)
+
+    def _onTimeout(self) -> None:
+        if not self._pending:
+            return
+        self._run()
+        if self._mode == self.FrameMode:
+            self._timer.start(self.FRAME_INTERVAL)
+
+    def _run(self) -> None:
+        self._pending = False
+        start = time.perf_counter()
+        self._callback()
+        cost = (time.perf_counter() - start) * 1000.0
+        self._cost = cost if self._cost == 0.0 else 0.8 * self._cost + 0.2 * cost
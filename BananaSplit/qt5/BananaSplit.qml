@@ -11,9 +11,17 @@ Item {
     height: childrenRect.height
     
     property bool splittable: UM.ActiveTool.properties.getValue("Splittable") || false
+    property bool positionable: UM.ActiveTool.properties.getValue("Positionable") || false
     property bool linked: UM.ActiveTool.properties.getValue("Linked") || false
     property bool throttle: UM.ActiveTool.properties.getValue("Throttle") || false
     property bool zeesaw: UM.ActiveTool.properties.getValue("Zeesaw") || false
+    property bool cut: UM.ActiveTool.properties.getValue("Cut") || false
+    property bool mirror: UM.ActiveTool.properties.getValue("Mirror") || false
+    property string throttleMode: UM.ActiveTool.properties.getValue("ThrottleMode") || "debounce"
+    property int throttleInterval: UM.ActiveTool.properties.getValue("ThrottleInterval") || 1000
+    property bool profile: UM.ActiveTool.properties.getValue("Profile") || false
+    property real cutArea: UM.ActiveTool.properties.getValue("CutArea") || 0
+    property real cutPerimeter: UM.ActiveTool.properties.getValue("CutPerimeter") || 0
 
     Row {
         id: buttonRow
@@ -27,6 +35,17 @@ Item {
             property bool needBorder: true;
             style: UM.Theme.styles.tool_button
             onClicked: UM.ActiveTool.triggerAction("split")
+            z: 3;
+        }
+
+        Button {
+            id: autoHeightButton
+            text: "Auto height"
+            enabled: base.positionable
+            iconSource: "../resources/auto-height.svg"
+            property bool needBorder: true;
+            style: UM.Theme.styles.tool_button
+            onClicked: UM.ActiveTool.triggerAction("autoHeight")
             z: 2;
         }
 
@@ -46,11 +65,75 @@ Item {
     }
 
     CheckBox {
-        id: throttleCheckBox
+        id: cutCheckBox
         anchors.top: buttonRow.bottom
         anchors.topMargin: UM.Theme.getSize("default_margin").width
+        text: "Trim halves"
+        checked: base.cut
+        onClicked: UM.ActiveTool.setProperty("Cut", checked)
+    }
+
+    CheckBox {
+        id: mirrorCheckBox
+        anchors.top: cutCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        text: "Mirror halves"
+        checked: base.mirror
+        onClicked: UM.ActiveTool.setProperty("Mirror", checked)
+    }
+
+    CheckBox {
+        id: throttleCheckBox
+        anchors.top: mirrorCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
         text: "Throttle updates"
         checked: base.throttle
         onClicked: UM.ActiveTool.setProperty("Throttle", checked)
     }
+
+    Row {
+        id: throttleRow
+        anchors.top: throttleCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        spacing: UM.Theme.getSize("default_margin").width
+
+        ComboBox {
+            id: throttleModeComboBox
+            enabled: base.throttle
+            model: ["Debounce", "Adaptive"]
+            currentIndex: base.throttleMode == "adaptive" ? 1 : 0
+            onActivated: UM.ActiveTool.setProperty("ThrottleMode", index == 1 ? "adaptive" : "debounce")
+        }
+
+        TextField {
+            id: throttleIntervalTextField
+            width: 60
+            enabled: base.throttle && base.throttleMode == "debounce"
+            text: base.throttleInterval
+            validator: IntValidator { bottom: 16; top: 5000 }
+            onEditingFinished: UM.ActiveTool.setProperty("ThrottleInterval", parseInt(text))
+        }
+
+        Label {
+            anchors.verticalCenter: throttleIntervalTextField.verticalCenter
+            text: "ms"
+        }
+    }
+
+    CheckBox {
+        id: profileCheckBox
+        anchors.top: throttleRow.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        text: "Profile hot paths"
+        checked: base.profile
+        onClicked: UM.ActiveTool.setProperty("Profile", checked)
+    }
+
+    Label {
+        id: crossSectionLabel
+        anchors.top: profileCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        visible: base.cutArea > 0
+        text: "Cut %1 mm², perimeter %2 mm".arg(base.cutArea.toFixed(1)).arg(base.cutPerimeter.toFixed(1))
+    }
 }
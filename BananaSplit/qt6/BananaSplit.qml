@@ -13,9 +13,17 @@ Item {
     height: childrenRect.height
 
     property bool splittable: UM.Controller.properties.getValue("Splittable") || false
+    property bool positionable: UM.Controller.properties.getValue("Positionable") || false
     property bool linked: UM.Controller.properties.getValue("Linked") || false
     property bool throttle: UM.Controller.properties.getValue("Throttle") || false
     property bool zeesaw: UM.Controller.properties.getValue("Zeesaw") || false
+    property bool cut: UM.Controller.properties.getValue("Cut") || false
+    property bool mirror: UM.Controller.properties.getValue("Mirror") || false
+    property string throttleMode: UM.Controller.properties.getValue("ThrottleMode") || "debounce"
+    property int throttleInterval: UM.Controller.properties.getValue("ThrottleInterval") || 1000
+    property bool profile: UM.Controller.properties.getValue("Profile") || false
+    property real cutArea: UM.Controller.properties.getValue("CutArea") || 0
+    property real cutPerimeter: UM.Controller.properties.getValue("CutPerimeter") || 0
     
     Row {
         id: buttonRow
@@ -32,6 +40,17 @@ Item {
             onClicked: UM.Controller.triggerAction("split")
         }
 
+        UM.ToolbarButton {
+            id: autoHeightButton
+            text: "Auto height"
+            enabled: base.positionable
+            toolItem: UM.ColorImage {
+                source: Qt.resolvedUrl("../resources/auto-height.svg")
+                color: UM.Theme.getColor("icon")
+            }
+            onClicked: UM.Controller.triggerAction("autoHeight")
+        }
+
         UM.ToolbarButton {
             id: linkButton
             text: "Link Z"
@@ -48,11 +67,73 @@ Item {
     }
 
     UM.CheckBox {
-        id: throttleCheckBox
+        id: cutCheckBox
         anchors.top: buttonRow.bottom
         anchors.topMargin: UM.Theme.getSize("default_margin").width
+        text: "Trim halves"
+        checked: base.cut
+        onClicked: UM.Controller.setProperty("Cut", checked)
+    }
+
+    UM.CheckBox {
+        id: mirrorCheckBox
+        anchors.top: cutCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        text: "Mirror halves"
+        checked: base.mirror
+        onClicked: UM.Controller.setProperty("Mirror", checked)
+    }
+
+    UM.CheckBox {
+        id: throttleCheckBox
+        anchors.top: mirrorCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
         text: "Throttle updates"
         checked: base.throttle
         onClicked: UM.Controller.setProperty("Throttle", checked)
     }
+
+    Row {
+        id: throttleRow
+        anchors.top: throttleCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        spacing: UM.Theme.getSize("default_margin").width
+
+        ComboBox {
+            id: throttleModeComboBox
+            width: UM.Theme.getSize("setting_control").width
+            enabled: base.throttle
+            model: ["Debounce", "Adaptive"]
+            currentIndex: base.throttleMode == "adaptive" ? 1 : 0
+            onActivated: UM.Controller.setProperty("ThrottleMode", currentIndex == 1 ? "adaptive" : "debounce")
+        }
+
+        UM.TextFieldWithUnit {
+            id: throttleIntervalTextField
+            width: UM.Theme.getSize("setting_control").width
+            height: throttleModeComboBox.height
+            enabled: base.throttle && base.throttleMode == "debounce"
+            unit: "ms"
+            text: base.throttleInterval
+            validator: IntValidator { bottom: 16; top: 5000 }
+            onEditingFinished: UM.Controller.setProperty("ThrottleInterval", parseInt(text))
+        }
+    }
+
+    UM.CheckBox {
+        id: profileCheckBox
+        anchors.top: throttleRow.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        text: "Profile hot paths"
+        checked: base.profile
+        onClicked: UM.Controller.setProperty("Profile", checked)
+    }
+
+    UM.Label {
+        id: crossSectionLabel
+        anchors.top: profileCheckBox.bottom
+        anchors.topMargin: UM.Theme.getSize("default_margin").width
+        visible: base.cutArea > 0
+        text: "Cut %1 mm², perimeter %2 mm".arg(base.cutArea.toFixed(1)).arg(base.cutPerimeter.toFixed(1))
+    }
 }
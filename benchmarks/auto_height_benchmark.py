@@ -0,0 +1,85 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Auto height: scoring candidate split heights from histograms, and the whole autoHeight action on
+a lying and a standing node. Fails if the action takes a second or more, doesn't end up as one undo
+step that puts the chosen plane on the build plate, or if the estimated cross-sections are off from
+cutting the mesh at the same heights.
+
+    python benchmarks/auto_height_benchmark.py
+    python benchmarks/auto_height_benchmark.py --faces 1000000 5000000
+"""
+
+from bootstrap import measure, report
+from harness import Harness, buildMesh, timeCall
+
+from UM.Math.Matrix import Matrix
+from UM.Math.Vector import Vector
+
+import argparse
+import numpy
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, nargs="+", default=[100000, 1000000])
+    arguments = parser.parse_args()
+
+    Harness()
+    from BananaSplit.PlanarCut import crossSection, cutSegments, meshTriangles
+    from BananaSplit.SplitHeight import scoreSplitHeights
+
+    ok = True
+    standing = numpy.identity(4)
+    standing[1:3, 1:3] = [[0.0, -1.0], [1.0, 0.0]]
+    for face_count in arguments.faces:
+        mesh = buildMesh(face_count)
+        for name, rotation in (("lying", numpy.identity(4)), ("standing", standing)):
+            harness = Harness()
+            node = harness.addNode(mesh)
+            data = rotation.copy()
+            data[1, 3] = 30.0
+            node.setTransformation(Matrix(data))
+            harness.select(node)
+
+            world = node.getWorldTransformation().getData()
+            triangles = meshTriangles(mesh.getVertices(), mesh.getIndices()) @ world[:3, :3].T + world[:3, 3]
+            print("{} faces, {}:".format(len(triangles), name))
+            report("  scoreSplitHeights", measure(lambda: scoreSplitHeights(triangles), 5))
+
+            # Estimated cross-sections against exact cuts at a few of the candidates
+            candidates, area, _, _ = scoreSplitHeights(triangles)
+            errors = []
+            for index in range(8, len(candidates), 16):
+                exact, _ = crossSection(cutSegments(triangles, numpy.array([0.0, 1.0, 0.0]), -candidates[index]))
+                errors.append(abs(area[index] - exact) / max(exact, 1.0e-9))
+            print("    cross-section estimate: max error {:.3%} over {} heights".format(max(errors), len(errors)))
+            ok &= max(errors) < 0.01
+
+            operations = harness.application.getOperationStack().getOperations()
+            before = node.getWorldPosition().y
+            elapsed = timeCall(harness.tool.autoHeight) / 1.0e6
+            harness.spin()
+            height = before - node.getWorldPosition().y
+            index = numpy.argmin(numpy.abs(candidates - height))
+            print(
+                "  autoHeight {:.0f} ms: cut {:.2f} mm above the bottom, {:.1f} mm2 of {:.1f} mm2 at best, "
+                "{} undo step(s)".format(
+                    elapsed * 1000.0, height - triangles[..., 1].min(), area[index], area.max(), len(operations)
+                )
+            )
+            splittable = harness.tool.getSplittable()
+            harness.application.getOperationStack().undo()
+            restored = abs(node.getWorldPosition().y - before) < 1.0e-6
+            print("    splittable after: {}, position restored by undo: {}".format(splittable, restored))
+            ok &= elapsed < 1.0 and len(operations) == 1 and splittable and restored
+            ok &= numpy.isclose(candidates[index], height, atol=1.0e-6)
+
+    if not ok:
+        print("FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
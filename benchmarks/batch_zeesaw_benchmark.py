@@ -0,0 +1,70 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Batch split and batch zeesaw over 1, 10 and 100 selected pairs: split() of the whole selection,
+and updateZeesaw of every pair in one pass vs. one call per pair, with the sceneChanged emissions
+each causes.
+
+    python benchmarks/batch_zeesaw_benchmark.py
+"""
+
+from bootstrap import report
+from harness import Harness, buildMesh, timeCall
+
+from UM.Math.Vector import Vector
+
+import itertools
+
+
+def main() -> None:
+    mesh = buildMesh(1000)
+    for pair_count in (1, 10, 100):
+        harness = Harness()
+        nodes = [
+            harness.addNode(mesh, Vector(15.0 * (index % 10), 0.0, 15.0 * (index // 10))) for index in range(pair_count)
+        ]
+        harness.select(*nodes)
+        operations = harness.application.getOperationStack().getOperations()
+        split_time = timeCall(harness.tool.split)
+        pairs = harness.tool._getSelectedPairs()
+        print(
+            "{} pairs: split {:.2f} ms, {} pairs linked, {} undo step(s)".format(
+                pair_count, split_time / 1000.0, len(pairs), len(operations)
+            )
+        )
+
+        heights = itertools.cycle([-5.0, -4.0, -3.0, -2.0])
+
+        def move() -> None:
+            height = next(heights)
+            for node, _ in pairs:
+                position = node.getWorldPosition()
+                node.setPosition(Vector(position.x, height, position.z))
+
+        emissions = [0]
+        harness.scene.sceneChanged.connect(lambda node: emissions.__setitem__(0, emissions[0] + 1))
+
+        def timeUpdates(update) -> list:
+            # Moving the selection is not part of the measurement
+            timings = []
+            for _ in range(100):
+                move()
+                emissions[0] = 0
+                timings.append(timeCall(update))
+            return timings
+
+        def batched() -> None:
+            harness.tool.updateZeesaw(pairs)
+
+        def separately() -> None:
+            for pair in pairs:
+                harness.tool.updateZeesaw([pair])
+
+        report("  batched updateZeesaw", timeUpdates(batched))
+        print("    sceneChanged per update: {}".format(emissions[0]))
+        report("  per pair updateZeesaw", timeUpdates(separately))
+        print("    sceneChanged per update: {}".format(emissions[0]))
+
+
+if __name__ == "__main__":
+    main()
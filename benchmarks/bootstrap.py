@@ -0,0 +1,73 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Shared setup for the benchmarks. Puts the Uranium stand-ins on the import path and loads plugin
+modules one by one, so a benchmark only needs stand-ins for what the measured module imports.
+"""
+
+from typing import Callable, List
+
+import importlib.util
+import numpy
+import os
+import sys
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_DIR = os.path.dirname(BENCHMARKS_DIR)
+PLUGIN_DIR = os.path.join(REPOSITORY_DIR, "BananaSplit")
+BANANA_STL = os.path.join(REPOSITORY_DIR, "banana.stl")
+
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "standins"))
+
+
+def loadPluginModule(name: str):
+    """Load BananaSplit/<name>.py as a standalone module."""
+    module_name = "BananaSplit." + name
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(PLUGIN_DIR, name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def loadStl(path: str = BANANA_STL) -> numpy.ndarray:
+    """Triangles of a binary STL file as an (N, 3, 3) array."""
+    with open(path, "rb") as stl_file:
+        data = stl_file.read()
+    count = int.from_bytes(data[80:84], "little")
+    record = numpy.dtype([("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+    return numpy.frombuffer(data, dtype=record, count=count, offset=84)["vertices"].astype(numpy.float64)
+
+
+def tileTriangles(triangles: numpy.ndarray, face_count: int) -> numpy.ndarray:
+    """Scale a mesh up to about face_count triangles by placing copies of it side by side."""
+    copies = max(1, face_count // len(triangles))
+    width = numpy.ptp(triangles[..., 0]) * 1.1
+    offsets = numpy.zeros((copies, 1, 1, 3))
+    offsets[:, 0, 0, 0] = numpy.arange(copies) * width
+    return (triangles[None] + offsets).reshape(-1, 3, 3)
+
+
+def measure(function: Callable[[], object], repeat: int = 1000) -> List[float]:
+    """Call function repeatedly and return per-call timings in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1.0e6)
+    return timings
+
+
+def percentile(timings: List[float], p: float) -> float:
+    ordered = sorted(timings)
+    index = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label: str, timings: List[float]) -> None:
+    print(
+        "{:<40} p50 {:>10.2f} us   p99 {:>10.2f} us".format(label, percentile(timings, 50), percentile(timings, 99))
+    )
@@ -0,0 +1,142 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""GPU buffers behind linked pairs, counted by rendering frames through the stand-in renderer: the view
+pass plus the selection pass that draws every selectable mesh for picking and the selection outline.
+A twin shares the mesh data of its original, so both draw from the same buffers. A mirrored twin has
+a mesh of its own. Pairs loaded from a project get their meshes shared again when they are relinked.
+Fails if a twin that isn't mirrored has buffers of its own, or if dragging a pair uploads its
+geometry again.
+
+    python benchmarks/buffer_upload_benchmark.py
+    python benchmarks/buffer_upload_benchmark.py --pairs 100 --faces 100000
+"""
+
+from harness import Harness, buildMesh, syntheticDragTrace, timeCall
+
+from UM.Math.Matrix import Matrix
+from UM.Math.Vector import Vector
+from UM.Mesh.MeshData import MeshData
+from UM.View.GL.OpenGL import OpenGL
+from UM.View.Renderer import Renderer
+
+import argparse
+import sys
+
+
+class MetadataEntry:
+    """Values read back from a project come wrapped like this."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+def splitPairs(harness: Harness, mesh: MeshData, pair_count: int, mirrored_count: int) -> list:
+    """Split pair_count nodes with meshes of their own, the first mirrored_count of them mirrored."""
+    nodes = [
+        harness.addNode(MeshData(vertices=mesh.getVertices()), Vector(15.0 * (index % 20), 0.0, 15.0 * (index // 20)))
+        for index in range(pair_count)
+    ]
+    for selection, mirror in ((nodes[:mirrored_count], True), (nodes[mirrored_count:], False)):
+        if selection:
+            harness.select(*selection)
+            harness.tool.setMirror(mirror)
+            harness.tool.split()
+            harness.spin()
+    return nodes + [harness.tool._findLinkedNode(node) for node in nodes]
+
+
+def loadProject(harness: Harness, project: list) -> list:
+    """Nodes of a saved project, every one with a mesh read back on its own."""
+    nodes = []
+    for vertices, transformation, metadata in project:
+        node = harness.addNode(MeshData(vertices=vertices))
+        node.setTransformation(Matrix(transformation))
+        node.metadata = {key: MetadataEntry(value) for key, value in metadata.items()}
+        nodes.append(node)
+    harness.application.fileCompleted.emit("project.3mf")
+    harness.spin()
+    return nodes
+
+
+def buffers(nodes: list) -> list:
+    """Distinct vertex buffers the nodes draw from."""
+    found = {}
+    for node in nodes:
+        buffer = getattr(node.getMeshData(), OpenGL.VertexBufferProperty, None)
+        if buffer is not None:
+            found[id(buffer)] = buffer
+    return list(found.values())
+
+
+def report(label: str, nodes: list, render_time: float) -> None:
+    opengl = OpenGL.getInstance()
+    print(
+        "  {:<24} {:>5} buffers for {:>5} nodes, {:>5} uploads, {:8.1f} MB, first frame {:.2f} ms".format(
+            label, len(buffers(nodes)), len(nodes), opengl.upload_count, opengl.uploaded_bytes / 1.0e6, render_time
+        )
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=20)
+    parser.add_argument("--faces", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--events", type=int, default=300)
+    arguments = parser.parse_args()
+
+    ok = True
+    pair_count = arguments.pairs
+    mirrored_count = pair_count // 2
+    for face_count in arguments.faces:
+        mesh = buildMesh(face_count)
+        print("{} pairs, {} faces, {} mirrored:".format(pair_count, mesh.getFaceCount(), mirrored_count))
+        renderer = Renderer()
+
+        harness = Harness()
+        nodes = splitPairs(harness, mesh, pair_count, mirrored_count)
+        render_time = timeCall(lambda: renderer.renderFrame(harness.scene.getRoot())) / 1000.0
+        report("split", nodes, render_time)
+        # One buffer per original, and one more per mirror image
+        ok &= len(buffers(nodes)) == pair_count + mirrored_count
+
+        project = [
+            (node.getMeshData().getVertices(), node.getLocalTransformation().getData().copy(), dict(node.metadata))
+            for node in nodes
+        ]
+        harness = Harness()
+        nodes = loadProject(harness, project)
+        render_time = timeCall(lambda: renderer.renderFrame(harness.scene.getRoot())) / 1000.0
+        report("loaded and relinked", nodes, render_time)
+        linked = all(harness.tool._findLinkedNode(node) for node in nodes)
+        ok &= linked and len(buffers(nodes)) == pair_count + mirrored_count
+
+        # Drag a pair with the renderer drawing every frame
+        harness = Harness()
+        selected_node, linked_node = splitPairs(harness, mesh, 1, 0)
+        harness.frame_callbacks.append(lambda: renderer.renderFrame(harness.scene.getRoot()))
+        harness.spin()
+        drawn = {}
+
+        def renderFrame() -> None:
+            for buffer in buffers([selected_node, linked_node]):
+                drawn[id(buffer)] = buffer
+
+        harness.frame_callbacks.append(renderFrame)
+        OpenGL.getInstance().resetCounters()
+        harness.replay(syntheticDragTrace(arguments.events), selected_node, linked_node)
+        harness.settle()
+        print(
+            "  drag {} events: pair drawn from {} buffers, {} uploads of anything".format(
+                arguments.events, len(drawn), OpenGL.getInstance().upload_count
+            )
+        )
+        ok &= len(drawn) == 1
+
+    if not ok:
+        print("FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Cut contour preview: building the triangle interval index, looking up the triangles that cross the
+plate vs. scanning all of them, and whole drag events of an unsplit node through the plate with the
+outline, area and perimeter updated. Fails if the index misses or invents triangles, if the
+previewed cross-section differs from cutting the whole mesh, or if the panel gets notified for more
+than a few events of the drag. Area and perimeter are published when the drag ends.
+
+    python benchmarks/contour_preview_benchmark.py
+    python benchmarks/contour_preview_benchmark.py --faces 1000000 5000000
+"""
+
+from bootstrap import measure, report
+from harness import Harness, buildMesh, syntheticDragTrace, timeCall
+
+from UM.Math.Vector import Vector
+
+import argparse
+import numpy
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--events", type=int, default=600)
+    arguments = parser.parse_args()
+
+    Harness()
+    from BananaSplit.PlanarCut import clipTriangles, crossSection, meshTriangles, planeFromTransformation
+    from BananaSplit.TriangleIntervalIndex import TriangleIntervalIndex
+
+    ok = True
+    rng = numpy.random.default_rng(1)
+    for face_count in arguments.faces:
+        mesh = buildMesh(face_count)
+        triangles = meshTriangles(mesh.getVertices(), mesh.getIndices())
+        normal = numpy.array([0.0, 1.0, 0.0])
+        index = [None]
+        build_time = timeCall(lambda: index.__setitem__(0, TriangleIntervalIndex(triangles, normal)))
+        index = index[0]
+        heights = triangles[..., 1]
+        low, high = heights.min(axis=1), heights.max(axis=1)
+        print(
+            "{} faces: index built in {:.0f} ms, depth {}".format(len(triangles), build_time / 1000.0, index.getDepth())
+        )
+
+        queries = rng.uniform(low.min(), high.max(), 200)
+        mismatches = sum(
+            set(index.query(height).tolist()) != set(numpy.nonzero((low <= height) & (high >= height))[0].tolist())
+            for height in queries
+        )
+        queries = iter(numpy.resize(queries, 5000))
+        report("  interval index query", measure(lambda: index.query(next(queries)), 1000))
+        report("  scan of all triangles", measure(lambda: numpy.nonzero((low <= 0.0) & (high >= 0.0))[0], 50))
+        print("    queries that differ from the scan: {}".format(mismatches))
+        ok &= mismatches == 0
+
+        # Drag the unsplit node through the plate with the tool showing the preview
+        harness = Harness()
+        node = harness.addNode(mesh, Vector(0.0, 0.0, 0.0))
+        harness.select(node)
+        harness.activateTool()
+        harness.settle()
+        notifications = [0]
+        harness.tool.propertyChanged.connect(lambda: notifications.__setitem__(0, notifications[0] + 1))
+        timings = harness.replay(syntheticDragTrace(arguments.events, depth=1.0), node, None)
+        report("  drag event with preview", timings)
+
+        world = node.getWorldTransformation().getData()
+        plane_normal, offset = planeFromTransformation(world)
+        _, _, segments = clipTriangles(triangles, plane_normal, offset)
+        expected = crossSection(segments @ world[:3, :3].T + world[:3, 3])
+        shown = (harness.tool.getCutArea(), harness.tool.getCutPerimeter())
+        matches = numpy.allclose(shown, expected, atol=0.05, rtol=1.0e-3)
+        print(
+            "    area {:.1f} mm2, perimeter {:.1f} mm (full cut: {:.1f}, {:.1f}), {} notifications".format(
+                shown[0], shown[1], expected[0], expected[1], notifications[0]
+            )
+        )
+        ok &= matches and shown[0] > 0.0 and notifications[0] <= arguments.events // 20
+
+    if not ok:
+        print("FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
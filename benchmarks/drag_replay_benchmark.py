@@ -0,0 +1,108 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Replays drag traces through the real tool in the headless harness and reports p50/p99 latency
+of handling a scene change (sceneChanged through updateZeesaw), split() and _updateProperties.
+
+    python benchmarks/drag_replay_benchmark.py
+    python benchmarks/drag_replay_benchmark.py --events 100000 --nodes 1000 --faces 5000000
+    python benchmarks/drag_replay_benchmark.py --trace session.jsonl --mode debounce
+    python benchmarks/drag_replay_benchmark.py --profile
+
+Record a trace in Cura by starting it with BANANA_SPLIT_TRACE=/path/to/session.jsonl.
+"""
+
+from bootstrap import measure, percentile, report
+from harness import Harness, buildMesh, loadTrace, syntheticDragTrace, timeCall
+
+from UM.Math.Vector import Vector
+
+import argparse
+import json
+
+MODES = ("frame", "debounce", "adaptive")
+
+
+def run(
+    event_count: int, node_count: int, face_count: int, mode: str, trace=None, splits: int = 5, profile: bool = False
+) -> None:
+    harness = Harness()
+    harness.tool.setProfile(profile)
+    if mode != "frame":
+        harness.tool.setThrottleMode(mode)
+        harness.tool.setThrottle(True)
+    harness.addBackground(node_count)
+    mesh = buildMesh(face_count)
+
+    # Fresh nodes for every split, undone right after
+    split_timings = []
+    for _ in range(splits):
+        node = harness.addNode(mesh)
+        harness.select(node)
+        split_timings.append(timeCall(harness.tool.split))
+        harness.spin()
+        harness.application.getOperationStack().undo()
+        node.setParent(None)
+
+    selected_node = harness.addNode(mesh, Vector(0.0, 0.0, 0.0))
+    linked_node = harness.split(selected_node)
+    harness.select(selected_node)
+
+    trace = trace if trace is not None else syntheticDragTrace(event_count)
+    harness.scene_changed_count = 0
+    event_timings = harness.replay(trace, selected_node, linked_node)
+    update_properties_timings = measure(harness.tool._updateProperties, repeat=200)
+
+    print(
+        "{} events, {} nodes, {} faces, {} mode: {} updates, {} sceneChanged".format(
+            len(trace),
+            node_count,
+            mesh.getFaceCount(),
+            mode,
+            len(harness.update_timings),
+            harness.scene_changed_count,
+        )
+    )
+    report("  event (sceneChanged..updateZeesaw)", event_timings)
+    if harness.update_timings:
+        report("  updateZeesaw", harness.update_timings)
+    staleness = harness.staleness(trace)
+    if staleness:
+        print(
+            "  {:<38} p50 {:>10.2f} ms   p99 {:>10.2f} ms".format(
+                "staleness (virtual)", percentile(staleness, 50), percentile(staleness, 99)
+            )
+        )
+    report("  split", split_timings)
+    report("  _updateProperties", update_properties_timings)
+    if profile:
+        print(json.dumps(harness.tool._profiler.getStatistics(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10, 1000])
+    parser.add_argument("--faces", type=int, nargs="+", default=[10000, 1000000])
+    parser.add_argument("--mode", choices=MODES, nargs="+", default=["frame"])
+    parser.add_argument("--trace", help="replay a recorded trace instead of synthetic drags")
+    parser.add_argument("--profile", action="store_true", help="print the plugin's own profile counters")
+    arguments = parser.parse_args()
+
+    if arguments.trace:
+        trace = loadTrace(arguments.trace)
+        for node_count in arguments.nodes:
+            for face_count in arguments.faces:
+                for mode in arguments.mode:
+                    run(len(trace), node_count, face_count, mode, trace, profile=arguments.profile)
+        return
+
+    for event_count in arguments.events:
+        for node_count in arguments.nodes:
+            for face_count in arguments.faces:
+                for mode in arguments.mode:
+                    run(event_count, node_count, face_count, mode, profile=arguments.profile)
+
+
+if __name__ == "__main__":
+    main()
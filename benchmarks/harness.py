@@ -0,0 +1,244 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Headless harness that runs the real BananaSplit tool on top of the Uranium/Cura stand-ins.
+
+The event loop is simulated on a virtual clock: callLater calls, background jobs and QTimers run
+when the harness steps the clock frame by frame. Drag traces, synthetic or recorded with the
+BANANA_SPLIT_TRACE environment variable in Cura, are replayed through the scene like a user
+dragging the selected node would.
+"""
+
+from bootstrap import REPOSITORY_DIR, loadStl, tileTriangles
+from typing import Callable, Dict, Iterator, List, Optional
+
+import json
+import math
+import numpy
+import sys
+import time
+
+sys.path.insert(0, REPOSITORY_DIR)
+
+import standin_clock
+
+from cura.CuraApplication import CuraApplication
+from cura.Scene.ConvexHullDecorator import ConvexHullDecorator
+from PyQt6 import QtCore
+from UM.Event import Event
+from UM.JobQueue import JobQueue
+from UM.Math.Matrix import Matrix
+from UM.Math.Vector import Vector
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+from UM.Scene.Selection import Selection
+from UM.Signal import Signal
+from UM.View.GL.OpenGL import OpenGL
+
+# Display refresh the event loop is stepped at
+FRAME_SECONDS = 1.0 / 60.0
+
+
+def buildMesh(face_count: int) -> MeshData:
+    """banana.stl tiled to about face_count triangles, turned Y up and centered like Cura does on load."""
+    triangles = tileTriangles(loadStl().astype(numpy.float32), face_count)
+    vertices = triangles.reshape(-1, 3)[:, [0, 2, 1]] * numpy.array([1.0, 1.0, -1.0], dtype=numpy.float32)
+    vertices -= (vertices.min(axis=0) + vertices.max(axis=0)) / 2.0
+    return MeshData(vertices=vertices)
+
+
+def syntheticDragTrace(event_count: int, rate: float = 120.0, depth: float = 20.0) -> List[Dict]:
+    """Mouse moves of a user dragging the selected node up and down through the build plate while
+    drifting sideways, at rate events per second. The moves are wrapped in a tool operation, like a
+    drag with the move tool.
+    """
+    trace = [{"time": 0.0, "event": "toolOperation", "started": True}]
+    for index in range(event_count):
+        t = index / rate
+        data = numpy.identity(4)
+        data[0, 3] = 10.0 * math.sin(t * 0.5)
+        data[1, 3] = depth * math.sin(t * 2.0)
+        trace.append(
+            {"time": t, "event": "sceneChanged", "role": "selected", "transformation": data.flatten().tolist()}
+        )
+    trace.append({"time": trace[-1]["time"], "event": "toolOperation", "started": False})
+    return trace
+
+
+def loadTrace(path: str) -> List[Dict]:
+    """Trace recorded by ZeesawTraceRecorder, one JSON object per line."""
+    with open(path, encoding="utf-8") as trace_file:
+        return [json.loads(line) for line in trace_file if line.strip()]
+
+
+class Harness:
+    """One application, scene and tool instance. Creating a new harness resets the stand-ins."""
+
+    def __init__(self, version: str = "5.7.0") -> None:
+        standin_clock.reset()
+        QtCore.QTimer._active.clear()
+        JobQueue._instance = None
+        OpenGL._instance = None
+        Selection._selection = []
+        Selection.selectionChanged = Signal()
+        Selection.selectionCenterChanged = Signal()
+
+        self.application = CuraApplication(version)
+        self.scene = self.application.getController().getScene()
+
+        from BananaSplit.BananaSplit import BananaSplit
+        from BananaSplit.ZeesawProfiler import ZeesawProfiler
+
+        ZeesawProfiler._instance = None
+        self.tool = BananaSplit()
+        self.application.getController().setActiveTool(self.tool)
+        self.tool.event(Event(Event.ToolActivateEvent))
+
+        # Count what the tool causes
+        self.scene_changed_count = 0
+        self.scene.sceneChanged.connect(self._onSceneChanged)
+        self.update_timings = []  # type: List[float]
+        self.update_times = []  # type: List[float]
+        self._wrapUpdateZeesaw()
+
+        self._background = []  # type: List[SceneNode]
+        self._replay_start = 0.0
+
+        # Called after each frame, e.g. to render
+        self.frame_callbacks = []  # type: List[Callable[[], None]]
+        self._next_frame = FRAME_SECONDS
+
+    def addNode(self, mesh: MeshData, position: Vector = Vector()) -> SceneNode:
+        node = SceneNode()
+        node.setSelectable(True)
+        node.setMeshData(mesh)
+        node.addDecorator(ConvexHullDecorator())
+        node.setPosition(position)
+        node.setParent(self.scene.getRoot())
+        # Cura has the hull of every node on the plate worked out by the time anyone splits
+        node.callDecoration("getConvexHull")
+        return node
+
+    def addBackground(self, count: int, mesh: Optional[MeshData] = None) -> None:
+        """Fill the scene with unrelated nodes sharing one small mesh, laid out on a grid."""
+        mesh = mesh or buildMesh(1000)
+        columns = max(1, int(math.sqrt(count)))
+        for index in range(count):
+            position = Vector(-200.0 - 12.0 * (index % columns), 0.0, 12.0 * (index // columns))
+            self._background.append(self.addNode(mesh, position))
+
+    def select(self, *nodes: SceneNode) -> None:
+        Selection.clear()
+        for node in nodes:
+            Selection.add(node)
+        self.spin()
+
+    def activateTool(self) -> None:
+        """Send the tool activation again, e.g. to show the link indicator for the selection."""
+        self.tool.event(Event(Event.ToolActivateEvent))
+
+    def split(self, node: SceneNode) -> SceneNode:
+        """Split node and return its new twin."""
+        self.select(node)
+        before = set(self.scene.getRoot().getChildren())
+        self.tool.split()
+        self.spin()
+        return next(child for child in self.scene.getRoot().getChildren() if child not in before)
+
+    def spin(self) -> None:
+        """Run everything that is due now: queued calls, finished jobs and expired timers."""
+        while True:
+            count = self.application.processEvents()
+            count += JobQueue.getInstance().processJobs()
+            count += QtCore.processTimers()
+            if count == 0:
+                return
+
+    def advanceTo(self, seconds: float) -> None:
+        """Step the clock frame by frame up to seconds, spinning the event loop on each frame."""
+        while self._next_frame <= seconds:
+            standin_clock.advance(self._next_frame - standin_clock.now())
+            self._next_frame += FRAME_SECONDS
+            self.spin()
+            for callback in self.frame_callbacks:
+                callback()
+        if standin_clock.now() < seconds:
+            standin_clock.advance(seconds - standin_clock.now())
+            self.spin()
+
+    def settle(self, seconds: float = 2.0) -> None:
+        """Let pending timers run out."""
+        self.advanceTo(standin_clock.now() + seconds)
+
+    def replay(self, trace: Iterator[Dict], selected_node: SceneNode, linked_node: SceneNode) -> List[float]:
+        """Replay trace events at their recorded times. Returns the wall time in microseconds each
+        event took to handle, including the calls it queued for the same frame.
+        """
+        timings = []
+        self._replay_start = standin_clock.now()
+        for entry in trace:
+            self.advanceTo(self._replay_start + entry["time"])
+            begin = time.perf_counter()
+            self._dispatch(entry, selected_node, linked_node)
+            self.spin()
+            timings.append((time.perf_counter() - begin) * 1.0e6)
+        self.settle()
+        return timings
+
+    def staleness(self, trace: List[Dict]) -> List[float]:
+        """Milliseconds of virtual time from each event until the next zeesaw update after it."""
+        times = sorted(self.update_times)
+        result = []
+        index = 0
+        for entry in trace:
+            event_time = self._replay_start + entry["time"]
+            while index < len(times) and times[index] < event_time:
+                index += 1
+            if index < len(times):
+                result.append((times[index] - event_time) * 1000.0)
+        return result
+
+    def _dispatch(self, entry: Dict, selected_node: SceneNode, linked_node: SceneNode) -> None:
+        if entry["event"] == "sceneChanged":
+            role = entry.get("role")
+            if role == "selected" and "transformation" in entry:
+                data = numpy.array(entry["transformation"]).reshape(4, 4)
+                selected_node.setTransformation(Matrix(data))
+            elif role == "linked":
+                self.scene.sceneChanged.emit(linked_node)
+            else:
+                node = self._background[0] if self._background else self.scene.getRoot()
+                self.scene.sceneChanged.emit(node)
+        elif entry["event"] == "selectionChanged":
+            if entry.get("count", 1) == 0:
+                Selection.clear()
+            elif Selection.isSelected(selected_node):
+                Selection.selectionChanged.emit()
+            else:
+                Selection.clear()
+                Selection.add(selected_node)
+        elif entry["event"] == "toolOperation":
+            controller = self.application.getController()
+            signal = controller.toolOperationStarted if entry["started"] else controller.toolOperationStopped
+            signal.emit(controller.getActiveTool())
+
+    def _wrapUpdateZeesaw(self) -> None:
+        update = self.tool.updateZeesaw
+
+        def timedUpdate(*args, **kwargs):
+            begin = time.perf_counter()
+            result = update(*args, **kwargs)
+            self.update_timings.append((time.perf_counter() - begin) * 1.0e6)
+            self.update_times.append(standin_clock.now())
+            return result
+
+        self.tool.updateZeesaw = timedUpdate
+
+    def _onSceneChanged(self, node: SceneNode) -> None:
+        self.scene_changed_count += 1
+
+
+def timeCall(function: Callable[[], object]) -> float:
+    begin = time.perf_counter()
+    function()
+    return (time.perf_counter() - begin) * 1.0e6
@@ -0,0 +1,55 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Linked node lookup cost against scene size: full scene scan vs. ZeesawLinkRegistry.
+
+    python benchmarks/link_registry_benchmark.py
+"""
+
+from bootstrap import loadPluginModule, measure, report
+
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
+from UM.Scene.Scene import Scene
+from UM.Scene.SceneNode import SceneNode
+
+# Modules the decorator imports come first
+loadPluginModule("MirrorMesh")
+loadPluginModule("ZeesawLinkMetadata")
+ZeesawLinkDecorator = loadPluginModule("ZeesawLinkDecorator").ZeesawLinkDecorator
+ZeesawLinkRegistry = loadPluginModule("ZeesawLinkRegistry").ZeesawLinkRegistry
+
+
+def buildScene(node_count: int):
+    scene = Scene()
+    for _ in range(node_count - 2):
+        # Cura models usually come with a child or two (groups, support meshes...)
+        SceneNode(SceneNode(scene.getRoot()))
+    selected_node = SceneNode(scene.getRoot())
+    linked_node = SceneNode(scene.getRoot())
+    selected_node.addDecorator(ZeesawLinkDecorator("selected", "linked"))
+    linked_node.addDecorator(ZeesawLinkDecorator("linked", "selected"))
+    return scene, selected_node, linked_node
+
+
+def main() -> None:
+    for node_count in (10, 100, 1000, 10000):
+        scene, selected_node, linked_node = buildScene(node_count)
+        registry = ZeesawLinkRegistry()
+        registry.link(selected_node, linked_node)
+
+        def scan():
+            linked_node_id = selected_node.callDecoration("zeesawLinkedNodeId")
+            for node in DepthFirstIterator(scene.getRoot()):
+                if node.callDecoration("zeesawNodeId") == linked_node_id:
+                    return node
+
+        def lookup():
+            return registry.findLinkedNode(selected_node)
+
+        assert scan() is linked_node and lookup() is linked_node
+        report("scene scan, {} nodes".format(node_count), measure(scan, 200))
+        report("registry, {} nodes".format(node_count), measure(lookup, 10000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Level-of-detail proxies for dragging big linked meshes: proxy build time and memory overhead, and
+per-frame drag latency with and without proxies. Rendering is stood in for by transforming every
+vertex of the linked mesh once per frame, which is the part of the GPU's work that scales with mesh
+size. Fails if the full mesh is not back once the drag has ended.
+
+    python benchmarks/lod_proxy_benchmark.py
+    python benchmarks/lod_proxy_benchmark.py --faces 1000000 5000000
+"""
+
+from bootstrap import report
+from harness import Harness, buildMesh, syntheticDragTrace, timeCall
+
+from UM.Math.Vector import Vector
+
+import argparse
+import numpy
+import standin_clock
+import sys
+
+
+def meshBytes(mesh_data) -> int:
+    buffers = (mesh_data.getVertices(), mesh_data.getNormals(), mesh_data.getIndices())
+    return sum(data.nbytes for data in buffers if data is not None)
+
+
+def drag(mesh, events: int, proxies: bool):
+    """Replay a drag and return frame timings (update plus stand-in render), vertices drawn per frame
+    and whether the full mesh was back afterwards.
+    """
+    harness = Harness()
+    if not proxies:
+        harness.tool._getLevelOfDetail().PROXY_FACE_COUNT = float("inf")
+    selected_node = harness.addNode(mesh, Vector(0.0, 0.0, 0.0))
+    linked_node = harness.split(selected_node)
+    full_mesh = linked_node.getMeshData()
+
+    trace = syntheticDragTrace(events)
+    drag_end = standin_clock.now() + trace[-1]["time"]
+    frame_timings = []
+    drawn = []
+
+    def renderFrame() -> None:
+        # Frames during the drag only, not while settling
+        if standin_clock.now() > drag_end:
+            return
+        mesh_data = linked_node.getMeshData()
+        data = linked_node.getWorldTransformation().getData()
+        frame_timings.append(
+            timeCall(lambda: mesh_data.getVertices() @ data[:3, :3].T.astype(numpy.float32) + data[:3, 3])
+        )
+        drawn.append(mesh_data.getVertexCount())
+
+    harness.frame_callbacks.append(renderFrame)
+    event_timings = harness.replay(trace, selected_node, linked_node)
+    restored = linked_node.getMeshData() is full_mesh
+    return event_timings, frame_timings, drawn, restored
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, nargs="+", default=[1000000])
+    parser.add_argument("--events", type=int, default=600)
+    arguments = parser.parse_args()
+
+    Harness()
+    from BananaSplit.ZeesawLevelOfDetail import ZeesawLevelOfDetail
+    from BananaSplit.ZeesawProxyJob import ZeesawProxyJob
+
+    ok = True
+    for face_count in arguments.faces:
+        mesh = buildMesh(face_count)
+        job = ZeesawProxyJob(mesh, ZeesawLevelOfDetail.TARGET_FACE_COUNT)
+        build_time = timeCall(job.run)
+        proxy = job.getResult()
+        print(
+            "{} faces: proxy of {} faces built in {:.0f} ms, {:.1f} MiB on top of {:.1f} MiB ({:.1f}%)".format(
+                mesh.getFaceCount(),
+                proxy.getFaceCount(),
+                build_time / 1000.0,
+                meshBytes(proxy) / 2.0 ** 20,
+                meshBytes(mesh) / 2.0 ** 20,
+                100.0 * meshBytes(proxy) / meshBytes(mesh),
+            )
+        )
+
+        for proxies in (False, True):
+            event_timings, frame_timings, drawn, restored = drag(mesh, arguments.events, proxies)
+            label = "proxies" if proxies else "full detail"
+            report("  {}: event".format(label), event_timings)
+            report("  {}: frame (render stand-in)".format(label), frame_timings)
+            print(
+                "    vertices drawn per frame p50 {:.0f}, full mesh restored after drag: {}".format(
+                    numpy.median(drawn), restored
+                )
+            )
+            ok &= restored
+
+    if not ok:
+        print("FAILED: the full mesh was not restored")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Mirror mode vs. the 180 degree rotation: cost of mirroring a mesh once, drag update latency in
+both modes, and checks that the mirrored twin really is the mirror image of the selected node with
+faces pointing outwards, that drags reuse the cached mesh and that turning the mode off restores it.
+
+    python benchmarks/mirror_mode_benchmark.py
+    python benchmarks/mirror_mode_benchmark.py --faces 1000000
+"""
+
+from bootstrap import report
+from harness import Harness, buildMesh, syntheticDragTrace, timeCall
+
+from UM.Math.Matrix import Matrix
+from UM.Math.Vector import Vector
+from UM.Mesh.MeshData import MeshData
+
+import argparse
+import math
+import numpy
+import sys
+
+
+def withNormals(mesh: MeshData) -> MeshData:
+    triangles = mesh.getVertices().reshape(-1, 3, 3).astype(numpy.float64)
+    normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    normals /= numpy.linalg.norm(normals, axis=1, keepdims=True) + 1.0e-12
+    return mesh.set(normals=numpy.repeat(normals, 3, axis=0).astype(numpy.float32))
+
+
+def tiltedTransformation(height: float) -> Matrix:
+    """Turned about the vertical axis and tipped over a bit, so that mirroring and rotating differ."""
+    yaw, tilt = math.radians(35.0), math.radians(20.0)
+    turn = numpy.array([[math.cos(yaw), 0, math.sin(yaw)], [0, 1, 0], [-math.sin(yaw), 0, math.cos(yaw)]])
+    tip = numpy.array([[1, 0, 0], [0, math.cos(tilt), -math.sin(tilt)], [0, math.sin(tilt), math.cos(tilt)]])
+    data = numpy.identity(4)
+    data[:3, :3] = turn @ tip
+    data[1, 3] = height
+    return Matrix(data)
+
+
+def worldTriangles(node) -> numpy.ndarray:
+    data = node.getWorldTransformation().getData()
+    vertices = node.getMeshData().getVertices().astype(numpy.float64)
+    return (vertices @ data[:3, :3].T + data[:3, 3]).reshape(-1, 3, 3)
+
+
+def faceNormals(triangles: numpy.ndarray) -> numpy.ndarray:
+    normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    return normals / (numpy.linalg.norm(normals, axis=1, keepdims=True) + 1.0e-12)
+
+
+def checkMirrorImage(selected_node, linked_node) -> bool:
+    """Twin triangles must be the selected ones mirrored along Y (and moved aside), with the winding
+    reversed so that faces and stored normals still point outwards.
+    """
+    selected = worldTriangles(selected_node)
+    linked = worldTriangles(linked_node)[:, ::-1]
+    mirrored = selected * numpy.array([1.0, -1.0, 1.0])
+    offset = (linked - mirrored).reshape(-1, 3).mean(axis=0)
+    geometry = numpy.allclose(linked, mirrored + offset, atol=1.0e-3) and abs(offset[1]) < 1.0e-3
+
+    expected_normals = faceNormals(selected) * numpy.array([1.0, -1.0, 1.0])
+    winding = numpy.mean(numpy.sum(faceNormals(linked[:, ::-1]) * expected_normals, axis=1) > 0.99) > 0.999
+
+    linear = linked_node.getWorldTransformation().getData()[:3, :3]
+    stored = linked_node.getMeshData().getNormals().astype(numpy.float64)[0::3] @ numpy.linalg.inv(linear)
+    stored /= numpy.linalg.norm(stored, axis=1, keepdims=True)
+    normals = numpy.mean(numpy.sum(stored * expected_normals, axis=1) > 0.99) > 0.999
+
+    determinant = numpy.linalg.det(linear) > 0.0
+    print(
+        "  mirror image: geometry {}, winding {}, normals {}, positive determinant {}".format(
+            geometry, winding, normals, determinant
+        )
+    )
+    return geometry and winding and normals and determinant
+
+
+def checkDerivedBounds(linked_node) -> bool:
+    """The box derived from the selected node must match the twin's geometry. The stand-in hulls are
+    approximate to a few micrometers.
+    """
+    derived = linked_node.callDecoration("getZeesawBoundingBox")
+    vertices = worldTriangles(linked_node).reshape(-1, 3)
+    same = numpy.allclose(
+        [derived.minimum.x, derived.minimum.y, derived.minimum.z], vertices.min(axis=0), atol=1.0e-2
+    ) and numpy.allclose([derived.maximum.x, derived.maximum.y, derived.maximum.z], vertices.max(axis=0), atol=1.0e-2)
+    print("  derived bounding box matches the mesh: {}".format(same))
+    return same
+
+
+def dragTimings(face_count: int, mirror: bool, events: int) -> list:
+    harness = Harness()
+    harness.tool.setMirror(mirror)
+    selected_node = harness.addNode(withNormals(buildMesh(face_count)), Vector(0.0, 0.0, 0.0))
+    selected_node.setTransformation(tiltedTransformation(0.0))
+    linked_node = harness.split(selected_node)
+    linked_mesh = linked_node.getMeshData()
+    harness.replay(syntheticDragTrace(events), selected_node, linked_node)
+    if linked_node.getMeshData() is not linked_mesh:
+        print("  the twin's mesh was replaced while dragging")
+        return []
+    return harness.update_timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, default=100000)
+    parser.add_argument("--events", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    harness = Harness()
+    from BananaSplit.MirrorMesh import mirrorMeshData
+
+    mesh = withNormals(buildMesh(arguments.faces))
+    print("{} faces".format(mesh.getFaceCount()))
+    report("  mirrorMeshData, once per mesh", [timeCall(lambda: mirrorMeshData(mesh)) for _ in range(5)])
+
+    ok = True
+    harness.tool.setMirror(True)
+    selected_node = harness.addNode(mesh, Vector(0.0, 0.0, 0.0))
+    selected_node.setTransformation(tiltedTransformation(-1.0))
+    linked_node = harness.split(selected_node)
+    ok &= checkMirrorImage(selected_node, linked_node)
+    ok &= checkDerivedBounds(linked_node)
+
+    # Clicking the twin makes it lead, which must keep both meshes as they are
+    linked_mesh = linked_node.getMeshData()
+    harness.select(linked_node)
+    linked_node.setPosition(Vector(linked_node.getWorldPosition().x, 3.0, linked_node.getWorldPosition().z))
+    harness.settle()
+    ok &= checkMirrorImage(linked_node, selected_node)
+    cached = linked_node.getMeshData() is linked_mesh and selected_node.getMeshData() is mesh
+    print("  meshes untouched when the twin leads: {}".format(cached))
+    ok &= cached
+
+    harness.select(selected_node)
+    harness.tool.setMirror(False)
+    restored = linked_node.getMeshData() is mesh
+    print("  turning mirror off shares the original mesh again: {}".format(restored))
+    harness.tool.setMirror(True)
+    reused = linked_node.getMeshData() is linked_mesh
+    print("  turning it back on reuses the cached mirror image: {}".format(reused))
+    ok &= restored and reused
+
+    harness.tool.setCut(True)
+    harness.settle()
+    above = worldTriangles(linked_node)[..., 1].min() > -1.0e-3
+    print("  trimmed mirror image stays above the build plate: {}".format(above))
+    ok &= above
+
+    rotation = dragTimings(arguments.faces, False, arguments.events)
+    mirror = dragTimings(arguments.faces, True, arguments.events)
+    ok &= bool(rotation) and bool(mirror)
+    if rotation and mirror:
+        report("  updateZeesaw, rotation", rotation)
+        report("  updateZeesaw, mirror", mirror)
+
+    if not ok:
+        print("FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Placing the twin of a split node on a crowded build plate: building the occupancy grid from the
+hulls of hundreds of nodes, finding the closest free spot, and whole splits. Fails if the twin
+overlaps another node or leaves the plate, if it doesn't keep the usual spot next to the original on
+an empty plate or on a full one, or if placement takes more than a few milliseconds.
+
+    python benchmarks/placement_benchmark.py
+    python benchmarks/placement_benchmark.py --nodes 100 1000
+"""
+
+from bootstrap import measure, report
+from harness import Harness, buildMesh, timeCall
+
+from cura.BuildVolume import BuildVolume
+from UM.Math.Vector import Vector
+
+from typing import Optional
+
+import argparse
+import math
+import numpy
+import sys
+
+# Spacing of the nodes filling the plate, a bit more than a banana
+PITCH = numpy.array([10.0, 7.0])
+
+
+def overlaps(a: numpy.ndarray, b: numpy.ndarray) -> bool:
+    """True if convex polygons a and b overlap, by looking for a separating axis among their edges."""
+    for polygon in (a, b):
+        edges = numpy.roll(polygon, -1, axis=0) - polygon
+        normals = numpy.stack((-edges[:, 1], edges[:, 0]), axis=1)
+        projected_a, projected_b = a @ normals.T, b @ normals.T
+        separated = (projected_a.max(axis=0) <= projected_b.min(axis=0)) | (
+            projected_b.max(axis=0) <= projected_a.min(axis=0)
+        )
+        if separated.any():
+            return False
+    return True
+
+
+def fillPlate(harness: Harness, count: Optional[int], side: float, keep_clear: numpy.ndarray, holes: int, rng) -> None:
+    """Put up to count small nodes on a grid over the plate, or as many as fit if count is None,
+    leaving the area around keep_clear and a few random holes big enough for a twin free.
+    """
+    mesh = buildMesh(1000)
+    columns = int(side // PITCH[0])
+    rows = int(side // PITCH[1])
+    grid = numpy.stack(numpy.meshgrid(numpy.arange(columns), numpy.arange(rows)), axis=-1).reshape(-1, 2)
+    positions = (grid + 0.5) * PITCH - side / 2.0
+    free = (numpy.abs(positions - keep_clear[:2]) < keep_clear[2:]).all(axis=1)
+    for center in rng.uniform(-side / 2.0 + 30.0, side / 2.0 - 30.0, (holes, 2)):
+        free |= (numpy.abs(positions - center) < [28.0, 20.0]).all(axis=1)
+    for x, z in positions[~free][:count]:
+        harness.addNode(mesh, Vector(x, 0.0, z))
+
+
+def split(harness: Harness, node):
+    twin = harness.split(node)
+    harness.settle()
+    return twin
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[100, 500])
+    arguments = parser.parse_args()
+
+    ok = True
+    rng = numpy.random.default_rng(3)
+    mesh = buildMesh(10000)
+    for count in [0] + arguments.nodes:
+        side = max(math.sqrt(count * PITCH[0] * PITCH[1] * 1.3), 120.0)
+        for name, holes in (("with holes", 4), ("full", 0)):
+            if count == 0 and holes == 0:
+                continue
+            harness = Harness()
+            harness.application.setBuildVolume(BuildVolume(side, side))
+            node = harness.addNode(mesh, Vector(0.0, 0.0, 0.0))
+            node.scale(Vector(4.0, 4.0, 4.0))
+            bbox = node.getBoundingBox()
+            keep_clear = numpy.array([0.0, 0.0, bbox.width / 2.0 + 6.0, bbox.depth / 2.0 + 6.0])
+            fillPlate(harness, count if holes else None, side, keep_clear, holes, rng)
+            others = [child for child in harness.scene.getRoot().getChildren() if child is not node]
+            harness.settle()
+
+            tool = harness.tool
+            default_x = bbox.center.x * 2.0 - node.getWorldPosition().x + bbox.width + 4.0
+            plate = node.callDecoration("getBuildPlateNumber")
+            timings = measure(
+                lambda: tool._findTwinPosition(node, tool._createOccupancyGrids([node])[plate], default_x, 0.0), 20
+            )
+            split_time = timeCall(lambda: split(harness, node))
+            twin = next(
+                child for child in harness.scene.getRoot().getChildren() if child not in others and child is not node
+            )
+
+            hull = twin.callDecoration("getConvexHull").getPoints()
+            overlapping = sum(
+                overlaps(hull, other.callDecoration("getConvexHull").getPoints()) for other in others + [node]
+            )
+            on_plate = (numpy.abs(hull) <= side / 2.0 - 1.0).all()
+            position = twin.getWorldPosition()
+            moved = math.hypot(position.x - default_x, position.z)
+            print("{} nodes, {}, plate {:.0f} mm:".format(len(others), name, side))
+            report("  occupancy grid and twin position", timings)
+            print(
+                "    split {:.1f} ms, twin {:.1f} mm from the usual spot, overlapping {} nodes, on plate: {}".format(
+                    split_time / 1000.0, moved, overlapping, on_plate
+                )
+            )
+            ok &= numpy.median(timings) < 20000.0
+            if holes:
+                ok &= overlapping == 0 and on_plate
+            if count == 0 or not holes:
+                # Nothing in the way or no room anywhere, so the usual spot
+                ok &= moved < 1.0e-6
+
+    if not ok:
+        print("FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Cost of cutting banana.stl (tiled up to bigger meshes) in half with PlanarCut, split into the
+vectorized clipping and the capping of the cut.
+
+    python benchmarks/planar_cut_benchmark.py
+"""
+
+from bootstrap import loadPluginModule, loadStl, measure, report, tileTriangles
+
+import numpy
+
+PlanarCut = loadPluginModule("PlanarCut")
+
+
+def main() -> None:
+    banana = loadStl()
+    normal = numpy.array([0.0, 1.0, 0.0])
+    offset = -float(banana[..., 1].mean())
+
+    for face_count in (15000, 150000, 1500000):
+        triangles = tileTriangles(banana, face_count)
+        upper, lower, segments = PlanarCut.clipTriangles(triangles, normal, offset)
+        report(
+            "clip, {} faces".format(len(triangles)),
+            measure(lambda: PlanarCut.clipTriangles(triangles, normal, offset), 5),
+        )
+        report(
+            "cap, {} segments".format(len(segments)),
+            measure(lambda: PlanarCut.capTriangles(segments, normal), 5),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Links surviving a saved project: split pairs are saved with their per-object metadata like a 3MF
+project would keep it, loaded into a fresh scene, and relinked in one pass once loading completes.
+The project is then loaded a second time next to the first. Fails if a pair, or whether it's
+mirrored, doesn't come back, if copies share ids, or if selecting pairs repairs any links.
+
+    python benchmarks/project_relink_benchmark.py
+    python benchmarks/project_relink_benchmark.py --pairs 100 1000
+"""
+
+from harness import Harness, buildMesh, timeCall
+
+from UM.Math.Matrix import Matrix
+from UM.Math.Vector import Vector
+
+import argparse
+import sys
+
+
+class MetadataEntry:
+    """Values read back from a project come wrapped like this."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+def save(harness: Harness) -> list:
+    return [
+        (node.getMeshData(), node.getLocalTransformation().getData().copy(), dict(node.metadata))
+        for node in harness.scene.getRoot().getChildren()
+    ]
+
+
+def load(harness: Harness, project: list) -> None:
+    for mesh, transformation, metadata in project:
+        node = harness.addNode(mesh)
+        node.setTransformation(Matrix(transformation))
+        node.metadata = {key: MetadataEntry(value) for key, value in metadata.items()}
+    harness.application.fileCompleted.emit("project.3mf")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, nargs="+", default=[100, 500])
+    arguments = parser.parse_args()
+
+    ok = True
+    mesh = buildMesh(1000)
+    for pair_count in arguments.pairs:
+        harness = Harness()
+        nodes = [
+            harness.addNode(mesh, Vector(15.0 * (index % 20), 0.0, 15.0 * (index // 20))) for index in range(pair_count)
+        ]
+        harness.select(*nodes[: pair_count // 2])
+        harness.tool.setMirror(True)
+        harness.tool.split()
+        harness.select(*nodes[pair_count // 2 :])
+        harness.tool.setMirror(False)
+        harness.tool.split()
+        harness.spin()
+        project = save(harness)
+
+        harness = Harness()
+        load(harness, project)
+        relink_time = timeCall(harness.spin)
+        first = list(harness.scene.getRoot().getChildren())
+        load(harness, project)
+        second_time = timeCall(harness.spin)
+        loaded = list(harness.scene.getRoot().getChildren())
+
+        linked = [harness.tool._findLinkedNode(node) for node in loaded]
+        restored = all(linked) and all(
+            harness.tool._findLinkedNode(other) is node for node, other in zip(loaded, linked)
+        )
+        separate = all((node in first) == (other in first) for node, other in zip(loaded, linked))
+        mirrored = sum(bool(node.callDecoration("isZeesawMirrored")) for node in loaded)
+        ids = {node.callDecoration("zeesawNodeId") for node in loaded}
+
+        # Selecting linked nodes must not touch their decorators
+        repairs = [0]
+        add_link_decorators = harness.tool._addLinkDecorators
+        harness.tool._addLinkDecorators = lambda *args: (
+            repairs.__setitem__(0, repairs[0] + 1),
+            add_link_decorators(*args),
+        )
+        harness.select(*loaded)
+        selected_pairs = len(harness.tool._getSelectedPairs())
+
+        print(
+            "{} pairs: relinked in {:.2f} ms, second copy relinked in {:.2f} ms".format(
+                pair_count, relink_time / 1000.0, second_time / 1000.0
+            )
+        )
+        print(
+            "  {} of {} nodes linked back, {} mirrored, {} distinct ids, {} selected pairs, {} repairs".format(
+                sum(map(bool, linked)), len(loaded), mirrored, len(ids), selected_pairs, repairs[0]
+            )
+        )
+        ok &= restored and separate and len(loaded) == 4 * pair_count and len(ids) == len(loaded)
+        ok &= mirrored == 4 * (pair_count // 2) and selected_pairs == 2 * pair_count and repairs[0] == 0
+
+    if not ok:
+        print("FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
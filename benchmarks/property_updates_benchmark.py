@@ -0,0 +1,73 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Counts property evaluations and propertyChanged emissions per user action: selecting a node,
+clicking its twin, enabling zeesaw and dragging. Fails if an action notifies the panel more than once,
+or if an action that changes nothing notifies it at all.
+
+    python benchmarks/property_updates_benchmark.py
+"""
+
+from harness import Harness, buildMesh, syntheticDragTrace
+
+from UM.Math.Vector import Vector
+
+import sys
+
+
+def main() -> int:
+    harness = Harness()
+    harness.addBackground(10)
+    mesh = buildMesh(10000)
+    selected_node = harness.addNode(mesh, Vector(0.0, 0.0, 0.0))
+    linked_node = harness.split(selected_node)
+    other_node = harness.addNode(mesh, Vector(100.0, 0.0, 0.0))
+    harness.select(other_node)
+    harness.activateTool()
+
+    tool = harness.tool
+    emissions = [0]
+    evaluations = [0]
+    tool.propertyChanged.connect(lambda: emissions.__setitem__(0, emissions[0] + 1))
+    update = tool._updateProperties
+
+    def countedUpdate() -> None:
+        evaluations[0] += 1
+        update()
+
+    tool._updateProperties = countedUpdate
+
+    def clickTwin() -> None:
+        harness.select(linked_node)
+        tool.enableZeesaw()
+
+    def drag() -> None:
+        harness.replay(syntheticDragTrace(100), selected_node, linked_node)
+
+    # Expected number of notifications: 0 when the panel state stays the same, else 1
+    actions = [
+        ("select linked node", lambda: harness.select(selected_node), 1),
+        ("click twin", clickTwin, 0),
+        ("select again", lambda: harness.select(linked_node), 0),
+        ("select unlinked node", lambda: harness.select(other_node), 1),
+        ("select linked node", lambda: harness.select(selected_node), 1),
+        ("drag 100 events", drag, 0),
+    ]
+
+    failed = False
+    for name, action, expected in actions:
+        emissions[0] = 0
+        evaluations[0] = 0
+        action()
+        harness.spin()
+        print("  {:<22} {:>4} evaluations {:>4} propertyChanged".format(name, evaluations[0], emissions[0]))
+        if emissions[0] != expected:
+            failed = True
+
+    if failed:
+        print("FAILED: property notifications do not follow state changes")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
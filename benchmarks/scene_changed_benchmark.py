@@ -0,0 +1,101 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Counts sceneChanged emissions per drag event by the node they come from, while rendering the link
+indicator every frame with a turning camera. Fails if rendering changes the scene or if property
+updates emit without a state change.
+
+    python benchmarks/scene_changed_benchmark.py
+"""
+
+from bootstrap import REPOSITORY_DIR, loadStl
+from harness import Harness, buildMesh, syntheticDragTrace
+
+from UM.Math.Quaternion import Quaternion
+from UM.Math.Vector import Vector
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.Camera import Camera
+from UM.View.Renderer import Renderer
+
+import collections
+import os
+import sys
+
+
+def main() -> int:
+    harness = Harness()
+    harness.addBackground(10)
+    selected_node = harness.addNode(buildMesh(10000))
+    linked_node = harness.split(selected_node)
+    harness.select(selected_node)
+    harness.activateTool()
+
+    camera = Camera()
+    harness.scene.setActiveCamera(camera)
+    clippy = harness.tool._clippy
+    link = loadStl(os.path.join(REPOSITORY_DIR, "BananaSplit", "resources", "link.stl")) * 0.3
+    clippy._link_mesh = MeshData(vertices=link.reshape(-1, 3))
+
+    sources = collections.Counter()
+    rendering = [False]
+    render_emissions = [0]
+
+    def onSceneChanged(node) -> None:
+        if rendering[0]:
+            render_emissions[0] += 1
+        elif node is clippy:
+            sources["indicator"] += 1
+        elif node is selected_node:
+            sources["selected"] += 1
+        elif node is linked_node:
+            sources["linked"] += 1
+        else:
+            sources["other"] += 1
+
+    renderer = Renderer()
+    frames = [0]
+
+    def renderFrame() -> None:
+        # Orbit for a while, then hold still
+        frames[0] += 1
+        if frames[0] < 120:
+            angle = frames[0] * 0.01
+            camera.setOrientation(Quaternion.fromAngleAxis(angle, Vector(0, 1, 0)))
+        rendering[0] = True
+        renderer.beginRendering()
+        clippy.render(renderer)
+        rendering[0] = False
+
+    harness.scene.sceneChanged.connect(onSceneChanged)
+    harness.frame_callbacks.append(renderFrame)
+
+    trace = syntheticDragTrace(1000)
+    harness.replay(trace, selected_node, linked_node)
+    events = len(trace)
+    print("{} drag events, {} frames rendered".format(events, frames[0]))
+    for source in ("selected", "linked", "indicator", "other"):
+        print(
+            "  {:<10} {:>8} sceneChanged   {:>6.2f} per event".format(source, sources[source], sources[source] / events)
+        )
+    print("  {:<10} {:>8} sceneChanged".format("rendering", render_emissions[0]))
+
+    # Without any state change, property updates must stay quiet. The first one may still catch up
+    # with the last zeesaw update
+    harness.tool._updateProperties()
+    sources.clear()
+    for _ in range(100):
+        harness.tool._updateProperties()
+    idle_emissions = sum(sources.values())
+    print("  {:<10} {:>8} sceneChanged in 100 idle property updates".format("idle", idle_emissions))
+
+    billboard = renderer.getQueue()[0][1]["mesh"] if renderer.getQueue() else None
+    print("  billboard mesh cached: {}".format(billboard is clippy._getBillboardMesh()))
+
+    failed = render_emissions[0] > 0 or idle_emissions > 0
+    if failed:
+        print("FAILED: the link indicator changes the scene without a state change")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
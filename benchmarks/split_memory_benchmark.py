@@ -0,0 +1,58 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Memory and latency of copying a node for a split: plain deepcopy vs. deepcopySharingMeshes, on
+banana.stl tiled up to scan-sized meshes. Like CuraSceneNode, a plain deepcopy shares the mesh data
+already and only copies the source mesh data, which deepcopySharingMeshes shares too.
+
+    python benchmarks/split_memory_benchmark.py
+"""
+
+from bootstrap import loadPluginModule, loadStl, tileTriangles
+
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+
+import copy
+import time
+import tracemalloc
+
+SharedMeshCopy = loadPluginModule("SharedMeshCopy")
+
+
+def buildNode(face_count: int) -> SceneNode:
+    triangles = tileTriangles(loadStl(), face_count).astype("float32")
+    node = SceneNode()
+    node.setMeshData(MeshData(vertices=triangles.reshape(-1, 3), normals=triangles.reshape(-1, 3)))
+    node.source_mesh_data = node.getMeshData()
+    return node
+
+
+def profile(function, node: SceneNode):
+    tracemalloc.start()
+    start = time.perf_counter()
+    copied = function(node)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return copied, elapsed, allocated / 1024.0 / 1024.0
+
+
+def main() -> None:
+    for face_count in (150000, 1000000, 5000000):
+        node = buildNode(face_count)
+        for label, function in (("deepcopy", copy.deepcopy), ("shared", SharedMeshCopy.deepcopySharingMeshes)):
+            copied, elapsed, allocated = profile(function, node)
+            print(
+                "{:<10} {:>8} faces {:>10.2f} ms {:>10.1f} MiB   shares buffers: {}".format(
+                    label,
+                    node.getMeshData().getFaceCount(),
+                    elapsed,
+                    allocated,
+                    copied.getMeshData() is node.getMeshData(),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
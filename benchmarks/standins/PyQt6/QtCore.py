@@ -0,0 +1,69 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for the bits of PyQt6.QtCore the plugin uses. QTimer runs on the virtual clock and fires
+from processTimers(), which the harness calls as it advances time.
+"""
+
+from UM.Signal import Signal
+
+import standin_clock
+
+QT_VERSION_STR = "6.6.0"
+
+
+class Qt:
+    class Key:
+        Key_B = 66
+
+    Key_B = 66
+
+
+class QTimer:
+    _active = []
+
+    def __init__(self) -> None:
+        self.timeout = Signal()
+        self._single_shot = False
+        self._interval = 0
+        self._deadline = None
+
+    def setSingleShot(self, single_shot: bool) -> None:
+        self._single_shot = single_shot
+
+    def setInterval(self, msec: int) -> None:
+        self._interval = msec
+
+    def interval(self) -> int:
+        return self._interval
+
+    def isActive(self) -> bool:
+        return self._deadline is not None
+
+    def start(self, msec: int = None) -> None:
+        if msec is not None:
+            self._interval = msec
+        self._deadline = standin_clock.now() + self._interval / 1000.0
+        if self not in QTimer._active:
+            QTimer._active.append(self)
+
+    def stop(self) -> None:
+        self._deadline = None
+        if self in QTimer._active:
+            QTimer._active.remove(self)
+
+
+def processTimers() -> int:
+    """Fire every timer that is due on the virtual clock. Returns the number of timeouts."""
+    fired = 0
+    while True:
+        due = [timer for timer in QTimer._active if timer._deadline <= standin_clock.now()]
+        if not due:
+            return fired
+        timer = min(due, key=lambda timer: timer._deadline)
+        if timer._single_shot:
+            timer.stop()
+        else:
+            timer._deadline += max(timer._interval, 1) / 1000.0
+        timer.timeout.emit()
+        fired += 1
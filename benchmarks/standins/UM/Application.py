@@ -0,0 +1,88 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Application. Calls made with callLater queue up until processEvents() runs
+them, like the Qt event loop would.
+"""
+
+from UM.Mesh.MeshFileHandler import MeshFileHandler
+from UM.Operations.OperationStack import OperationStack
+from UM.Scene.Scene import Scene
+from UM.Signal import Signal
+from UM.Version import Version
+
+from collections import deque
+
+
+class Preferences:
+    def __init__(self) -> None:
+        self._values = {"physics/automatic_drop_down": False}
+
+    def getValue(self, key: str):
+        return self._values.get(key)
+
+    def setValue(self, key: str, value) -> None:
+        self._values[key] = value
+
+
+class Controller:
+    def __init__(self) -> None:
+        self._scene = Scene()
+        self._active_tool = None
+        self.toolOperationStarted = Signal()
+        self.toolOperationStopped = Signal()
+
+    def getScene(self) -> Scene:
+        return self._scene
+
+    def getActiveTool(self):
+        return self._active_tool
+
+    def setActiveTool(self, tool) -> None:
+        self._active_tool = tool
+
+
+class Application:
+    _instance = None
+
+    def __init__(self, version: str = "5.7.0") -> None:
+        Application._instance = self
+        self._version = Version(version)
+        self._controller = Controller()
+        self._operation_stack = OperationStack()
+        self._preferences = Preferences()
+        self._mesh_file_handler = MeshFileHandler()
+        self._later = deque()
+
+        self.engineCreatedSignal = Signal()
+
+    @classmethod
+    def getInstance(cls) -> "Application":
+        return cls._instance
+
+    def getVersion(self) -> Version:
+        return self._version
+
+    def getController(self) -> Controller:
+        return self._controller
+
+    def getOperationStack(self) -> OperationStack:
+        return self._operation_stack
+
+    def getPreferences(self) -> Preferences:
+        return self._preferences
+
+    def getMeshFileHandler(self) -> MeshFileHandler:
+        return self._mesh_file_handler
+
+    def callLater(self, function, *args, **kwargs) -> None:
+        self._later.append((function, args, kwargs))
+
+    def processEvents(self) -> int:
+        """Run everything queued with callLater, including calls queued meanwhile."""
+        count = 0
+        while self._later:
+            function, args, kwargs = self._later.popleft()
+            function(*args, **kwargs)
+            count += 1
+        return count
@@ -0,0 +1,16 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Event."""
+
+
+class Event:
+    ToolActivateEvent = 100
+    ToolDeactivateEvent = 101
+
+    def __init__(self, event_type: int) -> None:
+        self._type = event_type
+
+    @property
+    def type(self) -> int:
+        return self._type
@@ -0,0 +1,36 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Job."""
+
+from UM.JobQueue import JobQueue
+from UM.Signal import Signal
+
+
+class Job:
+    def __init__(self) -> None:
+        self._running = False
+        self._finished = False
+        self._result = None
+        self.finished = Signal()
+
+    def run(self) -> None:
+        raise NotImplementedError()
+
+    def start(self) -> None:
+        JobQueue.getInstance().add(self)
+
+    def cancel(self) -> None:
+        JobQueue.getInstance().remove(self)
+
+    def getResult(self):
+        return self._result
+
+    def setResult(self, result) -> None:
+        self._result = result
+
+    def isRunning(self) -> bool:
+        return self._running
+
+    def isFinished(self) -> bool:
+        return self._finished
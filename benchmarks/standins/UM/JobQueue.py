@@ -0,0 +1,40 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.JobQueue. Jobs run on the calling thread when processJobs() is called, which
+keeps replays deterministic while still deferring the work like a worker thread would.
+"""
+
+from collections import deque
+
+
+class JobQueue:
+    _instance = None
+
+    def __init__(self) -> None:
+        self._jobs = deque()
+
+    @classmethod
+    def getInstance(cls) -> "JobQueue":
+        if cls._instance is None:
+            cls._instance = JobQueue()
+        return cls._instance
+
+    def add(self, job) -> None:
+        self._jobs.append(job)
+
+    def remove(self, job) -> None:
+        if job in self._jobs:
+            self._jobs.remove(job)
+
+    def processJobs(self) -> int:
+        count = 0
+        while self._jobs:
+            job = self._jobs.popleft()
+            job._running = True
+            job.run()
+            job._running = False
+            job._finished = True
+            job.finished.emit(job)
+            count += 1
+        return count
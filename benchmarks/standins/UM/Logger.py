@@ -0,0 +1,32 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Logger. Messages are kept in memory for inspection."""
+
+
+class Logger:
+    messages = []
+
+    @classmethod
+    def log(cls, log_type: str, message: str, *args, **kwargs) -> None:
+        cls.messages.append((log_type, message % args if args else message))
+
+    @classmethod
+    def debug(cls, message: str, *args, **kwargs) -> None:
+        cls.log("d", message, *args)
+
+    @classmethod
+    def info(cls, message: str, *args, **kwargs) -> None:
+        cls.log("i", message, *args)
+
+    @classmethod
+    def warning(cls, message: str, *args, **kwargs) -> None:
+        cls.log("w", message, *args)
+
+    @classmethod
+    def error(cls, message: str, *args, **kwargs) -> None:
+        cls.log("e", message, *args)
+
+    @classmethod
+    def logException(cls, log_type: str, message: str, *args) -> None:
+        cls.log(log_type, message, *args)
@@ -0,0 +1,77 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Math.AxisAlignedBox."""
+
+from UM.Math.Vector import Vector
+
+import numpy
+
+
+class AxisAlignedBox:
+    def __init__(self, minimum=None, maximum=None) -> None:
+        minimum = Vector() if minimum is None else minimum
+        maximum = Vector() if maximum is None else maximum
+        if not isinstance(minimum, Vector):
+            minimum = Vector(data=minimum)
+        if not isinstance(maximum, Vector):
+            maximum = Vector(data=maximum)
+        self._min = Vector(data=numpy.minimum(minimum.getData(), maximum.getData()))
+        self._max = Vector(data=numpy.maximum(minimum.getData(), maximum.getData()))
+
+    @property
+    def minimum(self) -> Vector:
+        return self._min
+
+    @property
+    def maximum(self) -> Vector:
+        return self._max
+
+    @property
+    def center(self) -> Vector:
+        return (self._min + self._max) / 2.0
+
+    @property
+    def width(self) -> float:
+        return self._max.x - self._min.x
+
+    @property
+    def height(self) -> float:
+        return self._max.y - self._min.y
+
+    @property
+    def depth(self) -> float:
+        return self._max.z - self._min.z
+
+    @property
+    def left(self) -> float:
+        return self._min.x
+
+    @property
+    def right(self) -> float:
+        return self._max.x
+
+    @property
+    def bottom(self) -> float:
+        return self._min.y
+
+    @property
+    def top(self) -> float:
+        return self._max.y
+
+    @property
+    def back(self) -> float:
+        return self._min.z
+
+    @property
+    def front(self) -> float:
+        return self._max.z
+
+    def __add__(self, other: "AxisAlignedBox") -> "AxisAlignedBox":
+        return AxisAlignedBox(
+            Vector(data=numpy.minimum(self._min.getData(), other._min.getData())),
+            Vector(data=numpy.maximum(self._max.getData(), other._max.getData())),
+        )
+
+    def __repr__(self) -> str:
+        return "AxisAlignedBox(min={}, max={})".format(self._min, self._max)
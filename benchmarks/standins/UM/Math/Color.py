@@ -0,0 +1,9 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Math.Color."""
+
+
+class Color:
+    def __init__(self, r: float = 0, g: float = 0, b: float = 0, a: float = 0) -> None:
+        self._data = (r, g, b, a)
@@ -0,0 +1,68 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Math.Matrix. Row-major 4x4 float64 data like Uranium's."""
+
+from UM.Math.Vector import Vector
+
+import numpy
+
+
+class Matrix:
+    def __init__(self, data=None) -> None:
+        if data is None:
+            self._data = numpy.identity(4, dtype=numpy.float64)
+        else:
+            self._data = numpy.array(data, dtype=numpy.float64)
+
+    def getData(self) -> numpy.ndarray:
+        return self._data
+
+    def copy(self) -> "Matrix":
+        return Matrix(self._data)
+
+    def multiply(self, other: "Matrix", copy: bool = False) -> "Matrix":
+        if copy:
+            return Matrix(numpy.dot(self._data, other._data))
+        self._data = numpy.dot(self._data, other._data)
+        return self
+
+    def preMultiply(self, other: "Matrix", copy: bool = False) -> "Matrix":
+        if copy:
+            return Matrix(numpy.dot(other._data, self._data))
+        self._data = numpy.dot(other._data, self._data)
+        return self
+
+    def getInverse(self) -> "Matrix":
+        return Matrix(numpy.linalg.inv(self._data))
+
+    def getTransposed(self) -> "Matrix":
+        return Matrix(self._data.T)
+
+    def getTranslation(self) -> Vector:
+        return Vector(data=self._data[:3, 3])
+
+    def setByTranslation(self, direction: Vector) -> None:
+        self._data = numpy.identity(4, dtype=numpy.float64)
+        self._data[:3, 3] = direction.getData()
+
+    def translate(self, direction: Vector) -> None:
+        translation = Matrix()
+        translation.setByTranslation(direction)
+        self.multiply(translation)
+
+    def setByScaleVector(self, scale: Vector) -> None:
+        self._data = numpy.diag([scale.x, scale.y, scale.z, 1.0])
+
+    def setByQuaternion(self, quaternion) -> None:
+        self._data = numpy.identity(4, dtype=numpy.float64)
+        self._data[:3, :3] = quaternion.toMatrixData()
+
+    def __eq__(self, other) -> bool:
+        # Exact comparison, like Uranium's
+        if self is other:
+            return True
+        return isinstance(other, Matrix) and numpy.array_equal(self._data, other._data)
+
+    def __repr__(self) -> str:
+        return "Matrix({})".format(self._data.tolist())
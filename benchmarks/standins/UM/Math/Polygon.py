@@ -0,0 +1,46 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Math.Polygon."""
+
+import numpy
+
+
+class Polygon:
+    def __init__(self, points=None) -> None:
+        self._points = numpy.zeros((0, 2)) if points is None else numpy.asarray(points, dtype=numpy.float64)
+
+    def getPoints(self) -> numpy.ndarray:
+        return self._points
+
+    def isValid(self) -> bool:
+        return len(self._points) >= 3
+
+    def getConvexHull(self) -> "Polygon":
+        """Monotone chain hull, counter-clockwise."""
+        # Sorted by x then y without duplicates. numpy.unique(axis=0) gets there too, but slowly
+        points = self._points[numpy.lexsort((self._points[:, 1], self._points[:, 0]))]
+        if len(points):
+            points = points[numpy.r_[True, (points[1:] != points[:-1]).any(axis=1)]]
+        if len(points) > 3:
+            # Only the lowest and highest point of each column can be on the hull
+            starts = numpy.flatnonzero(numpy.r_[True, points[1:, 0] != points[:-1, 0]])
+            ends = numpy.r_[starts[1:], len(points)] - 1
+            points = points[numpy.unique(numpy.concatenate((starts, ends)))]
+        if len(points) < 3:
+            return Polygon(points)
+
+        def chain(ordered):
+            hull = []
+            for point in ordered.tolist():
+                while len(hull) >= 2:
+                    a, b = hull[-2], hull[-1]
+                    if (b[0] - a[0]) * (point[1] - a[1]) - (b[1] - a[1]) * (point[0] - a[0]) > 0:
+                        break
+                    hull.pop()
+                hull.append(point)
+            return hull[:-1]
+
+        lower = chain(points)
+        upper = chain(points[::-1])
+        return Polygon(numpy.array(lower + upper))
@@ -0,0 +1,46 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Math.Quaternion. Just enough for orienting nodes towards a camera."""
+
+import numpy
+
+
+class Quaternion:
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 1.0) -> None:
+        self._data = numpy.array([x, y, z, w], dtype=numpy.float64)
+
+    @property
+    def x(self) -> float:
+        return float(self._data[0])
+
+    @property
+    def y(self) -> float:
+        return float(self._data[1])
+
+    @property
+    def z(self) -> float:
+        return float(self._data[2])
+
+    @property
+    def w(self) -> float:
+        return float(self._data[3])
+
+    def __neg__(self) -> "Quaternion":
+        # Conjugate, which is the inverse of a unit quaternion
+        return Quaternion(-self.x, -self.y, -self.z, self.w)
+
+    def toMatrixData(self) -> numpy.ndarray:
+        x, y, z, w = self._data
+        return numpy.array(
+            [
+                [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+            ]
+        )
+
+    @staticmethod
+    def fromAngleAxis(angle: float, axis) -> "Quaternion":
+        s = numpy.sin(angle / 2.0)
+        return Quaternion(axis.x * s, axis.y * s, axis.z * s, numpy.cos(angle / 2.0))
@@ -0,0 +1,70 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Math.Vector."""
+
+import numpy
+
+
+class Vector:
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, data=None) -> None:
+        if data is not None:
+            self._data = numpy.array(data, dtype=numpy.float64)
+        else:
+            self._data = numpy.array([x, y, z], dtype=numpy.float64)
+
+    @property
+    def x(self) -> float:
+        return float(self._data[0])
+
+    @property
+    def y(self) -> float:
+        return float(self._data[1])
+
+    @property
+    def z(self) -> float:
+        return float(self._data[2])
+
+    def getData(self) -> numpy.ndarray:
+        return self._data
+
+    def set(self, x=None, y=None, z=None) -> "Vector":
+        return Vector(
+            self.x if x is None else x,
+            self.y if y is None else y,
+            self.z if z is None else z,
+        )
+
+    def equals(self, other: "Vector", epsilon: float = 1e-6) -> bool:
+        return bool(numpy.all(numpy.abs(self._data - other._data) < epsilon))
+
+    def length(self) -> float:
+        return float(numpy.linalg.norm(self._data))
+
+    def __add__(self, other: "Vector") -> "Vector":
+        return Vector(data=self._data + other._data)
+
+    def __sub__(self, other: "Vector") -> "Vector":
+        return Vector(data=self._data - other._data)
+
+    def __mul__(self, other) -> "Vector":
+        if isinstance(other, Vector):
+            return Vector(data=self._data * other._data)
+        return Vector(data=self._data * other)
+
+    def __truediv__(self, other) -> "Vector":
+        if isinstance(other, Vector):
+            return Vector(data=self._data / other._data)
+        return Vector(data=self._data / other)
+
+    def __neg__(self) -> "Vector":
+        return Vector(data=-self._data)
+
+    def __repr__(self) -> str:
+        return "Vector({:.4f}, {:.4f}, {:.4f})".format(self.x, self.y, self.z)
+
+
+Vector.Null = Vector()
+Vector.Unit_X = Vector(1, 0, 0)
+Vector.Unit_Y = Vector(0, 1, 0)
+Vector.Unit_Z = Vector(0, 0, 1)
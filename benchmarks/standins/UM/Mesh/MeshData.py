@@ -0,0 +1,117 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Mesh.MeshData. Immutable vertex, normal and index buffers."""
+
+from typing import Optional
+
+import numpy
+
+
+def _immutable(data: Optional[numpy.ndarray]) -> Optional[numpy.ndarray]:
+    if data is None:
+        return None
+    data = numpy.array(data, copy=True)
+    data.flags.writeable = False
+    return data
+
+
+class MeshData:
+    def __init__(self, vertices=None, normals=None, indices=None, colors=None, uvs=None, file_name=None, **kwargs):
+        self._vertices = _immutable(vertices)
+        self._normals = _immutable(normals)
+        self._indices = _immutable(indices)
+        self._colors = _immutable(colors)
+        self._uvs = _immutable(uvs)
+        self._file_name = file_name
+        self._vertex_count = len(self._vertices) if self._vertices is not None else 0
+        self._face_count = len(self._indices) if self._indices is not None else self._vertex_count // 3
+        self._hull_vertices = None
+
+    def getVertices(self) -> Optional[numpy.ndarray]:
+        return self._vertices
+
+    def getNormals(self) -> Optional[numpy.ndarray]:
+        return self._normals
+
+    def getIndices(self) -> Optional[numpy.ndarray]:
+        return self._indices
+
+    def getColors(self) -> Optional[numpy.ndarray]:
+        return self._colors
+
+    def getUVCoordinates(self) -> Optional[numpy.ndarray]:
+        return self._uvs
+
+    def hasIndices(self) -> bool:
+        return self._indices is not None
+
+    def getVertexCount(self) -> int:
+        return self._vertex_count
+
+    def getFaceCount(self) -> int:
+        return self._face_count
+
+    def getFileName(self) -> Optional[str]:
+        return self._file_name
+
+    def set(
+        self, vertices=None, normals=None, indices=None, colors=None, uvs=None, file_name=None, **kwargs
+    ) -> "MeshData":
+        return MeshData(
+            vertices=self._vertices if vertices is None else vertices,
+            normals=self._normals if normals is None else normals,
+            indices=self._indices if indices is None else indices,
+            colors=self._colors if colors is None else colors,
+            uvs=self._uvs if uvs is None else uvs,
+            file_name=self._file_name if file_name is None else file_name,
+        )
+
+    def getTransformed(self, transformation) -> "MeshData":
+        data = transformation.getData()
+        vertices = self._vertices @ data[:3, :3].T + data[:3, 3]
+        normals = None
+        if self._normals is not None:
+            normals = self._normals @ numpy.linalg.inv(data[:3, :3])
+            normals /= numpy.linalg.norm(normals, axis=1, keepdims=True)
+        return MeshData(vertices=vertices, normals=normals, indices=self._indices, file_name=self._file_name)
+
+    def getConvexHullVertices(self) -> Optional[numpy.ndarray]:
+        """Uranium hulls the mesh once with scipy and takes extents from the hull. Without scipy the
+        stand-in keeps the vertices that are extreme along a fixed set of directions, which is a
+        close approximation at the same cost per call.
+        """
+        if self._hull_vertices is None and self._vertices is not None:
+            extreme = set()
+            for start in range(0, len(self._vertices), 1 << 18):
+                chunk = self._vertices[start : start + (1 << 18)] @ _HULL_DIRECTIONS.T
+                extreme.update((numpy.argmax(chunk, axis=0) + start).tolist())
+                extreme.update((numpy.argmin(chunk, axis=0) + start).tolist())
+            candidates = self._vertices[sorted(extreme)].astype(numpy.float64)
+            scores = candidates @ _HULL_DIRECTIONS.T
+            keep = numpy.union1d(numpy.argmax(scores, axis=0), numpy.argmin(scores, axis=0))
+            self._hull_vertices = candidates[keep]
+        return self._hull_vertices
+
+    def getExtents(self, matrix=None):
+        from UM.Math.AxisAlignedBox import AxisAlignedBox
+
+        data = self.getConvexHullVertices()
+        if data is None:
+            return None
+        if matrix is not None:
+            transformation = matrix.getData()
+            data = data @ transformation[:3, :3].T + transformation[:3, 3]
+        return AxisAlignedBox(minimum=data.min(axis=0), maximum=data.max(axis=0))
+
+
+def _fibonacciSphere(count: int) -> numpy.ndarray:
+    index = numpy.arange(count) + 0.5
+    polar = numpy.arccos(1.0 - 2.0 * index / count)
+    azimuth = numpy.pi * (1.0 + 5.0 ** 0.5) * index
+    return numpy.stack(
+        (numpy.cos(azimuth) * numpy.sin(polar), numpy.sin(azimuth) * numpy.sin(polar), numpy.cos(polar)), axis=1
+    )
+
+
+_HULL_DIRECTIONS = numpy.vstack((numpy.identity(3), _fibonacciSphere(125)))
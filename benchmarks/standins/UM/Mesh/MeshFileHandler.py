@@ -0,0 +1,34 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Mesh.MeshFileHandler with a binary STL reader. Like Uranium's STLReader, it turns
+STL's z up into y up and calculates flat normals.
+"""
+
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+
+import numpy
+
+
+class STLReader:
+    def read(self, file_name: str) -> SceneNode:
+        with open(file_name, "rb") as stl_file:
+            data = stl_file.read()
+        count = int.from_bytes(data[80:84], "little")
+        record = numpy.dtype([("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+        vertices = numpy.frombuffer(data, dtype=record, count=count, offset=84)["vertices"].reshape(-1, 3)
+        vertices = numpy.stack([vertices[:, 0], vertices[:, 2], -vertices[:, 1]], axis=1)
+
+        triangles = vertices.reshape(-1, 3, 3)
+        normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        normals /= numpy.maximum(numpy.linalg.norm(normals, axis=1, keepdims=True), 1.0e-12)
+
+        node = SceneNode()
+        node.setMeshData(MeshData(vertices=vertices, normals=numpy.repeat(normals, 3, axis=0), file_name=file_name))
+        return node
+
+
+class MeshFileHandler:
+    def getReaderForFile(self, file_name: str):
+        return STLReader() if file_name.lower().endswith(".stl") else None
@@ -0,0 +1,18 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Message."""
+
+
+class Message:
+    shown = []
+
+    def __init__(self, text: str = "", title: str = "", **kwargs) -> None:
+        self._text = text
+        self._title = title
+
+    def show(self) -> None:
+        Message.shown.append(self)
+
+    def hide(self) -> None:
+        pass
@@ -0,0 +1,26 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Operations.AddSceneNodeOperation."""
+
+from UM.Operations.Operation import Operation
+from UM.Scene.Selection import Selection
+
+
+class AddSceneNodeOperation(Operation):
+    def __init__(self, node, parent) -> None:
+        super().__init__()
+        self._node = node
+        self._parent = parent
+        self._selected = False
+
+    def undo(self) -> None:
+        self._node.setParent(None)
+        self._selected = Selection.isSelected(self._node)
+        if self._selected:
+            Selection.remove(self._node)
+
+    def redo(self) -> None:
+        self._node.setParent(self._parent)
+        if self._selected:
+            Selection.add(self._node)
@@ -0,0 +1,47 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Operations.GroupedOperation, merging included."""
+
+from UM.Operations.Operation import Operation
+
+
+class GroupedOperation(Operation):
+    def __init__(self) -> None:
+        super().__init__()
+        self._children = []
+        self._finalised = False
+
+    def addOperation(self, operation: Operation) -> None:
+        if self._finalised:
+            raise Exception("Attempted to add an operation to a finalised grouped operation")
+        self._children.append(operation)
+
+    def getNumChildrenOperations(self) -> int:
+        return len(self._children)
+
+    def undo(self) -> None:
+        for operation in reversed(self._children):
+            operation.undo()
+        self._finalised = True
+
+    def redo(self) -> None:
+        for operation in self._children:
+            operation.redo()
+        self._finalised = True
+
+    def mergeWith(self, other: Operation):
+        if type(other) is not GroupedOperation:
+            return False
+        if len(other._children) != len(self._children):
+            return False
+        merged = []
+        for index in range(len(self._children)):
+            operation = other._children[index].mergeWith(self._children[index])
+            if not operation:
+                return False
+            merged.append(operation)
+        group = GroupedOperation()
+        for operation in merged:
+            group.addOperation(operation)
+        return group
@@ -0,0 +1,26 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Operations.Operation. Timestamps come from the virtual clock."""
+
+import standin_clock
+
+
+class Operation:
+    def __init__(self) -> None:
+        self._timestamp = standin_clock.now()
+        self._always_merge = False
+
+    def undo(self) -> None:
+        raise NotImplementedError()
+
+    def redo(self) -> None:
+        raise NotImplementedError()
+
+    def mergeWith(self, other: "Operation"):
+        return False
+
+    def push(self) -> None:
+        from UM.Application import Application
+
+        Application.getInstance().getOperationStack().push(self)
@@ -0,0 +1,62 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Operations.OperationStack. Merges the newest operation into the previous one
+within the merge window, like Uranium does.
+"""
+
+from UM.Signal import Signal
+
+
+class OperationStack:
+    def __init__(self) -> None:
+        self._operations = []
+        self._current_index = -1
+        self._merge_window = 1.0
+        self.changed = Signal()
+
+    def push(self, operation) -> None:
+        if self._current_index < len(self._operations) - 1:
+            del self._operations[self._current_index + 1 :]
+        self._operations.append(operation)
+        operation.redo()
+        self._current_index += 1
+        self._doMerge()
+        self.changed.emit()
+
+    def undo(self) -> None:
+        if self._current_index >= 0:
+            self._operations[self._current_index].undo()
+            self._current_index -= 1
+            self.changed.emit()
+
+    def redo(self) -> None:
+        if self._current_index < len(self._operations) - 1:
+            self._current_index += 1
+            self._operations[self._current_index].redo()
+            self.changed.emit()
+
+    def getOperations(self):
+        return self._operations
+
+    def canUndo(self) -> bool:
+        return self._current_index >= 0
+
+    def canRedo(self) -> bool:
+        return self._current_index < len(self._operations) - 1
+
+    def _doMerge(self) -> None:
+        if len(self._operations) < 2:
+            return
+        op1 = self._operations[self._current_index]
+        op2 = self._operations[self._current_index - 1]
+        if not op1._always_merge and not op2._always_merge:
+            if abs(op1._timestamp - op2._timestamp) > self._merge_window:
+                return
+        merged = op1.mergeWith(op2)
+        if not merged:
+            return
+        self._operations.remove(op1)
+        self._operations.remove(op2)
+        self._operations.insert(self._current_index - 1, merged)
+        self._current_index -= 1
@@ -0,0 +1,21 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.PluginRegistry. Plugins are looked up next to the benchmarks directory."""
+
+import os
+
+_REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class PluginRegistry:
+    _instance = None
+
+    @classmethod
+    def getInstance(cls) -> "PluginRegistry":
+        if cls._instance is None:
+            cls._instance = PluginRegistry()
+        return cls._instance
+
+    def getPluginPath(self, plugin_id: str) -> str:
+        return os.path.join(_REPOSITORY_DIR, plugin_id)
@@ -0,0 +1,12 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Resources."""
+
+
+class Resources:
+    Shaders = 1
+
+    @classmethod
+    def getPath(cls, resource_type: int, *args) -> str:
+        return "/".join(args)
@@ -0,0 +1,11 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.Camera."""
+
+from UM.Scene.SceneNode import SceneNode
+
+
+class Camera(SceneNode):
+    def __init__(self, name: str = "3d", parent=None) -> None:
+        super().__init__(parent, name=name)
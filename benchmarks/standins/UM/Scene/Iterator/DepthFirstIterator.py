@@ -0,0 +1,16 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.Iterator.DepthFirstIterator."""
+
+
+class DepthFirstIterator:
+    def __init__(self, scene_node) -> None:
+        self._scene_node = scene_node
+
+    def __iter__(self):
+        stack = [self._scene_node]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.getChildren()))
@@ -0,0 +1,39 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.Scene."""
+
+from UM.Scene.SceneNode import SceneNode
+from UM.Signal import Signal
+
+from collections import deque
+
+
+class Scene:
+    def __init__(self) -> None:
+        self._root = SceneNode(name="Root")
+        self._active_camera = None
+        self.sceneChanged = Signal()
+
+        self._root.transformationChanged.connect(self.sceneChanged)
+        self._root.childrenChanged.connect(self.sceneChanged)
+        self._root.meshDataChanged.connect(self.sceneChanged)
+
+    def getRoot(self) -> SceneNode:
+        return self._root
+
+    def getActiveCamera(self):
+        return self._active_camera
+
+    def setActiveCamera(self, camera) -> None:
+        self._active_camera = camera
+
+    def findObject(self, object_id: int):
+        # Breadth first walk over the whole tree, like Uranium does
+        queue = deque([self._root])
+        while queue:
+            node = queue.popleft()
+            if id(node) == object_id:
+                return node
+            queue.extend(node.getChildren())
+        return None
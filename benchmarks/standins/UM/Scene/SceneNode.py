@@ -0,0 +1,301 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.SceneNode. Transformation changes bubble up to the root like in Uranium,
+where the scene turns them into sceneChanged.
+"""
+
+from UM.Logger import Logger
+from UM.Math.AxisAlignedBox import AxisAlignedBox
+from UM.Math.Matrix import Matrix
+from UM.Math.Quaternion import Quaternion
+from UM.Math.Vector import Vector
+from UM.Signal import Signal
+
+import copy
+import numpy
+
+
+class SceneNode:
+    class TransformSpace:
+        Local = 1
+        Parent = 2
+        World = 3
+
+    def __init__(self, parent=None, visible: bool = True, name: str = "", node_id: str = "") -> None:
+        self._name = name
+        self._id = node_id
+        self._parent = None
+        self._children = []
+        self._decorators = []
+        self._mesh_data = None
+        # Mesh as read from file, kept by CuraSceneNode
+        self.source_mesh_data = None
+        self._settings = {}
+        # Per-object metadata, which project files save and load
+        self.metadata = {}
+        self._visible = visible
+        self._enabled = True
+        self._selectable = False
+        self._calculate_aabb = True
+        self._aabb = None
+
+        self._transformation = Matrix()
+        self._world_transformation = Matrix()
+        self._orientation = Quaternion()
+
+        self.childrenChanged = Signal()
+        self.parentChanged = Signal()
+        self.meshDataChanged = Signal()
+        self.transformationChanged = Signal()
+        self.boundingBoxChanged = Signal()
+        self.decoratorsChanged = Signal()
+
+        if parent:
+            parent.addChild(self)
+
+    def __deepcopy__(self, memo):
+        # Like CuraSceneNode, the copy shares the mesh data and deep copies only the source mesh data
+        copied = self.__class__()
+        copied._name = self._name
+        copied._settings = dict(self._settings)
+        copied.metadata = copy.deepcopy(self.metadata, memo)
+        copied._selectable = self._selectable
+        copied._mesh_data = self._mesh_data
+        copied.source_mesh_data = copy.deepcopy(self.source_mesh_data, memo)
+        copied.setTransformation(self._transformation.copy())
+        for decorator in self._decorators:
+            copied.addDecorator(copy.deepcopy(decorator, memo))
+        for child in self._children:
+            copied.addChild(copy.deepcopy(child, memo))
+        return copied
+
+    def getName(self) -> str:
+        return self._name
+
+    def setName(self, name: str) -> None:
+        self._name = name
+
+    def getMeshData(self):
+        return self._mesh_data
+
+    def setMeshData(self, mesh_data) -> None:
+        self._mesh_data = mesh_data
+        self._resetAABB()
+        self.meshDataChanged.emit(self)
+
+    def getMeshDataTransformed(self):
+        return self._mesh_data.getTransformed(self.getWorldTransformation())
+
+    def getSetting(self, key: str, default_value=None):
+        return self._settings.get(key, default_value)
+
+    def setSetting(self, key: str, value) -> None:
+        self._settings[key] = value
+
+    def render(self, renderer) -> bool:
+        """False to have the view queue the mesh data, nodes drawing something else override this."""
+        return False
+
+    def isVisible(self) -> bool:
+        if self._parent is not None and not self._parent.isVisible():
+            return False
+        return self._visible
+
+    def setVisible(self, visible: bool) -> None:
+        self._visible = visible
+
+    def isEnabled(self) -> bool:
+        return self._enabled
+
+    def setEnabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+
+    def isSelectable(self) -> bool:
+        return self._selectable
+
+    def setSelectable(self, selectable: bool) -> None:
+        self._selectable = selectable
+
+    def setCalculateBoundingBox(self, calculate: bool) -> None:
+        self._calculate_aabb = calculate
+
+    # Hierarchy
+
+    def getParent(self):
+        return self._parent
+
+    def setParent(self, scene_node) -> None:
+        if self._parent:
+            self._parent.removeChild(self)
+        if scene_node:
+            scene_node.addChild(self)
+
+    def getChildren(self):
+        return self._children
+
+    def hasChildren(self) -> bool:
+        return bool(self._children)
+
+    def getAllChildren(self):
+        children = []
+        for child in self._children:
+            children.append(child)
+            children.extend(child.getAllChildren())
+        return children
+
+    def addChild(self, scene_node) -> None:
+        if scene_node in self._children:
+            return
+        if scene_node._parent:
+            scene_node._parent.removeChild(scene_node)
+        scene_node.transformationChanged.connect(self.transformationChanged)
+        scene_node.childrenChanged.connect(self.childrenChanged)
+        scene_node.meshDataChanged.connect(self.meshDataChanged)
+        self._children.append(scene_node)
+        self._resetAABB()
+        self.childrenChanged.emit(self)
+        scene_node._parent = self
+        scene_node._transformChanged()
+        scene_node.parentChanged.emit(self)
+
+    def removeChild(self, scene_node) -> None:
+        if scene_node not in self._children:
+            return
+        scene_node.transformationChanged.disconnect(self.transformationChanged)
+        scene_node.childrenChanged.disconnect(self.childrenChanged)
+        scene_node.meshDataChanged.disconnect(self.meshDataChanged)
+        self._children.remove(scene_node)
+        scene_node._parent = None
+        scene_node._transformChanged()
+        scene_node.parentChanged.emit(None)
+        self._resetAABB()
+        self.childrenChanged.emit(self)
+
+    # Decorators
+
+    def addDecorator(self, decorator) -> None:
+        # Like Uranium, a second decorator of the same type is refused
+        if type(decorator) in [type(existing) for existing in self._decorators]:
+            Logger.log("w", "Unable to add the same decorator type (%s) to a SceneNode twice.", type(decorator))
+            return
+        decorator.setNode(self)
+        self._decorators.append(decorator)
+        self.decoratorsChanged.emit(self)
+
+    def removeDecorator(self, dec_type) -> None:
+        for decorator in self._decorators:
+            if type(decorator) is dec_type:
+                decorator.clear()
+                self._decorators.remove(decorator)
+                self.decoratorsChanged.emit(self)
+                break
+
+    def getDecorator(self, dec_type):
+        for decorator in self._decorators:
+            if type(decorator) is dec_type:
+                return decorator
+        return None
+
+    def getDecorators(self):
+        return self._decorators
+
+    def hasDecoration(self, function: str) -> bool:
+        for decorator in self._decorators:
+            if hasattr(decorator, function):
+                return True
+        return False
+
+    def callDecoration(self, function: str, *args, **kwargs):
+        for decorator in self._decorators:
+            if hasattr(decorator, function):
+                return getattr(decorator, function)(*args, **kwargs)
+        return None
+
+    # Transformations
+
+    def getLocalTransformation(self) -> Matrix:
+        return self._transformation.copy()
+
+    def getWorldTransformation(self, copy: bool = True) -> Matrix:
+        return self._world_transformation.copy() if copy else self._world_transformation
+
+    def setTransformation(self, transformation: Matrix) -> None:
+        self._transformation = transformation.copy()
+        self._transformChanged()
+
+    def getPosition(self) -> Vector:
+        return Vector(data=self._transformation.getData()[:3, 3])
+
+    def getWorldPosition(self) -> Vector:
+        return Vector(data=self._world_transformation.getData()[:3, 3])
+
+    def setPosition(self, position: Vector, transform_space: int = TransformSpace.Local) -> None:
+        if transform_space == SceneNode.TransformSpace.World and self._parent is not None:
+            parent_data = self._parent._world_transformation.getData()
+            position = Vector(data=numpy.linalg.solve(parent_data, numpy.append(position.getData(), 1.0))[:3])
+        data = self._transformation.getData().copy()
+        data[:3, 3] = position.getData()
+        self._transformation = Matrix(data)
+        self._transformChanged()
+
+    def translate(self, translation: Vector, transform_space: int = TransformSpace.Local) -> None:
+        if transform_space == SceneNode.TransformSpace.World:
+            self.setPosition(self.getWorldPosition() + translation, SceneNode.TransformSpace.World)
+        else:
+            self.setPosition(self.getPosition() + translation)
+
+    def getOrientation(self) -> Quaternion:
+        return self._orientation
+
+    def setOrientation(self, orientation, transform_space: int = TransformSpace.Local) -> None:
+        self._orientation = orientation
+        data = self._transformation.getData().copy()
+        data[:3, :3] = orientation.toMatrixData()
+        self._transformation = Matrix(data)
+        self._transformChanged()
+
+    def scale(self, scale: Vector, transform_space: int = TransformSpace.Local) -> None:
+        scale_matrix = Matrix()
+        scale_matrix.setByScaleVector(scale)
+        self._transformation = self._transformation.multiply(scale_matrix, copy=True)
+        self._transformChanged()
+
+    def getBoundingBox(self):
+        if not self._calculate_aabb:
+            return None
+        if self._aabb is None:
+            self._calculateAABB()
+        return self._aabb
+
+    def _calculateAABB(self) -> None:
+        aabb = None
+        if self._mesh_data:
+            aabb = self._mesh_data.getExtents(self.getWorldTransformation(copy=False))
+        for child in self._children:
+            child_aabb = child.getBoundingBox()
+            if child_aabb is not None:
+                aabb = child_aabb if aabb is None else aabb + child_aabb
+        if aabb is None:
+            position = self.getWorldPosition()
+            aabb = AxisAlignedBox(minimum=position, maximum=position)
+        self._aabb = aabb
+
+    def _resetAABB(self) -> None:
+        self._aabb = None
+        if self._parent:
+            self._parent._resetAABB()
+        self.boundingBoxChanged.emit()
+
+    def _transformChanged(self) -> None:
+        self._updateWorldTransformation()
+        for child in self._children:
+            child._transformChanged()
+        self._resetAABB()
+        self.transformationChanged.emit(self)
+
+    def _updateWorldTransformation(self) -> None:
+        if self._parent:
+            self._world_transformation = self._parent._world_transformation.multiply(self._transformation, copy=True)
+        else:
+            self._world_transformation = self._transformation.copy()
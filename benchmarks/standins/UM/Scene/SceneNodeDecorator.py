@@ -0,0 +1,23 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.SceneNodeDecorator."""
+
+import copy
+
+
+class SceneNodeDecorator:
+    def __init__(self, node=None) -> None:
+        self._node = node
+
+    def setNode(self, node) -> None:
+        self._node = node
+
+    def getNode(self):
+        return self._node
+
+    def clear(self) -> None:
+        pass
+
+    def __deepcopy__(self, memo):
+        return copy.copy(self)
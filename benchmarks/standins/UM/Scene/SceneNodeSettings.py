@@ -0,0 +1,8 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.SceneNodeSettings."""
+
+
+class SceneNodeSettings:
+    AutoDropDown = "auto_drop_down"
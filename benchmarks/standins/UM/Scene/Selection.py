@@ -0,0 +1,67 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Scene.Selection. Like Uranium, every transformation change of a selected node
+emits selectionCenterChanged.
+"""
+
+from UM.Signal import Signal
+
+
+class Selection:
+    _selection = []
+
+    selectionChanged = Signal()
+    selectionCenterChanged = Signal()
+
+    @classmethod
+    def add(cls, node) -> None:
+        if node in cls._selection:
+            return
+        cls._selection.append(node)
+        node.transformationChanged.connect(cls._onTransformationChanged)
+        cls._onTransformationChanged(node)
+        cls.selectionChanged.emit()
+
+    @classmethod
+    def remove(cls, node) -> None:
+        if node not in cls._selection:
+            return
+        cls._selection.remove(node)
+        node.transformationChanged.disconnect(cls._onTransformationChanged)
+        cls._onTransformationChanged(node)
+        cls.selectionChanged.emit()
+
+    @classmethod
+    def clear(cls) -> None:
+        for node in cls._selection:
+            node.transformationChanged.disconnect(cls._onTransformationChanged)
+        cls._selection = []
+        cls.selectionChanged.emit()
+
+    @classmethod
+    def getCount(cls) -> int:
+        return len(cls._selection)
+
+    @classmethod
+    def hasSelection(cls) -> bool:
+        return bool(cls._selection)
+
+    @classmethod
+    def isSelected(cls, node) -> bool:
+        return node in cls._selection
+
+    @classmethod
+    def getSelectedObject(cls, index: int):
+        try:
+            return cls._selection[index]
+        except IndexError:
+            return None
+
+    @classmethod
+    def getAllSelectedObjects(cls):
+        return list(cls._selection)
+
+    @classmethod
+    def _onTransformationChanged(cls, node) -> None:
+        cls.selectionCenterChanged.emit()
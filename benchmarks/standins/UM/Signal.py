@@ -0,0 +1,65 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Signal. Direct, synchronous emits, plus postponing like Uranium's."""
+
+import contextlib
+import enum
+
+
+class CompressTechnique(enum.Enum):
+    NoCompression = 0
+    CompressSingle = 1
+    CompressPerParameterValue = 2
+
+
+class Signal:
+    def __init__(self, *args, **kwargs) -> None:
+        self._slots = []
+        self._postponed = None
+        self._compress = CompressTechnique.NoCompression
+
+    def connect(self, slot) -> None:
+        if slot not in self._slots:
+            self._slots.append(slot)
+
+    def disconnect(self, slot) -> None:
+        if slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args, **kwargs) -> None:
+        if self._postponed is not None:
+            if self._compress == CompressTechnique.CompressSingle:
+                self._postponed[:] = [(args, kwargs)]
+            elif self._compress == CompressTechnique.CompressPerParameterValue:
+                if (args, kwargs) not in self._postponed:
+                    self._postponed.append((args, kwargs))
+            else:
+                self._postponed.append((args, kwargs))
+            return
+        for slot in list(self._slots):
+            slot(*args, **kwargs)
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.emit(*args, **kwargs)
+
+    def _postpone(self, compress: CompressTechnique) -> None:
+        self._postponed = []
+        self._compress = compress
+
+    def _resume(self) -> None:
+        postponed = self._postponed
+        self._postponed = None
+        for args, kwargs in postponed:
+            self.emit(*args, **kwargs)
+
+
+@contextlib.contextmanager
+def postponeSignals(*signals, compress: CompressTechnique = CompressTechnique.NoCompression):
+    for signal in signals:
+        signal._postpone(compress)
+    try:
+        yield
+    finally:
+        for signal in signals:
+            signal._resume()
@@ -0,0 +1,30 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Tool."""
+
+from UM.Application import Application
+from UM.Signal import Signal
+
+
+class Tool:
+    def __init__(self) -> None:
+        self._controller = Application.getInstance().getController()
+        self._shortcut_key = None
+        self._exposed_properties = []
+        self.propertyChanged = Signal()
+
+    def getController(self):
+        return self._controller
+
+    def getShortcutKey(self):
+        return self._shortcut_key
+
+    def setExposedProperties(self, *args) -> None:
+        self._exposed_properties = list(args)
+
+    def getExposedProperties(self):
+        return self._exposed_properties
+
+    def event(self, event) -> bool:
+        return False
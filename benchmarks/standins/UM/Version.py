@@ -0,0 +1,27 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.Version. Compares major, minor and revision."""
+
+import functools
+
+
+@functools.total_ordering
+class Version:
+    def __init__(self, version) -> None:
+        parts = [int(part) for part in str(version).split("-")[0].split(".") if part.isdigit()]
+        self._parts = tuple((parts + [0, 0, 0])[:3])
+
+    def __eq__(self, other) -> bool:
+        other = other if isinstance(other, Version) else Version(other)
+        return self._parts == other._parts
+
+    def __lt__(self, other) -> bool:
+        other = other if isinstance(other, Version) else Version(other)
+        return self._parts < other._parts
+
+    def __hash__(self) -> int:
+        return hash(self._parts)
+
+    def __str__(self) -> str:
+        return ".".join(str(part) for part in self._parts)
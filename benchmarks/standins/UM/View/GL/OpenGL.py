@@ -0,0 +1,65 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.View.GL.OpenGL. Buffers are cached on the mesh data like Uranium does, and every
+upload is counted."""
+
+
+class ShaderProgram:
+    def __init__(self) -> None:
+        self._uniforms = {}
+
+    def setUniformValue(self, name: str, value) -> None:
+        self._uniforms[name] = value
+
+
+class Buffer:
+    """What the GPU would hold for one array of a mesh."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+
+class OpenGL:
+    VertexBufferProperty = "__gl_vertex_buffer"
+    IndexBufferProperty = "__gl_index_buffer"
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls) -> "OpenGL":
+        if cls._instance is None:
+            cls._instance = OpenGL()
+        return cls._instance
+
+    def __init__(self) -> None:
+        self.upload_count = 0
+        self.uploaded_bytes = 0
+
+    def resetCounters(self) -> None:
+        self.upload_count = 0
+        self.uploaded_bytes = 0
+
+    def createShaderProgram(self, path: str) -> ShaderProgram:
+        return ShaderProgram()
+
+    def createVertexBuffer(self, mesh, **kwargs) -> Buffer:
+        """Vertices, normals, colors and UVs of mesh in one buffer, uploaded once per mesh."""
+        if not kwargs.get("force_recreate", False) and hasattr(mesh, OpenGL.VertexBufferProperty):
+            return getattr(mesh, OpenGL.VertexBufferProperty)
+        arrays = (mesh.getVertices(), mesh.getNormals(), mesh.getColors(), mesh.getUVCoordinates())
+        buffer = self._upload(sum(array.nbytes for array in arrays if array is not None))
+        setattr(mesh, OpenGL.VertexBufferProperty, buffer)
+        return buffer
+
+    def createIndexBuffer(self, mesh, **kwargs) -> Buffer:
+        if not kwargs.get("force_recreate", False) and hasattr(mesh, OpenGL.IndexBufferProperty):
+            return getattr(mesh, OpenGL.IndexBufferProperty)
+        buffer = self._upload(mesh.getIndices().nbytes)
+        setattr(mesh, OpenGL.IndexBufferProperty, buffer)
+        return buffer
+
+    def _upload(self, size: int) -> Buffer:
+        self.upload_count += 1
+        self.uploaded_bytes += size
+        return Buffer(size)
@@ -0,0 +1,15 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.View.RenderBatch."""
+
+from enum import IntEnum
+
+
+class RenderBatch:
+    class RenderMode(IntEnum):
+        Points = 0x0000
+        Lines = 0x0001
+        LineLoop = 0x0002
+        LineStrip = 0x0003
+        Triangles = 0x0004
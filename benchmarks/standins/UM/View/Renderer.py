@@ -0,0 +1,43 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for UM.View.Renderer. Collects what nodes queue for a frame, and can render whole frames
+of a scene down to fetching the buffers of every mesh drawn."""
+
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
+from UM.View.GL.OpenGL import OpenGL
+
+
+class Renderer:
+    def __init__(self) -> None:
+        self._queue = []
+
+    def beginRendering(self) -> None:
+        self._queue = []
+
+    def queueNode(self, node, **kwargs) -> None:
+        self._queue.append((node, kwargs))
+
+    def getQueue(self):
+        return self._queue
+
+    def renderFrame(self, root) -> None:
+        """Queue the scene like Cura's solid view does, draw the queue, then draw every selectable mesh
+        again for picking and the selection outline like Uranium's selection pass does.
+        """
+        self.beginRendering()
+        for node in DepthFirstIterator(root):
+            if not node.render(self) and node.getMeshData() is not None and node.isVisible():
+                self.queueNode(node)
+        for node, kwargs in self._queue:
+            self._draw(kwargs.get("mesh", node.getMeshData()))
+        for node in DepthFirstIterator(root):
+            if node.isSelectable() and node.getMeshData() is not None:
+                self._draw(node.getMeshData())
+
+    def _draw(self, mesh) -> None:
+        if mesh is None:
+            return
+        OpenGL.getInstance().createVertexBuffer(mesh)
+        if mesh.hasIndices():
+            OpenGL.getInstance().createIndexBuffer(mesh)
@@ -0,0 +1,36 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for cura.BuildVolume. A plate of the given size centered at the origin, like Cura puts
+it in the scene.
+"""
+
+from typing import List, Optional
+from UM.Math.AxisAlignedBox import AxisAlignedBox
+from UM.Math.Polygon import Polygon
+from UM.Math.Vector import Vector
+from UM.Signal import Signal
+
+
+class BuildVolume:
+    def __init__(
+        self, width: float = 220.0, depth: float = 220.0, height: float = 250.0, edge_disallowed_size: float = 1.0
+    ) -> None:
+        self._bounding_box = AxisAlignedBox(
+            Vector(-width / 2.0, -0.5, -depth / 2.0), Vector(width / 2.0, height, depth / 2.0)
+        )
+        self._edge_disallowed_size = edge_disallowed_size
+        self._disallowed_areas = []  # type: List[Polygon]
+        self.raftThicknessChanged = Signal()
+
+    def getBoundingBox(self) -> Optional[AxisAlignedBox]:
+        return self._bounding_box
+
+    def getEdgeDisallowedSize(self) -> float:
+        return self._edge_disallowed_size
+
+    def getDisallowedAreas(self) -> List[Polygon]:
+        return self._disallowed_areas
+
+    def setDisallowedAreas(self, areas: List[Polygon]) -> None:
+        self._disallowed_areas = areas
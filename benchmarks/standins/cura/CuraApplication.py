@@ -0,0 +1,26 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for cura.CuraApplication."""
+
+from UM.Application import Application
+from UM.Signal import Signal
+
+
+class CuraApplication(Application):
+    def __init__(self, version: str = "5.7.0") -> None:
+        super().__init__(version)
+        # Emitted with the file name after loading a model file or project
+        self.fileCompleted = Signal()
+        self.workspaceLoaded = Signal()
+        self._build_volume = None
+
+    def getBuildVolume(self):
+        return self._build_volume
+
+    def setBuildVolume(self, build_volume) -> None:
+        """Only the stand-in can go without a build volume, which is the default."""
+        self._build_volume = build_volume
+
+    def getGlobalContainerStack(self):
+        return None
@@ -0,0 +1,111 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for cura.Scene.ConvexHullDecorator. Like Cura, the hull is recomputed from the mesh a
+while after the bounding box of the node changes or a tool operation starts or stops, and the result
+is cached against the world transformation. Like Cura, the decorator has no clear(), so it stays
+connected after being removed from its node. The hull shadow Cura adds to the scene is only kept on
+the decorator here.
+"""
+
+from cura.CuraApplication import CuraApplication
+from PyQt6.QtCore import QTimer
+from UM.Math.Polygon import Polygon
+from UM.Scene.SceneNodeDecorator import SceneNodeDecorator
+
+import numpy
+
+
+class ConvexHullDecorator(SceneNodeDecorator):
+    # Statistics for the harness
+    compute_count = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._convex_hull_node = None
+        self._2d_convex_hull_mesh = None
+        self._2d_convex_hull_mesh_world_transform = None
+        self._2d_convex_hull_mesh_result = None
+
+        self._recompute_convex_hull_timer = QTimer()
+        self._recompute_convex_hull_timer.setInterval(200)
+        self._recompute_convex_hull_timer.setSingleShot(True)
+        self._recompute_convex_hull_timer.timeout.connect(self.recomputeConvexHull)
+
+        application = CuraApplication.getInstance()
+        self._build_volume = application.getBuildVolume()
+        if self._build_volume is not None:
+            self._build_volume.raftThicknessChanged.connect(self._onChanged)
+        controller = application.getController()
+        controller.toolOperationStarted.connect(self._onChanged)
+        controller.toolOperationStopped.connect(self._onChanged)
+        self._root = controller.getScene().getRoot()
+
+    def setNode(self, node) -> None:
+        previous_node = self._node
+        if previous_node is not None and node is not previous_node:
+            previous_node.boundingBoxChanged.disconnect(self._onChanged)
+        super().setNode(node)
+        node.boundingBoxChanged.connect(self._onChanged)
+        self._onChanged()
+
+    def __deepcopy__(self, memo):
+        return ConvexHullDecorator()
+
+    def getConvexHull(self):
+        if self._node is None:
+            return None
+        if self._node.callDecoration("isNonPrintingMesh"):
+            return None
+        return self._compute2DConvexHull()
+
+    def recomputeConvexHullDelayed(self) -> None:
+        self._recompute_convex_hull_timer.start()
+
+    def recomputeConvexHull(self) -> None:
+        """Rebuild the hull shadow, or drop it if the node has left the scene."""
+        if self._node is None or not self._isDescendant(self._root, self._node):
+            self._convex_hull_node = None
+            return
+        self._convex_hull_node = self.getConvexHull()
+
+    def _onChanged(self, *args) -> None:
+        self.recomputeConvexHullDelayed()
+
+    def _isDescendant(self, root, node) -> bool:
+        while node is not None:
+            if node is root:
+                return True
+            node = node.getParent()
+        return False
+
+    def _compute2DConvexHull(self):
+        node = self._node
+        if node is None:
+            return None
+        if node.callDecoration("isGroup"):
+            points = numpy.zeros((0, 2))
+            for child in node.getChildren():
+                child_hull = child.callDecoration("_compute2DConvexHull")
+                if child_hull is not None:
+                    points = numpy.vstack((points, child_hull.getPoints()))
+            return Polygon(points).getConvexHull() if len(points) else None
+
+        mesh = node.getMeshData()
+        if mesh is None:
+            return None
+        world_transform = node.getWorldTransformation(copy=False)
+        if mesh is self._2d_convex_hull_mesh and world_transform == self._2d_convex_hull_mesh_world_transform:
+            return self._2d_convex_hull_mesh_result
+
+        ConvexHullDecorator.compute_count += 1
+        data = world_transform.getData()
+        vertices = mesh.getVertices() @ data[:3, :3].T + data[:3, 3]
+        # Round to 0.1 mm and drop duplicates, like Cura does before hulling
+        points = numpy.round(vertices[:, [0, 2]], 1)
+        hull = Polygon(points).getConvexHull()
+
+        self._2d_convex_hull_mesh = mesh
+        self._2d_convex_hull_mesh_world_transform = world_transform.copy()
+        self._2d_convex_hull_mesh_result = hull
+        return hull
@@ -0,0 +1,18 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Stand-in for cura.Scene.ZOffsetDecorator."""
+
+from UM.Scene.SceneNodeDecorator import SceneNodeDecorator
+
+
+class ZOffsetDecorator(SceneNodeDecorator):
+    def __init__(self) -> None:
+        super().__init__()
+        self._z_offset = 0.0
+
+    def setZOffset(self, offset: float) -> None:
+        self._z_offset = offset
+
+    def getZOffset(self) -> float:
+        return self._z_offset
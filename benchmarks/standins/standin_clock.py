@@ -0,0 +1,22 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Virtual clock shared by the stand-ins. Timers and operation timestamps follow it, so replays are
+deterministic no matter how fast the machine is.
+"""
+
+_now = 0.0  # seconds
+
+
+def now() -> float:
+    return _now
+
+
+def advance(seconds: float) -> None:
+    global _now
+    _now += seconds
+
+
+def reset() -> None:
+    global _now
+    _now = 0.0
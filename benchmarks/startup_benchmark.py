@@ -0,0 +1,115 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""What the plugin adds to Cura startup: importing the plugin package, registering the tool and
+handling engine creation, each in a fresh interpreter with the stand-ins already imported like Cura
+would have its own modules. Also times the first activation of the tool on a selected model, where
+lazily loaded resources end up.
+
+Compare against an older version with a checkout of it:
+
+    python benchmarks/startup_benchmark.py
+    git worktree add /tmp/before <commit>
+    python benchmarks/startup_benchmark.py --plugin-dir /tmp/before/BananaSplit
+"""
+
+from bootstrap import BENCHMARKS_DIR, PLUGIN_DIR, report
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+PHASES = ("import", "register", "engine created", "startup total", "first activation")
+
+
+def child(plugin_dir: str) -> None:
+    sys.path.insert(0, os.path.dirname(plugin_dir))
+
+    # Cura has all of these loaded before plugins
+    import numpy
+
+    for module_name in ("collections", "copy", "json", "math", "struct", "threading", "uuid", "weakref"):
+        __import__(module_name)
+
+    standins_dir = os.path.join(BENCHMARKS_DIR, "standins")
+    for directory, _, file_names in os.walk(standins_dir):
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py") and file_name != "__init__.py":
+                path = os.path.join(os.path.relpath(directory, standins_dir), file_name[:-3])
+                __import__(os.path.normpath(path).replace(os.sep, "."))
+
+    from cura.CuraApplication import CuraApplication
+    from cura.Scene.ConvexHullDecorator import ConvexHullDecorator
+    from UM.Event import Event
+    from UM.Mesh.MeshData import MeshData
+    from UM.Scene.SceneNode import SceneNode
+    from UM.Scene.Selection import Selection
+
+    application = CuraApplication()
+    timings = {}
+
+    begin = time.perf_counter()
+    plugin = __import__(os.path.basename(plugin_dir))
+    plugin.getMetaData()
+    timings["import"] = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    tool = plugin.register(application)["tool"]
+    timings["register"] = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    application.engineCreatedSignal.emit()
+    application.processEvents()
+    timings["engine created"] = time.perf_counter() - begin
+    timings["startup total"] = timings["import"] + timings["register"] + timings["engine created"]
+
+    node = SceneNode()
+    node.setSelectable(True)
+    node.setMeshData(MeshData(vertices=numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 1.0]])))
+    node.addDecorator(ConvexHullDecorator())
+    node.setParent(application.getController().getScene().getRoot())
+    Selection.add(node)
+    # Cura has the bounding box long before the tool gets activated
+    node.getBoundingBox()
+
+    begin = time.perf_counter()
+    application.getController().setActiveTool(tool)
+    tool.event(Event(Event.ToolActivateEvent))
+    application.processEvents()
+    timings["first activation"] = time.perf_counter() - begin
+
+    print(json.dumps({phase: seconds * 1.0e6 for phase, seconds in timings.items()}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plugin-dir", default=PLUGIN_DIR)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+    plugin_dir = os.path.abspath(arguments.plugin_dir)
+
+    if arguments.child:
+        child(plugin_dir)
+        return
+
+    results = []
+    for _ in range(arguments.runs):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", "--plugin-dir", plugin_dir],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output.splitlines()[-1]))
+
+    print("{}, {} fresh interpreters:".format(plugin_dir, arguments.runs))
+    for phase in PHASES:
+        report("  " + phase, [result[phase] for result in results])
+
+
+if __name__ == "__main__":
+    main()
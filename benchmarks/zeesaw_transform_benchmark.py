@@ -0,0 +1,78 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Zeesaw transformation math: the old Matrix multiply chain vs. the closed form in ZeesawTransform,
+and numpy.allclose comparisons vs. transformation keys.
+
+    python benchmarks/zeesaw_transform_benchmark.py
+"""
+
+from bootstrap import loadPluginModule, measure, report
+
+import math
+import numpy
+
+ZeesawTransform = loadPluginModule("ZeesawTransform")
+
+ROTATION_180_Z = numpy.diag([-1.0, -1.0, 1.0, 1.0])
+
+
+def randomWorldTransformation(rng: numpy.random.Generator) -> numpy.ndarray:
+    angle = rng.uniform(0, 2 * math.pi)
+    c, s = math.cos(angle), math.sin(angle)
+    world = numpy.identity(4)
+    # Rotation about the vertical axis, some scaling and a translation
+    world[:3, :3] = numpy.array([[c, 0, s], [0, 1, 0], [-s, 0, c]]) * rng.uniform(0.5, 2.0)
+    world[:3, 3] = rng.uniform(-100, 100, 3)
+    return world
+
+
+def chainedTransformation(selected_world: numpy.ndarray, linked_position: numpy.ndarray) -> numpy.ndarray:
+    """What updateZeesaw used to do, Matrix.multiply for Matrix.multiply."""
+    transformation = selected_world.copy()
+    transformation = transformation.dot(numpy.linalg.inv(selected_world))
+    transformation = transformation.dot(ROTATION_180_Z)
+    transformation = transformation.dot(selected_world)
+    rotated = transformation
+
+    target_position = numpy.array([linked_position[0], -selected_world[1, 3], linked_position[2]])
+    translation_matrix = numpy.identity(4)
+    translation_matrix[:3, 3] = target_position - rotated[:3, 3]
+    transformation = rotated.copy()
+    transformation = transformation.dot(numpy.linalg.inv(rotated))
+    transformation = transformation.dot(translation_matrix)
+    transformation = transformation.dot(rotated)
+    return transformation
+
+
+def main() -> None:
+    rng = numpy.random.default_rng(1)
+    selected_world = randomWorldTransformation(rng)
+    linked_position = rng.uniform(-100, 100, 3)
+
+    chained = chainedTransformation(selected_world, linked_position)
+    closed = ZeesawTransform.zeesawTransformation(selected_world, linked_position)
+    print("max difference between old and new: {:.3e}".format(numpy.abs(chained - closed).max()))
+    assert numpy.allclose(chained, closed, atol=1.0e-5)
+
+    report("chained multiply", measure(lambda: chainedTransformation(selected_world, linked_position), 20000))
+    report(
+        "closed form", measure(lambda: ZeesawTransform.zeesawTransformation(selected_world, linked_position), 20000)
+    )
+
+    stacked_world = numpy.stack([randomWorldTransformation(rng) for _ in range(100)])
+    stacked_position = rng.uniform(-100, 100, (100, 3))
+    report(
+        "closed form, 100 stacked",
+        measure(lambda: ZeesawTransform.zeesawTransformation(stacked_world, stacked_position), 5000),
+    )
+
+    other = closed + 1.0e-7
+    key = ZeesawTransform.transformationKey(closed)
+    assert ZeesawTransform.transformationKey(other) == key
+    report("numpy.allclose", measure(lambda: numpy.allclose(closed, other, rtol=1.0e-5, atol=1.0e-5), 20000))
+    report("transformationKey ==", measure(lambda: ZeesawTransform.transformationKey(other) == key, 20000))
+
+
+if __name__ == "__main__":
+    main()
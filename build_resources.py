@@ -0,0 +1,36 @@
+# Copyright (c) 2023 jarrrgh.
+# This tool is released under the terms of the AGPLv3 or higher.
+
+"""Precomputes plugin resources that would be slow to make while Cura starts. Run it in the project
+root after changing the sources, and commit the results:
+
+    python build_resources.py
+
+resources/link.npy is the link indicator mesh: the triangles of link.stl scaled to size and turned y
+up like Cura's STL reader does, as float32 vertices, three per triangle.
+"""
+
+import numpy
+import os
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BananaSplit", "resources")
+LINK_SCALE = 0.3
+
+
+def readStl(path: str) -> numpy.ndarray:
+    """Vertices of a binary STL file, three per triangle, in Cura's coordinates."""
+    with open(path, "rb") as stl_file:
+        data = stl_file.read()
+    count = int.from_bytes(data[80:84], "little")
+    record = numpy.dtype([("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+    vertices = numpy.frombuffer(data, dtype=record, count=count, offset=84)["vertices"].reshape(-1, 3)
+    return numpy.stack([vertices[:, 0], vertices[:, 2], -vertices[:, 1]], axis=1)
+
+
+def main() -> None:
+    vertices = readStl(os.path.join(RESOURCES_DIR, "link.stl")) * LINK_SCALE
+    numpy.save(os.path.join(RESOURCES_DIR, "link.npy"), vertices.astype(numpy.float32))
+
+
+if __name__ == "__main__":
+    main()